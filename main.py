@@ -1,6 +1,7 @@
 import uvicorn
 import os
 import argparse
+import importlib.util
 from pathlib import Path
 import logging
 
@@ -26,21 +27,22 @@ def create_directories():
 
 def setup_environment():
     """Set up environment variables and check for dependencies."""
-    # Check if ChromaDB is available
-    try:
-        import chromadb
-        logger.info("ChromaDB is available.")
-    except ImportError:
-        logger.error("ChromaDB is not installed. Please install it using 'pip install chromadb'.")
-        exit(1)
+    # Only look the packages up; importing them here would load them a second
+    # time in the server process and slow every (re)start
+    required = {}
+    if os.environ.get("HIRE3X_VECTOR_BACKEND", "chroma").lower() == "chroma":
+        required["chromadb"] = "chromadb"
+    if os.environ.get("HIRE3X_EMBEDDING_BACKEND", "torch").lower() == "onnx":
+        required["onnxruntime"] = "onnxruntime"
+        required["tokenizers"] = "tokenizers"
+    else:
+        required["sentence_transformers"] = "sentence-transformers"
     
-    # Check if SentenceTransformers is available
-    try:
-        import sentence_transformers
-        logger.info("SentenceTransformers is available.")
-    except ImportError:
-        logger.error("SentenceTransformers is not installed. Please install it using 'pip install sentence-transformers'.")
-        exit(1)
+    for module, package in required.items():
+        if importlib.util.find_spec(module) is None:
+            logger.error(f"{module} is not installed. Please install it using 'pip install {package}'.")
+            exit(1)
+        logger.info(f"{module} is available.")
     
     # Check if frontend files exist
     frontend_path = Path("frontend/index.html")
@@ -56,6 +58,9 @@ def main():
     parser.add_argument("--host", type=str, default="0.0.0.0", help="Host to run the server on")
     parser.add_argument("--port", type=int, default=8000, help="Port to run the server on")
     parser.add_argument("--reload", action="store_true", help="Enable auto-reload for development")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of worker processes (above 1 requires HIRE3X_VECTOR_BACKEND=numpy); "
+                             "workers are forked after preloading the model and vectors so they share that memory")
     parser.add_argument("--log-level", type=str, default="info", choices=["debug", "info", "warning", "error", "critical"], 
                         help="Set the logging level")
     args = parser.parse_args()
@@ -73,6 +78,25 @@ def main():
     # Log startup information
     logger.info(f"Server starting on http://{args.host}:{args.port}")
     
+    if args.workers > 1:
+        if args.reload:
+            logger.error("--reload cannot be combined with --workers")
+            exit(1)
+        # Every worker would open its own ChromaDB client over the same directory,
+        # each with its own in-memory index, so their results would diverge
+        if os.environ.get("HIRE3X_VECTOR_BACKEND", "chroma").lower() != "numpy":
+            logger.error("--workers > 1 requires HIRE3X_VECTOR_BACKEND=numpy")
+            exit(1)
+        from src.api.prefork import PreforkServer
+        PreforkServer(
+            "src.api.enhanced_app:app",
+            host=args.host,
+            port=args.port,
+            workers=args.workers,
+            log_level=args.log_level.lower()
+        ).run()
+        return
+    
     # Run the FastAPI app
     uvicorn.run(
         "src.api.enhanced_app:app",
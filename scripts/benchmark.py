@@ -0,0 +1,317 @@
+import os
+import sys
+import json
+import time
+import shutil
+import platform
+import argparse
+import resource
+import tempfile
+import subprocess
+import multiprocessing
+from datetime import datetime, timezone
+from pathlib import Path
+import numpy as np
+import logging
+
+# Add the project root to the Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from src.data_processing.hire3x_models import JobDescription
+from src.ingest.stream import JsonRecordReader, read_chunks, ingest_records
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger("hire3x.benchmark")
+
+DEFAULT_SIZES = "1000,10000,100000,1000000"
+
+# Generated dates are relative to a fixed day so pools are identical across runs
+REFERENCE_DATE = "2025-01-01"
+
+
+def generate_corpus(path, kind, count, seed, workers, regenerate=False):
+    """
+    Generate a seeded NDJSON corpus with scripts/generate_realistic_data.py unless it already exists.
+
+    Args:
+        path: NDJSON file to write
+        kind: "candidates" or "jobs"
+        count: Number of records
+        seed: Random seed
+        workers: Generator worker processes
+        regenerate: Overwrite an existing file
+    """
+    import generate_realistic_data as data_generator
+
+    if os.path.exists(path) and not regenerate:
+        logger.info(f"Using generated {kind} {path}")
+        return
+    started = time.perf_counter()
+    data_generator.write_records(path, kind, count, seed, workers=workers, reference_date=REFERENCE_DATE)
+    logger.info(f"Generated {count} {kind} in {time.perf_counter() - started:.1f}s")
+
+
+def load_jobs(path):
+    """Read generated job descriptions."""
+    with open(path) as f:
+        return [JobDescription(**json.loads(line)) for line in f if line.strip()]
+
+
+def percentiles(samples):
+    """Latency summary in milliseconds."""
+    return {
+        "p50": float(np.percentile(samples, 50)),
+        "p95": float(np.percentile(samples, 95)),
+        "p99": float(np.percentile(samples, 99)),
+        "mean": float(np.mean(samples))
+    }
+
+
+def timed_runs(fn, repeats):
+    """Call fn once to warm up, then time it repeats times; returns milliseconds."""
+    fn()
+    samples = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - started) * 1000.0)
+    return samples
+
+
+def peak_rss_mb():
+    """High-water mark of this process's resident memory."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def exact_top_k(backend, queries, top_k, chunk_size=10000):
+    """
+    Brute-force cosine top-k over every stored vector.
+
+    Args:
+        backend: Vector backend holding the candidate vectors
+        queries: Normalized query vectors, one row per query
+        top_k: Number of results per query
+
+    Returns:
+        List of sets of candidate IDs, one per query
+    """
+    all_ids = backend.get(include_documents=False)["ids"]
+    best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+    best_ids = np.empty((len(queries), 0), dtype=object)
+    for start in range(0, len(all_ids), chunk_size):
+        part = backend.get(ids=all_ids[start:start + chunk_size], include_embeddings=True, include_documents=False)
+        vectors = np.asarray(part["embeddings"], dtype=np.float32)
+        vectors /= np.clip(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12, None)
+        scores = np.concatenate([best_scores, queries @ vectors.T], axis=1)
+        ids = np.concatenate([best_ids, np.tile(np.array(part["ids"], dtype=object), (len(queries), 1))], axis=1)
+        keep = np.argsort(-scores, axis=1)[:, :top_k]
+        best_scores = np.take_along_axis(scores, keep, axis=1)
+        best_ids = np.take_along_axis(ids, keep, axis=1)
+    return [set(row) for row in best_ids]
+
+
+def run_pool(config):
+    """
+    Ingest one pool into a fresh database and measure it. Runs in its own process.
+
+    Args:
+        config: Pool size, paths and benchmark options
+
+    Returns:
+        Dictionary of measurements
+    """
+    from src.embeddings.generator import EmbeddingGenerator
+    from src.database.vector_db import VectorDatabase
+    from src.matching.hire3x_matcher import Hire3xCandidateMatcher
+    from src.matching.result_cache import MatchResultCache
+    from src.matching.scoring import CandidateScoringEngine
+    from src.matching.query_plan import JobQueryPlan
+
+    for name in ("hire3x.embeddings", "hire3x.vector_db", "hire3x.matcher", "hire3x.profile_store"):
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    top_k = config["top_k"]
+    db_dir = tempfile.mkdtemp(prefix=f"pool-{config['size']}-", dir=config["workdir"])
+    try:
+        # No embedding cache, so ingest measures encoding and repeated runs don't get faster
+        generator = EmbeddingGenerator(model_name=config["model"], embedding_cache_dir=None)
+        vector_db = VectorDatabase(
+            persist_directory=os.path.join(db_dir, "vectors"),
+            embedding_generator=generator,
+            backend=config["backend"],
+            multi_vector=config["multi_vector"]
+        )
+        # Disable the result cache so every call does the full search and scoring
+        matcher = Hire3xCandidateMatcher(vector_db, result_cache=MatchResultCache(max_entries=0))
+
+        # Ingest
+        added = failed = 0
+        started = time.perf_counter()
+        with open(config["pool_path"], "rb") as f:
+            for chunk in read_chunks(JsonRecordReader(f), config["chunk_size"]):
+                progress = ingest_records(vector_db, chunk)
+                added += progress["added"]
+                failed += progress["failed"]
+        ingest_seconds = time.perf_counter() - started
+        logger.info(f"Ingested {added} candidates in {ingest_seconds:.1f}s ({failed} failed)")
+        rss_after_ingest = peak_rss_mb()
+
+        jobs = load_jobs(config["jobs_path"])
+        search_samples = []
+        scoring_samples = []
+        match_samples = []
+        for job in jobs:
+            search_samples.extend(timed_runs(lambda: vector_db.search_candidates(job, top_k=top_k), config["repeats"]))
+            # Score the same hits match_candidates would, timing only the scoring engine
+            plan = JobQueryPlan.for_job(job)
+            hits = vector_db.search_candidates(
+                job=job,
+                top_k=top_k * 3,
+                skills=plan.required_skills_canonical,
+                min_skill_matches=len(plan.required_skills_canonical)
+            )
+            engine = CandidateScoringEngine(plan, skill_index=vector_db.skill_index)
+            scoring_samples.extend(timed_runs(lambda: engine.rank(hits, top_k=top_k), config["repeats"]))
+            match_samples.extend(timed_runs(lambda: matcher.match_candidates(job, top_k=top_k), config["repeats"]))
+
+        # Recall of the plain vector search against an exact scan of the stored vectors
+        recall = None
+        if not config["multi_vector"]:
+            queries = np.stack([generator.generate_job_embedding(job) for job in jobs]).astype(np.float32)
+            queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+            truth = exact_top_k(vector_db.backend, queries, top_k)
+            recalls = []
+            for job, expected in zip(jobs, truth):
+                found = {result["id"] for result in vector_db.search_candidates(job, top_k=top_k)}
+                recalls.append(len(expected & found) / max(len(expected), 1))
+            recall = float(np.mean(recalls))
+
+        return {
+            "pool_size": config["size"],
+            "ingest": {
+                "added": added,
+                "failed": failed,
+                "seconds": ingest_seconds,
+                "docs_per_sec": added / ingest_seconds if ingest_seconds else None
+            },
+            "search_candidates_ms": percentiles(search_samples),
+            "scoring_ms": percentiles(scoring_samples),
+            "match_candidates_ms": percentiles(match_samples),
+            f"recall@{top_k}": recall,
+            "memory": {
+                "peak_rss_mb_after_ingest": rss_after_ingest,
+                "peak_rss_mb": peak_rss_mb()
+            }
+        }
+    finally:
+        if not config["keep_databases"]:
+            shutil.rmtree(db_dir, ignore_errors=True)
+
+
+def git_revision():
+    """Current commit, marked dirty if the working tree has changes."""
+    try:
+        commit = subprocess.check_output(["git", "rev-parse", "HEAD"], cwd=root_dir, text=True).strip()
+        dirty = subprocess.run(["git", "diff", "--quiet", "HEAD"], cwd=root_dir).returncode != 0
+        return {"commit": commit, "dirty": dirty}
+    except (OSError, subprocess.CalledProcessError):
+        return {"commit": None, "dirty": None}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark ingest, search, scoring, memory and recall on generated pools")
+    parser.add_argument("--sizes", type=str, default=DEFAULT_SIZES, help="Comma-separated pool sizes")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the generated pools and jobs")
+    parser.add_argument("--jobs", type=int, default=20, help="Number of generated job descriptions to query with")
+    parser.add_argument("--generator-workers", type=int, default=os.cpu_count() or 1,
+                        help="Processes generating the pools")
+    parser.add_argument("--regenerate", action="store_true", help="Regenerate pools that already exist")
+    parser.add_argument("--backend", type=str, default=None, help="Vector backend (defaults to HIRE3X_VECTOR_BACKEND)")
+    parser.add_argument("--multi-vector", action="store_true", help="Index and search profile sections")
+    parser.add_argument("--model", type=str, default="all-MiniLM-L6-v2", help="Embedding model")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--repeats", type=int, default=20, help="Timed runs per job description")
+    parser.add_argument("--chunk-size", type=int, default=256, help="Records committed together while ingesting")
+    parser.add_argument("--workdir", type=str, default="./data/benchmark", help="Directory for pools and databases")
+    parser.add_argument("--keep-databases", action="store_true", help="Keep each pool's database after measuring")
+    parser.add_argument("--output", type=str, default=None,
+                        help="Results file (defaults to <workdir>/results/<timestamp>-<commit>.json)")
+    args = parser.parse_args()
+
+    from src.database.backends import DEFAULT_BACKEND
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    revision = git_revision()
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git": revision,
+        "config": {
+            "sizes": sizes,
+            "seed": args.seed,
+            "backend": (args.backend or DEFAULT_BACKEND).lower(),
+            "multi_vector": args.multi_vector,
+            "model": args.model,
+            "top_k": args.top_k,
+            "repeats": args.repeats,
+            "jobs": args.jobs,
+            "reference_date": REFERENCE_DATE,
+            "chunk_size": args.chunk_size,
+            "environment": {key: value for key, value in os.environ.items() if key.startswith("HIRE3X_")}
+        },
+        "machine": {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count()
+        },
+        "results": []
+    }
+
+    # Each pool is measured in a fresh process so its memory high-water mark is its own
+    context = multiprocessing.get_context("spawn")
+    jobs_path = os.path.join(args.workdir, "pools", f"jobs-{args.jobs}-seed{args.seed}.ndjson")
+    generate_corpus(jobs_path, "jobs", args.jobs, args.seed, 1, args.regenerate)
+    for size in sizes:
+        pool_path = os.path.join(args.workdir, "pools", f"candidates-{size}-seed{args.seed}.ndjson")
+        generate_corpus(pool_path, "candidates", size, args.seed, args.generator_workers, args.regenerate)
+
+        config = {
+            "size": size,
+            "pool_path": pool_path,
+            "jobs_path": jobs_path,
+            "workdir": args.workdir,
+            "backend": args.backend,
+            "multi_vector": args.multi_vector,
+            "model": args.model,
+            "top_k": args.top_k,
+            "repeats": args.repeats,
+            "chunk_size": args.chunk_size,
+            "keep_databases": args.keep_databases
+        }
+        with context.Pool(1) as pool:
+            result = pool.apply(run_pool, (config,))
+        logger.info(f"Pool of {size}: {json.dumps(result)}")
+        report["results"].append(result)
+
+    output = args.output
+    if output is None:
+        stamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        output = os.path.join(args.workdir, "results", f"{stamp}-{(revision['commit'] or 'unknown')[:10]}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as f:
+        json.dump(report, f, indent=2)
+    logger.info(f"Wrote results to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,184 @@
+import sys
+import json
+import time
+import argparse
+import tempfile
+import multiprocessing
+from pathlib import Path
+import numpy as np
+import logging
+
+# Add the project root to the Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from src.database.backends import NumpyBackend, QUANTIZATION_MODES
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger("hire3x.benchmark_quantization")
+
+
+def synthetic_embeddings(n, dimension, clusters, seed):
+    """Clustered unit vectors, closer to sentence embeddings than uniform noise."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((clusters, dimension)).astype(np.float32)
+    vectors = centers[rng.integers(0, clusters, n)] + 0.6 * rng.standard_normal((n, dimension)).astype(np.float32)
+    return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+
+def build_backend(directory, vectors, quantization, rescore_factor, chunk=10000):
+    """Load vectors into a fresh numpy backend."""
+    backend = NumpyBackend(
+        "bench",
+        directory,
+        initial_capacity=len(vectors),
+        quantization=quantization,
+        rescore_factor=rescore_factor
+    )
+    for start in range(0, len(vectors), chunk):
+        stop = min(start + chunk, len(vectors))
+        ids = [str(i) for i in range(start, stop)]
+        backend.add(ids, vectors[start:stop], [""] * len(ids), [{"id": i} for i in ids])
+    return backend
+
+
+def rss_bytes():
+    """Current resident memory of this process, or None where /proc is not available."""
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    return None
+
+
+def measure_mode(directory, quantization, rescore_factor, queries, truth, top_k):
+    """
+    Open the stored vectors with one storage mode and measure it. Runs in a fresh process.
+
+    Memory is measured as the growth of the process's resident set from just
+    before the backend is opened, so it includes whatever of the float32 file
+    stays mapped in, not only the arrays the first pass reads.
+
+    Args:
+        directory: Directory holding the stored vectors
+        quantization: None, "float16" or "int8"
+        rescore_factor: Candidates rescored at full precision per result
+        queries: Query embeddings
+        truth: Exact top-k IDs per query
+        top_k: Number of results per query
+
+    Returns:
+        Dictionary of measurements
+    """
+    baseline = rss_bytes()
+    backend = NumpyBackend("bench", directory, quantization=quantization, rescore_factor=rescore_factor)
+    opened = rss_bytes()
+
+    latencies = []
+    recalls = []
+    for query, expected in zip(queries, truth):
+        started = time.perf_counter()
+        found = backend.query(query.tolist(), top_k)["ids"][0]
+        latencies.append((time.perf_counter() - started) * 1000.0)
+        recalls.append(len(expected.intersection(found)) / top_k)
+    queried = rss_bytes()
+
+    memory = backend.memory_stats()
+    return {
+        f"recall@{top_k}": float(np.mean(recalls)),
+        "latency_ms_p50": float(np.percentile(latencies, 50)),
+        "latency_ms_p95": float(np.percentile(latencies, 95)),
+        "search_bytes": memory["search_bytes"],
+        "search_array_reduction": memory["full_precision_bytes"] / max(memory["search_bytes"], 1),
+        "float32_resident_bytes": memory["mapped_resident_bytes"],
+        "rss_growth_after_open_bytes": opened - baseline if baseline is not None else None,
+        "rss_growth_after_queries_bytes": queried - baseline if baseline is not None else None
+    }
+
+
+def run_benchmark(vectors, queries, top_k, rescore_factor):
+    """
+    Compare recall@k, latency and memory of each storage mode against exact search.
+
+    The vectors are stored once; each mode then opens them in its own process,
+    the way a restarted server would, so resident memory is measured per mode.
+
+    Args:
+        vectors: Corpus embeddings
+        queries: Query embeddings
+        top_k: Number of results per query
+        rescore_factor: Candidates rescored at full precision per result
+
+    Returns:
+        Dictionary of results per storage mode
+    """
+    exact_scores = queries @ vectors.T
+    truth = [set(map(str, np.argsort(-row)[:top_k])) for row in exact_scores]
+
+    results = {}
+    context = multiprocessing.get_context("spawn")
+    with tempfile.TemporaryDirectory() as directory:
+        build_backend(directory, vectors, None, rescore_factor)
+        for quantization in (None,) + QUANTIZATION_MODES:
+            name = quantization or "float32"
+            with context.Pool(1) as pool:
+                results[name] = pool.apply(
+                    measure_mode, (directory, quantization, rescore_factor, queries, truth, top_k)
+                )
+            logger.info(f"{name}: {results[name]}")
+
+    # Resident memory relative to float32, which is what quantization actually saves
+    baseline = results["float32"]["rss_growth_after_queries_bytes"]
+    for result in results.values():
+        growth = result["rss_growth_after_queries_bytes"]
+        result["rss_reduction"] = baseline / growth if baseline and growth else None
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure recall and memory of quantized vector storage")
+    parser.add_argument("--embeddings", type=str, default=None,
+                        help="Optional .npy file of real embeddings (synthetic vectors if omitted)")
+    parser.add_argument("--num-vectors", type=int, default=100000, help="Number of synthetic vectors")
+    parser.add_argument("--dimension", type=int, default=384, help="Dimension of synthetic vectors")
+    parser.add_argument("--num-queries", type=int, default=200, help="Number of queries")
+    parser.add_argument("--top-k", type=int, default=10, help="Results per query")
+    parser.add_argument("--rescore-factor", type=int, default=4, help="Full-precision rescoring depth")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--output", type=str, default=None, help="Write results as JSON to this file")
+    args = parser.parse_args()
+
+    if args.embeddings:
+        vectors = np.load(args.embeddings).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        rng = np.random.default_rng(args.seed)
+        # Queries are perturbed corpus vectors so each has true near neighbours
+        picks = vectors[rng.integers(0, len(vectors), args.num_queries)]
+        queries = picks + 0.1 * rng.standard_normal(picks.shape).astype(np.float32)
+    else:
+        # Queries come from the same clusters as the corpus but are not in it
+        points = synthetic_embeddings(args.num_vectors + args.num_queries, args.dimension, clusters=256, seed=args.seed)
+        vectors, queries = points[:args.num_vectors], points[args.num_vectors:]
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+
+    results = run_benchmark(vectors, queries, args.top_k, args.rescore_factor)
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+
+
+if __name__ == "__main__":
+    main()
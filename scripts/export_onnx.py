@@ -0,0 +1,213 @@
+import os
+import sys
+import json
+import time
+import argparse
+from pathlib import Path
+import numpy as np
+import logging
+
+# Add the project root to the Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from src.embeddings.onnx_backend import resolve_snapshot_dir, onnx_model_path
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger("hire3x.export_onnx")
+
+# Minimum cosine similarity to the PyTorch embedding accepted by the parity check
+PARITY_THRESHOLDS = {"float32": 0.9999, "int8": 0.98}
+
+
+def export_model(snapshot_dir, output_path, opset=14):
+    """
+    Export the snapshot's transformer to ONNX with dynamic batch and sequence axes.
+
+    Only the transformer is exported; pooling and normalization run in numpy
+    in OnnxSentenceEncoder, exactly as sentence-transformers applies them.
+
+    Args:
+        snapshot_dir: Model snapshot directory
+        output_path: Path of the ONNX file to write
+        opset: ONNX opset version
+    """
+    import torch
+    from transformers import AutoModel
+
+    model = AutoModel.from_pretrained(snapshot_dir)
+    model.eval()
+
+    dummy = {
+        "input_ids": torch.ones((2, 16), dtype=torch.long),
+        "attention_mask": torch.ones((2, 16), dtype=torch.long),
+        "token_type_ids": torch.zeros((2, 16), dtype=torch.long)
+    }
+    dynamic_axes = {name: {0: "batch", 1: "sequence"} for name in dummy}
+    dynamic_axes["last_hidden_state"] = {0: "batch", 1: "sequence"}
+
+    os.makedirs(os.path.dirname(output_path), exist_ok=True)
+    with torch.no_grad():
+        torch.onnx.export(
+            model,
+            (dummy["input_ids"], dummy["attention_mask"], dummy["token_type_ids"]),
+            output_path,
+            input_names=list(dummy),
+            output_names=["last_hidden_state"],
+            dynamic_axes=dynamic_axes,
+            opset_version=opset,
+            do_constant_folding=True
+        )
+    logger.info(f"Exported {snapshot_dir} to {output_path}")
+
+
+def quantize_model(input_path, output_path):
+    """
+    Write a dynamically int8-quantized copy of an ONNX model.
+
+    Args:
+        input_path: Full-precision ONNX model
+        output_path: Path of the quantized model
+    """
+    from onnxruntime.quantization import quantize_dynamic, QuantType
+
+    quantize_dynamic(input_path, output_path, weight_type=QuantType.QInt8)
+    logger.info(
+        f"Quantized {input_path} to {output_path} "
+        f"({os.path.getsize(input_path) / 1e6:.1f} MB -> {os.path.getsize(output_path) / 1e6:.1f} MB)"
+    )
+
+
+def load_parity_texts(limit=64):
+    """Candidate and job texts from the sample data, so parity covers realistic lengths."""
+    from src.data_processing.hire3x_models import CandidateProfile
+
+    texts = []
+    path = root_dir / "data" / "sample_candidates.json"
+    if path.exists():
+        with open(path) as f:
+            for record in json.load(f):
+                try:
+                    texts.append(CandidateProfile(**record).to_text())
+                except Exception:
+                    continue
+                if len(texts) >= limit:
+                    break
+    texts.extend([
+        "Python developer",
+        "Senior backend engineer with FastAPI, PostgreSQL and AWS experience",
+        "Data scientist skilled in machine learning, NLP and sentence embeddings " * 20
+    ])
+    return texts
+
+
+def timed(fn):
+    """Run fn and return its result and the elapsed milliseconds."""
+    started = time.perf_counter()
+    result = fn()
+    return result, (time.perf_counter() - started) * 1000.0
+
+
+def check_parity(model_name, cache_dir, snapshot_dir, variants, queries=50):
+    """
+    Compare ONNX embeddings against the PyTorch model, with load time and per-query latency.
+
+    Args:
+        model_name: Sentence-transformers model name
+        cache_dir: Model cache directory
+        snapshot_dir: Model snapshot directory
+        variants: Names of the ONNX variants to check ("float32", "int8")
+        queries: Number of single-text encodes timed per backend
+
+    Returns:
+        Dictionary of results per backend, and whether every variant passed
+    """
+    from src.embeddings.onnx_backend import OnnxSentenceEncoder
+
+    texts = load_parity_texts()
+    query = "Backend engineer with Python, FastAPI and vector search experience"
+
+    def latency(model):
+        model.encode(query)
+        samples = [timed(lambda: model.encode(query))[1] for _ in range(queries)]
+        return float(np.percentile(samples, 50)), float(np.percentile(samples, 95))
+
+    def load_torch():
+        from sentence_transformers import SentenceTransformer
+        return SentenceTransformer(model_name, cache_folder=cache_dir)
+
+    reference_model, load_ms = timed(load_torch)
+    reference = reference_model.encode(texts, batch_size=32, show_progress_bar=False)
+    p50, p95 = latency(reference_model)
+    results = {"torch": {"load_ms": load_ms, "query_ms_p50": p50, "query_ms_p95": p95}}
+
+    passed = True
+    for variant in variants:
+        model, load_ms = timed(lambda: OnnxSentenceEncoder(snapshot_dir, quantized=variant == "int8"))
+        embeddings = model.encode(texts, batch_size=32)
+        cosines = np.sum(embeddings * reference, axis=1) / (
+            np.linalg.norm(embeddings, axis=1) * np.linalg.norm(reference, axis=1)
+        )
+        p50, p95 = latency(model)
+        ok = bool(cosines.min() >= PARITY_THRESHOLDS[variant])
+        passed = passed and ok
+        results[f"onnx-{variant}"] = {
+            "load_ms": load_ms,
+            "query_ms_p50": p50,
+            "query_ms_p95": p95,
+            "min_cosine": float(cosines.min()),
+            "mean_cosine": float(cosines.mean()),
+            "max_abs_diff": float(np.abs(embeddings - reference).max()),
+            "passed": ok
+        }
+        logger.info(f"onnx-{variant}: {results[f'onnx-{variant}']}")
+    return results, passed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export the embedding model to ONNX and check parity")
+    parser.add_argument("--model", type=str, default="all-MiniLM-L6-v2", help="Embedding model")
+    parser.add_argument("--cache-dir", type=str, default="./models", help="Model cache directory")
+    parser.add_argument("--opset", type=int, default=14, help="ONNX opset version")
+    parser.add_argument("--quantize", action="store_true", help="Also write a dynamic int8 model")
+    parser.add_argument("--skip-export", action="store_true", help="Only run the parity check")
+    parser.add_argument("--no-check", action="store_true", help="Skip the parity check")
+    parser.add_argument("--output", type=str, default=None, help="Write parity results as JSON to this file")
+    args = parser.parse_args()
+
+    snapshot_dir = resolve_snapshot_dir(args.model, args.cache_dir)
+    model_path = onnx_model_path(snapshot_dir)
+    quantized_path = onnx_model_path(snapshot_dir, quantized=True)
+
+    if not args.skip_export:
+        export_model(snapshot_dir, model_path, opset=args.opset)
+        if args.quantize:
+            quantize_model(model_path, quantized_path)
+
+    if args.no_check:
+        return
+
+    variants = ["float32"]
+    if os.path.exists(quantized_path):
+        variants.append("int8")
+    results, passed = check_parity(args.model, args.cache_dir, snapshot_dir, variants)
+    output = json.dumps(results, indent=2)
+    print(output)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output)
+    if not passed:
+        logger.error("ONNX embeddings differ from the PyTorch model beyond the parity threshold")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
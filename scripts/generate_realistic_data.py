@@ -1,17 +1,19 @@
-import json
-import uuid
 import os
-from datetime import datetime, timedelta
+import json
+import time
 import random
+import hashlib
+import argparse
+import multiprocessing
+from datetime import datetime, timedelta
 import names
-import faker
-from faker import Faker
 
-# Initialize Faker
-fake = Faker()
+# Dates in generated profiles are relative to this day (today unless set with
+# set_reference_date), so a fixed seed and reference date give identical output
+REFERENCE_DATE = None
 
-# Ensure data directory exists
-os.makedirs("data", exist_ok=True)
+# Records generated from one sub-seed; output depends on the seed, not on the number of workers
+DEFAULT_SHARD_SIZE = 1000
 
 # Tech roles to generate
 TECH_ROLES = [
@@ -92,6 +94,15 @@ HIRE3X_ASSESSMENTS = {
     "UI/UX Design": ["Figma", "Adobe XD", "User Research", "Wireframing", "Prototyping", "Usability Testing", "Design Systems"]
 }
 
+def set_reference_date(reference_date=None):
+    """Make generated dates relative to a fixed YYYY-MM-DD day instead of today."""
+    global REFERENCE_DATE
+    REFERENCE_DATE = datetime.strptime(reference_date, "%Y-%m-%d") if reference_date else None
+
+def reference_now():
+    """The day generated dates are relative to."""
+    return REFERENCE_DATE or datetime.now()
+
 def generate_random_id(role_prefix):
     """Generate a random ID for a profile based on role prefix."""
     return f"{role_prefix}{random.randint(1000, 9999)}"
@@ -134,7 +145,7 @@ def generate_assessment_data(assessment_type):
         certificates_earned = certificates
     
     # Generate taken date
-    today = datetime.now()
+    today = reference_now()
     days_ago = random.randint(1, 365)
     taken_date = (today - timedelta(days=days_ago)).strftime("%Y-%m-%d")
     
@@ -241,7 +252,7 @@ def generate_course_data(category):
     completion_status = random.choices(["Completed", "In Progress"], weights=[0.8, 0.2])[0]
     
     # Generate completion date
-    today = datetime.now()
+    today = reference_now()
     days_ago = random.randint(30, 365)
     completion_date = (today - timedelta(days=days_ago)).strftime("%Y-%m-%d") if completion_status == "Completed" else None
     
@@ -364,7 +375,8 @@ def generate_experience_entry(company, role, is_current, years_ago_ended, durati
     role_lower = role.lower()
     
     if "full stack" in role_lower:
-        description = f"{'Leading' if is_current else 'Led'} development of {'the company\'s' if is_current else 'a'} web application platform using modern technologies and best practices. {'Responsible for' if is_current else 'Handled'} both frontend and backend implementation."
+        platform_owner = "the company's" if is_current else "a"
+        description = f"{'Leading' if is_current else 'Led'} development of {platform_owner} web application platform using modern technologies and best practices. {'Responsible for' if is_current else 'Handled'} both frontend and backend implementation."
         skills = ["JavaScript", "TypeScript", "React", "Node.js", "Express", "MongoDB", "PostgreSQL", "AWS", "Docker"]
     
     elif "frontend" in role_lower:
@@ -571,7 +583,7 @@ def generate_certifications(role):
         relevant_categories = list(all_certifications.keys())
     
     # Deduplicate categories
-    relevant_categories = list(set(relevant_categories))
+    relevant_categories = list(dict.fromkeys(relevant_categories))
     
     # Determine number of certifications (0-3)
     num_certs = random.randint(0, 3)
@@ -765,6 +777,30 @@ def generate_languages():
     
     return languages
 
+def assessment_types_for_role(role_type):
+    """Hire3x assessment types relevant to a role."""
+    if "Full Stack" in role_type:
+        return ["Frontend Development", "Backend Development"]
+    elif "Frontend" in role_type:
+        return ["Frontend Development"]
+    elif "Backend" in role_type:
+        return ["Backend Development"]
+    elif "DevOps" in role_type:
+        return ["DevOps", "Cloud Architecture"]
+    elif "Data Scientist" in role_type:
+        return ["Data Science"]
+    elif "Machine Learning" in role_type:
+        return ["Machine Learning", "Data Science"]
+    
+    # Find the closest category
+    assessment_types = []
+    for assessment_type in HIRE3X_ASSESSMENTS.keys():
+        if any(keyword.lower() in role_type.lower() for keyword in assessment_type.split()):
+            assessment_types.append(assessment_type)
+    
+    # Default to Frontend and Backend if no match
+    return assessment_types or ["Frontend Development", "Backend Development"]
+
 def generate_realistic_candidate(index):
     """Generate a realistic candidate profile."""
     # Select a random tech role type
@@ -798,8 +834,8 @@ def generate_realistic_candidate(index):
     else:
         role_prefix = "tech"
     
-    # Generate a random ID
-    candidate_id = f"{role_prefix}{random.randint(100, 999)}"
+    # IDs are unique within a generated pool
+    candidate_id = f"{role_prefix}{index}"
     
     # Generate name
     gender = random.choice(["male", "female"])
@@ -840,7 +876,7 @@ def generate_realistic_candidate(index):
     current_role = f"{random.choice(['Senior ', '', 'Lead '])}{role_type} at {company}"
     
     # Generate education
-    current_year = datetime.now().year
+    current_year = reference_now().year
     bs_year = current_year - random.randint(int(years_experience) + 2, int(years_experience) + 8)
     ms_year = bs_year + random.randint(2, 4) if random.random() > 0.6 else None  # 40% chance of no master's
     
@@ -906,31 +942,10 @@ def generate_realistic_candidate(index):
     languages = generate_languages()
     
     # Generate Hire3x data
-    joined_date = (datetime.now() - timedelta(days=random.randint(30, 730))).strftime("%Y-%m-%d")
+    joined_date = (reference_now() - timedelta(days=random.randint(30, 730))).strftime("%Y-%m-%d")
     
     # Determine assessment types based on role
-    assessment_types = []
-    if "Full Stack" in role_type:
-        assessment_types = ["Frontend Development", "Backend Development"]
-    elif "Frontend" in role_type:
-        assessment_types = ["Frontend Development"]
-    elif "Backend" in role_type:
-        assessment_types = ["Backend Development"]
-    elif "DevOps" in role_type:
-        assessment_types = ["DevOps", "Cloud Architecture"]
-    elif "Data Scientist" in role_type:
-        assessment_types = ["Data Science"]
-    elif "Machine Learning" in role_type:
-        assessment_types = ["Machine Learning", "Data Science"]
-    else:
-        # Find the closest category
-        for assessment_type in HIRE3X_ASSESSMENTS.keys():
-            if any(keyword.lower() in role_type.lower() for keyword in assessment_type.split()):
-                assessment_types.append(assessment_type)
-        
-        # Default to Frontend and Backend if no match
-        if not assessment_types:
-            assessment_types = ["Frontend Development", "Backend Development"]
+    assessment_types = assessment_types_for_role(role_type)
     
     num_assessments = random.randint(1, len(assessment_types))
     chosen_assessment_types = random.sample(assessment_types, num_assessments)
@@ -1002,23 +1017,170 @@ def generate_realistic_candidate(index):
         "preferred_work_type": preferred_work_type
     }
 
-def generate_realistic_candidates(num_candidates=100):
-    """Generate a specified number of realistic candidate profiles."""
-    candidates = []
-    
-    for i in range(num_candidates):
-        candidate = generate_realistic_candidate(i)
-        candidates.append(candidate)
-    
-    # Save to file
-    with open("data/sample_candidates.json", "w") as f:
-        json.dump(candidates, f, indent=2)
+# Experience levels of generated jobs with their minimum years and salary range
+JOB_LEVELS = [
+    {"level": "Entry Level", "title_prefix": "Junior ", "min_years": 0, "salary": (60000, 90000)},
+    {"level": "Mid-Level", "title_prefix": "", "min_years": 2, "salary": (90000, 130000)},
+    {"level": "Senior", "title_prefix": "Senior ", "min_years": 5, "salary": (130000, 180000)},
+    {"level": "Expert", "title_prefix": "Principal ", "min_years": 10, "salary": (170000, 240000)}
+]
+
+def generate_job_description(index):
+    """Generate a realistic job description matching the generated candidate roles."""
+    role_info = random.choice(TECH_ROLES)
+    role_type = role_info["role"]
+    specialties = role_info["specialties"]
+    level = random.choices(JOB_LEVELS, weights=[0.2, 0.4, 0.3, 0.1])[0]
+    company = random.choice(TECH_COMPANIES)
     
-    print(f"Generated {len(candidates)} sample candidates.")
-    print("Files saved to data/sample_candidates.json")
+    # Core skills come from the role's specialties, nice-to-haves from its wider skill set
+    required_skills = random.sample(specialties, min(len(specialties), random.randint(3, 5)))
+    other_skills = [skill for skill in generate_skills_for_role(role_type) if skill not in required_skills]
+    preferred_skills = random.sample(other_skills, min(len(other_skills), random.randint(2, 4)))
+    
+    min_years = level["min_years"] + random.randint(0, 2)
+    description = random.choice([
+        f"{company} is looking for a {level['title_prefix'].lower()}{role_type.lower()} to join a team building {random.choice(['scalable', 'customer-facing', 'data-intensive', 'mission-critical'])} products with {required_skills[0]} and {required_skills[1]}.",
+        f"Join {company} as a {role_type} and help us {random.choice(['scale our platform', 'modernize our stack', 'ship new products', 'improve reliability'])}. You will work daily with {', '.join(required_skills[:3])}.",
+        f"We are hiring a {role_type} to {random.choice(['own core services', 'lead key initiatives', 'grow our engineering capabilities', 'deliver high-impact features'])} at {company}, working across {required_skills[0]} and related technologies."
+    ])
+    
+    requirements = [
+        f"{min_years}+ years of experience as a {role_type}" if min_years else f"Experience or coursework relevant to {role_type} work",
+        f"Strong knowledge of {required_skills[0]} and {required_skills[1]}",
+        f"Hands-on experience with {required_skills[-1]}"
+    ]
+    if random.random() > 0.5:
+        requirements.append("Bachelor's degree in Computer Science or a related field")
+    
+    responsibilities = random.sample([
+        f"Design, build and maintain {role_type.lower()} solutions",
+        "Collaborate with product managers and designers on new features",
+        "Review code and mentor other engineers",
+        "Improve performance, reliability and test coverage",
+        f"Evaluate and adopt tools around {random.choice(specialties)}",
+        "Participate in planning and technical design discussions",
+        "Troubleshoot and resolve production issues"
+    ], random.randint(3, 5))
+    
+    assessment_types = assessment_types_for_role(role_type)
+    salary_min = round(random.uniform(*level["salary"]), -3)
     
-    return candidates
+    return {
+        "id": f"job{index}",
+        "title": f"{level['title_prefix']}{role_type}",
+        "company": company,
+        "location": random.choice(TECH_LOCATIONS),
+        "remote_option": random.choice(["Remote Only", "Hybrid", "On-Site", "No Preference"]),
+        "description": description,
+        "requirements": requirements,
+        "responsibilities": responsibilities,
+        "preferred_qualifications": [f"Experience with {skill}" for skill in preferred_skills],
+        "required_assessments": random.sample(assessment_types, random.randint(1, len(assessment_types))),
+        "min_assessment_score": random.choice([None, 70.0, 75.0, 80.0]),
+        "required_skills": required_skills,
+        "experience_level": level["level"],
+        "employment_type": random.choices(["Full-time", "Contract", "Part-time", "Freelance"], weights=[0.8, 0.1, 0.05, 0.05])[0],
+        "salary_range": {"min": salary_min, "max": salary_min + round(random.uniform(20000, 50000), -3)}
+    }
+
+# Record generators by kind
+GENERATORS = {
+    "candidates": generate_realistic_candidate,
+    "jobs": generate_job_description
+}
+
+def shard_seed(seed, kind, shard):
+    """Deterministic sub-seed of one shard of records."""
+    digest = hashlib.sha256(f"{seed}:{kind}:{shard}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+def generate_shard(task):
+    """Generate one shard of records as JSON lines. Runs in a worker process."""
+    kind, seed, shard, start, count, reference_date = task
+    set_reference_date(reference_date)
+    # The names package draws from the global random generator, so seed that one
+    random.seed(shard_seed(seed, kind, shard))
+    generate = GENERATORS[kind]
+    return [json.dumps(generate(index)) for index in range(start, start + count)]
+
+def iter_records(kind, count, seed, workers=1, shard_size=DEFAULT_SHARD_SIZE, reference_date=None):
+    """
+    Generate records as JSON lines, in order, fanning shards out over worker processes.
+    
+    Every shard of ``shard_size`` records is seeded from (seed, kind, shard
+    number), so the output is identical whatever the number of workers.
+    """
+    tasks = [
+        (kind, seed, shard, start, min(shard_size, count - start), reference_date)
+        for shard, start in enumerate(range(0, count, shard_size))
+    ]
+    if workers <= 1:
+        for task in tasks:
+            yield from generate_shard(task)
+        return
+    
+    with multiprocessing.Pool(workers) as pool:
+        for lines in pool.imap(generate_shard, tasks):
+            yield from lines
+
+def write_records(path, kind, count, seed, workers=1, shard_size=DEFAULT_SHARD_SIZE, reference_date=None):
+    """
+    Stream generated records to an NDJSON file (.ndjson/.jsonl) or a JSON array (.json).
+    
+    Records are written as they are generated, so memory use does not grow
+    with ``count``. The file is only put in place once it is complete.
+    """
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    as_array = path.endswith(".json")
+    
+    temp_path = f"{path}.tmp"
+    with open(temp_path, "w") as f:
+        if as_array:
+            f.write("[\n")
+        for number, line in enumerate(iter_records(kind, count, seed, workers, shard_size, reference_date)):
+            if as_array and number:
+                f.write(",\n")
+            f.write(line)
+            if not as_array:
+                f.write("\n")
+        if as_array:
+            f.write("\n]\n")
+    os.replace(temp_path, path)
+
+def generate_realistic_candidates(num_candidates=100, output_path="data/sample_candidates.json", seed=None, workers=1):
+    """Generate a specified number of realistic candidate profiles and save them to a file."""
+    if seed is None:
+        seed = random.SystemRandom().randrange(2 ** 32)
+    write_records(output_path, "candidates", num_candidates, seed, workers)
+    
+    print(f"Generated {num_candidates} sample candidates (seed {seed}).")
+    print(f"Files saved to {output_path}")
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate realistic candidate profiles and job descriptions")
+    parser.add_argument("--count", type=int, default=100, help="Number of candidates")
+    parser.add_argument("--output", type=str, default="data/sample_candidates.json",
+                        help="Candidates file; .ndjson/.jsonl for NDJSON, .json for a JSON array")
+    parser.add_argument("--jobs", type=int, default=0, help="Number of job descriptions")
+    parser.add_argument("--jobs-output", type=str, default="data/sample_jobs.ndjson", help="Job descriptions file")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed (random and printed if omitted)")
+    parser.add_argument("--reference-date", type=str, default=None,
+                        help="Day generated dates are relative to, YYYY-MM-DD (defaults to today)")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes")
+    parser.add_argument("--shard-size", type=int, default=DEFAULT_SHARD_SIZE, help="Records per sub-seed")
+    args = parser.parse_args()
+    
+    seed = args.seed if args.seed is not None else random.SystemRandom().randrange(2 ** 32)
+    for kind, count, path in (("candidates", args.count, args.output), ("jobs", args.jobs, args.jobs_output)):
+        if count <= 0:
+            continue
+        started = time.perf_counter()
+        write_records(path, kind, count, seed, args.workers, args.shard_size, args.reference_date)
+        elapsed = time.perf_counter() - started
+        print(f"Generated {count} {kind} in {elapsed:.1f}s ({count / elapsed:.0f}/s) to {path} (seed {seed})")
 
 if __name__ == "__main__":
-    # Generate 100 realistic candidates
-    generate_realistic_candidates(100)
\ No newline at end of file
+    main()
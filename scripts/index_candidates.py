@@ -0,0 +1,284 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import multiprocessing
+from collections import deque
+from pathlib import Path
+import logging
+
+# Add the project root to the Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+from src.data_processing.hire3x_models import CandidateProfile
+from src.ingest.stream import JsonRecordReader, read_chunks
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger("hire3x.indexer")
+
+# Model instance of a worker process, created by init_worker
+_worker_generator = None
+_worker_multi_vector = False
+
+
+def init_worker(model_name, encode_batch_size, threads_per_worker, multi_vector=False):
+    """Load one model per worker process."""
+    global _worker_generator, _worker_multi_vector
+    _worker_multi_vector = multi_vector
+
+    # Keep workers from oversubscribing cores with intra-op threads
+    try:
+        import torch
+        torch.set_num_threads(threads_per_worker)
+    except ImportError:
+        pass
+
+    from src.embeddings.generator import EmbeddingGenerator
+    logging.getLogger("hire3x.embeddings").setLevel(logging.WARNING)
+    _worker_generator = EmbeddingGenerator(
+        model_name=model_name,
+        batch_size=encode_batch_size,
+        embedding_cache_dir=None,
+        micro_batch_wait_ms=0
+    )
+
+
+def embed_chunk(records):
+    """
+    Validate and embed one chunk of records in a worker process.
+
+    Args:
+        records: StreamRecords read by the writer
+
+    Returns:
+        Tuple of (candidates, texts, metadatas, embeddings, section_embeddings, errors, end_offset)
+    """
+    candidates = []
+    errors = []
+    for record in records:
+        if record.error:
+            errors.append((record.number, record.error))
+            continue
+        try:
+            candidates.append(CandidateProfile(**record.data))
+        except Exception as e:
+            errors.append((record.number, f"Invalid candidate: {e}"))
+
+    texts = [candidate.to_text() for candidate in candidates]
+    metadatas = [candidate.get_metadata() for candidate in candidates]
+    embeddings = _worker_generator.generate_batch_embeddings(texts)
+
+    section_embeddings = None
+    if _worker_multi_vector:
+        from src.database.sections import build_section_records
+        _, section_texts, _ = build_section_records(candidates)
+        section_embeddings = _worker_generator.generate_batch_embeddings(section_texts)
+
+    return candidates, texts, metadatas, embeddings, section_embeddings, errors, records[-1].end_offset
+
+
+def load_checkpoint(path, resume):
+    """Load the indexer checkpoint when resuming, otherwise start a fresh one."""
+    if resume and os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+    return {"offset": 0, "records": 0, "indexed": 0, "failed": 0, "mode": None}
+
+
+def save_checkpoint(path, checkpoint):
+    """Atomically write the indexer checkpoint."""
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def run_indexer(
+    input_path,
+    workers=None,
+    batch_size=256,
+    encode_batch_size=64,
+    backend=None,
+    persist_directory=None,
+    collection_name="candidates",
+    model_name="all-MiniLM-L6-v2",
+    resume=False,
+    rebuild=False,
+    multi_vector=False
+):
+    """
+    Index candidate profiles from a JSON or NDJSON file.
+
+    The input is streamed and split into chunks of ``batch_size`` records.
+    Worker processes, each with its own model, validate and embed the chunks.
+    This process is the single writer and commits each embedded chunk in
+    input order. After each commit it checkpoints the byte offset, so
+    ``resume`` continues an interrupted run.
+
+    Args:
+        input_path: JSON array or NDJSON file of candidate profiles
+        workers: Number of embedding processes (defaults to the CPU count)
+        batch_size: Records per chunk sent to a worker and committed together
+        encode_batch_size: Texts per encode call inside a worker
+        backend: Vector backend name (defaults to HIRE3X_VECTOR_BACKEND)
+        persist_directory: Vector store directory (backend default if omitted)
+        collection_name: Collection to index into
+        model_name: Sentence-transformers model used by the workers
+        resume: Continue from the checkpoint of a previous run
+        rebuild: Delete the existing vector store and profile store first
+        multi_vector: Also embed and index profile sections (see VectorDatabase)
+
+    Returns:
+        Dictionary with the number of records read, indexed and failed, and docs/sec
+    """
+    from src.database.vector_db import VectorDatabase
+    from src.database.backends import DEFAULT_BACKEND
+
+    backend = (backend or DEFAULT_BACKEND).lower()
+    if persist_directory is None:
+        persist_directory = "./data/vectors" if backend == "numpy" else "./data/chroma"
+    checkpoint_path = os.path.join(persist_directory, f"{collection_name}.index-checkpoint.json")
+    profiles_path = os.path.join(os.path.dirname(os.path.abspath(persist_directory)), "profiles.sqlite")
+
+    if rebuild:
+        logger.info(f"Rebuilding: removing {persist_directory} and {profiles_path}")
+        shutil.rmtree(persist_directory, ignore_errors=True)
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(profiles_path + suffix):
+                os.remove(profiles_path + suffix)
+
+    vector_db = VectorDatabase(
+        collection_name=collection_name,
+        persist_directory=persist_directory,
+        backend=backend,
+        multi_vector=multi_vector
+    )
+
+    checkpoint = load_checkpoint(checkpoint_path, resume)
+    if resume and checkpoint["offset"]:
+        logger.info(f"Resuming after {checkpoint['records']} records (byte offset {checkpoint['offset']})")
+
+    workers = workers or os.cpu_count() or 1
+    threads_per_worker = max(1, (os.cpu_count() or 1) // workers)
+    context = multiprocessing.get_context("spawn")
+
+    started = time.perf_counter()
+    indexed_this_run = 0
+    last_report = started
+
+    with open(input_path, "rb") as f, context.Pool(
+        workers,
+        initializer=init_worker,
+        initargs=(model_name, encode_batch_size, threads_per_worker, multi_vector)
+    ) as pool:
+        f.seek(checkpoint["offset"])
+        reader = JsonRecordReader(
+            f,
+            start_offset=checkpoint["offset"],
+            start_number=checkpoint["records"],
+            mode=checkpoint["mode"]
+        )
+
+        # Keep a bounded window of chunks in flight so memory stays flat
+        in_flight = deque()
+        chunks = read_chunks(reader, batch_size)
+
+        def commit(result, record_count):
+            nonlocal indexed_this_run
+            candidates, texts, metadatas, embeddings, section_embeddings, errors, end_offset = result
+            for number, error in errors[:5]:
+                logger.warning(f"Record {number}: {error}")
+            if candidates:
+                vector_db.add_embedded_candidates(
+                    candidates,
+                    embeddings,
+                    texts=texts,
+                    metadatas=metadatas,
+                    section_embeddings=section_embeddings
+                )
+            indexed_this_run += len(candidates)
+            checkpoint["offset"] = end_offset
+            checkpoint["mode"] = reader.mode
+            checkpoint["records"] += record_count
+            checkpoint["indexed"] += len(candidates)
+            checkpoint["failed"] += len(errors)
+            save_checkpoint(checkpoint_path, checkpoint)
+
+        for chunk in chunks:
+            in_flight.append((pool.apply_async(embed_chunk, (chunk,)), len(chunk)))
+            if len(in_flight) >= workers * 2:
+                result, record_count = in_flight.popleft()
+                commit(result.get(), record_count)
+
+            now = time.perf_counter()
+            if now - last_report >= 10:
+                rate = indexed_this_run / (now - started)
+                logger.info(f"Indexed {checkpoint['indexed']} candidates ({rate:.1f} docs/sec)")
+                last_report = now
+
+        while in_flight:
+            result, record_count = in_flight.popleft()
+            commit(result.get(), record_count)
+
+    elapsed = time.perf_counter() - started
+    rate = indexed_this_run / elapsed if elapsed > 0 else 0.0
+    logger.info(
+        f"Indexed {indexed_this_run} candidates in {elapsed:.1f}s ({rate:.1f} docs/sec); "
+        f"{checkpoint['failed']} records failed, {vector_db.get_candidate_count()} in the store"
+    )
+    return {
+        "records": checkpoint["records"],
+        "indexed": checkpoint["indexed"],
+        "failed": checkpoint["failed"],
+        "elapsed_seconds": elapsed,
+        "docs_per_second": rate
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index candidate profiles into the vector store")
+    parser.add_argument("--input", type=str, default="data/sample_candidates.json",
+                        help="JSON array or NDJSON file of candidate profiles")
+    parser.add_argument("--workers", type=int, default=None, help="Number of embedding processes")
+    parser.add_argument("--batch-size", type=int, default=256, help="Records per chunk")
+    parser.add_argument("--encode-batch-size", type=int, default=64, help="Texts per encode call")
+    parser.add_argument("--backend", type=str, default=None, choices=["chroma", "numpy"], help="Vector backend")
+    parser.add_argument("--persist-directory", type=str, default=None, help="Vector store directory")
+    parser.add_argument("--collection", type=str, default="candidates", help="Collection name")
+    parser.add_argument("--model", type=str, default="all-MiniLM-L6-v2", help="Embedding model")
+    parser.add_argument("--resume", action="store_true", help="Continue from the last checkpoint")
+    parser.add_argument("--rebuild", action="store_true", help="Drop the existing index before indexing")
+    parser.add_argument("--multi-vector", action="store_true", help="Also index profile sections as separate vectors")
+    args = parser.parse_args()
+
+    if args.resume and args.rebuild:
+        parser.error("--resume and --rebuild cannot be combined")
+
+    run_indexer(
+        args.input,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        encode_batch_size=args.encode_batch_size,
+        backend=args.backend,
+        persist_directory=args.persist_directory,
+        collection_name=args.collection,
+        model_name=args.model,
+        resume=args.resume,
+        rebuild=args.rebuild,
+        multi_vector=args.multi_vector
+    )
+
+
+if __name__ == "__main__":
+    main()
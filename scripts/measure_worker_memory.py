@@ -0,0 +1,176 @@
+import os
+import sys
+import json
+import time
+import signal
+import argparse
+import subprocess
+import urllib.error
+import urllib.request
+from pathlib import Path
+import logging
+
+# Add the project root to the Python path
+root_dir = Path(__file__).resolve().parent.parent
+sys.path.append(str(root_dir))
+
+# Configure logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler()
+    ]
+)
+
+logger = logging.getLogger("hire3x.measure_worker_memory")
+
+# Job posted to warm every worker up before measuring
+WARMUP_JOB = {
+    "id": "memory-warmup",
+    "title": "Senior Backend Engineer",
+    "company": "Hire3x",
+    "description": "Build and operate Python services on AWS.",
+    "requirements": ["5+ years of Python", "Experience with distributed systems"],
+    "responsibilities": ["Design APIs", "Own production services"],
+    "required_skills": ["Python", "AWS", "PostgreSQL"],
+    "experience_level": "Senior",
+    "employment_type": "Full-time"
+}
+
+
+def process_tree(pid):
+    """The PID and all of its descendants, read from /proc."""
+    parents = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f"/proc/{entry}/stat") as f:
+                # The command name may contain spaces, so split after its closing parenthesis
+                parents[int(entry)] = int(f.read().rsplit(")", 1)[1].split()[1])
+        except (OSError, IndexError, ValueError):
+            continue
+    tree = [pid]
+    for current in tree:
+        tree.extend(child for child, parent in parents.items() if parent == current)
+    return tree
+
+
+def memory_kb(pid):
+    """Rss, Pss and private memory of one process in kB, from /proc/<pid>/smaps_rollup."""
+    fields = {}
+    with open(f"/proc/{pid}/smaps_rollup") as f:
+        for line in f:
+            parts = line.split()
+            if len(parts) == 3 and parts[2] == "kB":
+                fields[parts[0].rstrip(":")] = int(parts[1])
+    return {
+        "rss": fields.get("Rss", 0),
+        "pss": fields.get("Pss", 0),
+        "private": fields.get("Private_Clean", 0) + fields.get("Private_Dirty", 0)
+    }
+
+
+def wait_ready(base_url, timeout):
+    """Poll /api/ready until the server reports ready."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with urllib.request.urlopen(f"{base_url}/api/ready", timeout=5) as response:
+                if response.status == 200:
+                    return
+        except (urllib.error.URLError, ConnectionError, OSError):
+            pass
+        time.sleep(0.5)
+    raise TimeoutError(f"Server at {base_url} was not ready after {timeout}s")
+
+
+def warm_up(base_url, requests):
+    """Send match requests, which the kernel spreads over the workers."""
+    body = json.dumps(WARMUP_JOB).encode("utf-8")
+    for _ in range(requests):
+        request = urllib.request.Request(
+            f"{base_url}/api/jobs/match/?top_k=10", data=body, headers={"Content-Type": "application/json"}
+        )
+        with urllib.request.urlopen(request, timeout=60) as response:
+            response.read()
+
+
+def measure(workers, args):
+    """
+    Start the server with a number of workers, warm it up and measure its memory.
+
+    Args:
+        workers: Worker processes to start
+        args: Command-line arguments
+
+    Returns:
+        Dictionary of memory totals over the server's process tree
+    """
+    env = dict(os.environ)
+    env.setdefault("HIRE3X_VECTOR_BACKEND", "numpy")
+    base_url = f"http://127.0.0.1:{args.port}"
+    server = subprocess.Popen(
+        [sys.executable, str(root_dir / "main.py"), "--host", "127.0.0.1", "--port", str(args.port),
+         "--workers", str(workers), "--log-level", "warning"],
+        cwd=args.cwd or str(root_dir),
+        env=env
+    )
+    try:
+        wait_ready(base_url, args.startup_timeout)
+        warm_up(base_url, args.requests)
+        time.sleep(args.settle)
+        processes = {pid: memory_kb(pid) for pid in process_tree(server.pid)}
+    finally:
+        server.send_signal(signal.SIGTERM)
+        try:
+            server.wait(timeout=60)
+        except subprocess.TimeoutExpired:
+            server.kill()
+            server.wait()
+
+    totals = {key: sum(process[key] for process in processes.values()) / 1024 for key in ("rss", "pss", "private")}
+    return {
+        "workers": workers,
+        "processes": len(processes),
+        "rss_mb": totals["rss"],
+        "pss_mb": totals["pss"],
+        "private_mb": totals["private"]
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure the server's memory as prefork workers are added")
+    parser.add_argument("--workers", type=str, default="1,2,4", help="Comma-separated worker counts to measure")
+    parser.add_argument("--port", type=int, default=8765, help="Port to run the server on")
+    parser.add_argument("--requests", type=int, default=50, help="Match requests sent before measuring")
+    parser.add_argument("--settle", type=float, default=3.0, help="Seconds to wait after the requests")
+    parser.add_argument("--startup-timeout", type=float, default=300.0, help="Seconds to wait for the server to be ready")
+    parser.add_argument("--cwd", type=str, default=None, help="Working directory of the server (defaults to the project root)")
+    parser.add_argument("--output", type=str, default=None, help="Write the results as JSON to this file")
+    args = parser.parse_args()
+
+    results = []
+    for workers in [int(count) for count in args.workers.split(",") if count.strip()]:
+        result = measure(workers, args)
+        logger.info(f"{workers} workers: {json.dumps(result)}")
+        results.append(result)
+
+    # Pss splits shared pages between the processes sharing them, so its growth is the real cost of a worker
+    for previous, current in zip(results, results[1:]):
+        added = current["workers"] - previous["workers"]
+        logger.info(
+            f"{previous['workers']} -> {current['workers']} workers: "
+            f"+{(current['pss_mb'] - previous['pss_mb']) / added:.1f} MB Pss, "
+            f"+{(current['rss_mb'] - previous['rss_mb']) / added:.1f} MB Rss per added worker"
+        )
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        logger.info(f"Wrote results to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,168 @@
 from typing import List, Optional, Dict, Any
-from fastapi import FastAPI, UploadFile, File, Form, HTTPException, Depends, Query, Body
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, UploadFile, File, HTTPException, Query, Body, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 import json
 import uuid
+import asyncio
 import os
-from pathlib import Path
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-import pdfkit
+import shutil
+import tempfile
+import logging
 
 from src.data_processing.hire3x_models import JobDescription, CandidateMatch, CandidateProfile, EmailTemplate
-from src.embeddings.generator import EmbeddingGenerator
-from src.database.vector_db import VectorDatabase
-from src.matching.hire3x_matcher import Hire3xCandidateMatcher
+from src.api.executors import ExecutorSaturated, create_executor
+from src.api.startup import ComponentLoader, ServiceNotReady
+from src.ingest.stream import JsonRecordReader, read_chunks, ingest_records
+from src.rendering.pdf_renderer import PdfRenderer, ZipStream
+from src.outreach.mail_queue import MailQueue, SmtpSettings, open_smtp_session, build_message
+
+logger = logging.getLogger("hire3x.api")
 
 
 # Ensure necessary directories exist
 os.makedirs("data", exist_ok=True)
 os.makedirs("pdfs", exist_ok=True)
 
+# Rendered candidate PDFs, cached by profile content and template version
+pdf_renderer = PdfRenderer("pdfs")
+
+# Components are loaded in the background by the lifespan handler (see load_components),
+# or before forking by the prefork launcher (see preload_components).
+# Endpoints that use them are only reached once the loader is ready.
+embedding_generator = None
+vector_db = None
+candidate_matcher = None
+ingest_jobs = None
+mail_queue = None
+component_loader = ComponentLoader()
+
+# Paths answered while components are still loading
+STARTUP_EXEMPT_PATHS = {"/api/health", "/api/ready", "/api/executors/stats"}
+
+# Bounded executors for blocking work, so no endpoint stalls the event loop.
+# Sizes can be tuned with HIRE3X_<NAME>_WORKERS and HIRE3X_<NAME>_QUEUE.
+executors = {
+    "ingest": create_executor("ingest", default_workers=2, default_queue=8),
+    "search": create_executor("search", default_workers=32, default_queue=128),
+    "pdf": create_executor("pdf", default_workers=2, default_queue=16),
+    "email": create_executor("email", default_workers=4, default_queue=32),
+}
+
+
+def _load_embedding_generator():
+    """Load the embedding model. Runs on a loader thread."""
+    from src.embeddings.generator import EmbeddingGenerator
+    return EmbeddingGenerator(
+        micro_batch_size=int(os.environ.get("HIRE3X_EMBED_BATCH_SIZE", 32)),
+        micro_batch_wait_ms=float(os.environ.get("HIRE3X_EMBED_BATCH_WAIT_MS", 5))
+    )
+
+
+def _open_vector_db():
+    """Open the vector store and profile store and build its indexes. Runs on a loader thread."""
+    from src.database.vector_db import VectorDatabase
+    database = VectorDatabase(defer_embedding_generator=True)
+    database.preload()
+    return database
+
+
+def _open_mail_queue():
+    """Open the durable outbound mail queue. Runs on a loader thread."""
+    return MailQueue(
+        SmtpSettings.from_env(),
+        db_path="data/outreach.sqlite",
+        connections=int(os.environ.get("HIRE3X_SMTP_CONNECTIONS", 4)),
+        rate=float(os.environ.get("HIRE3X_SMTP_RATE", 20)),
+        max_attempts=int(os.environ.get("HIRE3X_SMTP_MAX_ATTEMPTS", 5))
+    )
+
+
+def preload_components():
+    """
+    Load the fork-safe components in a prefork parent so every worker shares their memory.
+    
+    The PyTorch model weights and the numpy vector store (memory-mapped matrix
+    plus in-memory indexes) are loaded once and then shared copy-on-write by
+    the forked workers. ONNX Runtime sessions and ChromaDB clients keep
+    threads or connections that do not survive fork(), so those are left to
+    each worker's own startup.
+    """
+    from src.embeddings.generator import DEFAULT_EMBEDDING_BACKEND
+    from src.database.backends import DEFAULT_BACKEND
+    
+    if DEFAULT_EMBEDDING_BACKEND.lower() == "torch":
+        component_loader.load_now("embedding_model", _load_embedding_generator)
+    if DEFAULT_BACKEND.lower() == "numpy":
+        component_loader.load_now("vector_db", _open_vector_db)
+
+
+def reopen_after_fork():
+    """Replace connections inherited from a prefork parent. Called first thing in each worker."""
+    database = component_loader.loaded("vector_db")
+    if database is not None:
+        database.reopen()
+
+
+async def load_components():
+    """
+    Load the model and open the database concurrently, then build what depends on them.
+    """
+    global embedding_generator, vector_db, candidate_matcher, ingest_jobs, mail_queue
+    from src.matching.hire3x_matcher import Hire3xCandidateMatcher
+    from src.ingest.jobs import IngestJobManager
+
+    try:
+        embedding_generator, vector_db = await asyncio.gather(
+            component_loader.load("embedding_model", _load_embedding_generator),
+            component_loader.load("vector_db", _open_vector_db)
+        )
+        vector_db.attach_embedding_generator(embedding_generator)
+        candidate_matcher = Hire3xCandidateMatcher(vector_db=vector_db)
+
+        # Background ingest jobs with on-disk checkpoints
+        ingest_jobs = await component_loader.load(
+            "ingest_jobs",
+            IngestJobManager,
+            vector_db,
+            "data/ingest",
+            int(os.environ.get("HIRE3X_INGEST_JOB_WORKERS", 1))
+        )
+        mail_queue = await component_loader.load("mail_queue", _open_mail_queue)
+        # Pick up ingest jobs interrupted by the last shutdown or a crashed worker; jobs
+        # another worker is still running hold their lock and are left alone
+        ingest_jobs.resume_pending()
+        # Send queued email (in prefork mode only the first worker does, so none is sent twice)
+        if os.environ.get("HIRE3X_WORKER_INDEX", "0") == "0":
+            mail_queue.start()
+        component_loader.mark_ready()
+    except Exception as e:
+        logger.error(f"Startup failed; the service will report not ready: {e}")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Start loading components without blocking startup, and release them on shutdown."""
+    loader_task = asyncio.create_task(load_components())
+    yield
+    if not loader_task.done():
+        loader_task.cancel()
+    # Let in-flight blocking work finish before the process exits
+    if ingest_jobs is not None:
+        ingest_jobs.shutdown()
+    if mail_queue is not None:
+        mail_queue.shutdown()
+    for executor in executors.values():
+        executor.shutdown()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="Hire3x - AI-Powered Candidate Matching System",
-    description="Match candidates to job descriptions using embeddings, vector search, and Hire3x assessment metrics"
+    description="Match candidates to job descriptions using embeddings, vector search, and Hire3x assessment metrics",
+    lifespan=lifespan
 )
 
 # Add CORS middleware
@@ -40,10 +177,22 @@ app.add_middleware(
 # Mount static files (frontend)
 app.mount("/frontend", StaticFiles(directory="frontend"), name="frontend")
 
-# Initialize components
-embedding_generator = EmbeddingGenerator()
-vector_db = VectorDatabase(embedding_generator=embedding_generator)
-candidate_matcher = Hire3xCandidateMatcher(vector_db=vector_db)
+
+@app.middleware("http")
+async def require_components(request: Request, call_next):
+    """Answer 503 for API calls that need components which are still loading."""
+    if request.url.path.startswith("/api/") and request.url.path not in STARTUP_EXEMPT_PATHS:
+        try:
+            component_loader.check_ready()
+        except ServiceNotReady as e:
+            return JSONResponse(status_code=503, content={"detail": str(e)}, headers={"Retry-After": "5"})
+    return await call_next(request)
+
+
+@app.exception_handler(ExecutorSaturated)
+async def executor_saturated_handler(request, exc: ExecutorSaturated):
+    """Answer 429 when a subsystem has no capacity left."""
+    return JSONResponse(status_code=429, content={"detail": str(exc)}, headers={"Retry-After": "1"})
 
 
 @app.get("/")
@@ -53,10 +202,19 @@ def read_root():
 
 @app.get("/api/health")
 def health_check():
-    """Health check endpoint"""
+    """Liveness check; answers as soon as the process is up, even while components load"""
     return {"status": "healthy", "version": "1.0.0"}
 
 
+@app.get("/api/ready")
+def readiness_check():
+    """
+    Readiness check; 200 once the model and database are loaded, 503 until then.
+    """
+    status = component_loader.status()
+    return JSONResponse(status_code=200 if component_loader.ready else 503, content=status)
+
+
 @app.post("/api/candidates/", response_model=Dict[str, Any])
 async def add_candidate(candidate: Dict[str, Any]):
     """
@@ -70,8 +228,10 @@ async def add_candidate(candidate: Dict[str, Any]):
         # Convert to CandidateProfile for validation
         candidate_obj = CandidateProfile(**candidate)
         
-        vector_db.add_candidate(candidate_obj)
+        await executors["ingest"].run(vector_db.add_candidate, candidate_obj)
         return {"message": f"Candidate {candidate_obj.name} added successfully", "id": candidate_obj.id}
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to add candidate: {str(e)}")
 
@@ -93,12 +253,75 @@ async def add_candidates_batch(candidates: List[Dict[str, Any]]):
             candidate_obj = CandidateProfile(**candidate)
             validated_candidates.append(candidate_obj)
         
-        vector_db.add_candidates_batch(validated_candidates)
+        await executors["ingest"].run(vector_db.add_candidates_batch, validated_candidates)
         return {"message": f"{len(validated_candidates)} candidates added successfully"}
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to add candidates: {str(e)}")
 
 
+@app.put("/api/candidates/{candidate_id}", response_model=Dict[str, Any])
+async def update_candidate(candidate_id: str, candidate: Dict[str, Any]):
+    """
+    Update a candidate, re-embedding only if the profile text changed.
+    """
+    try:
+        candidate["id"] = candidate_id
+        candidate_obj = CandidateProfile(**candidate)
+        result = await executors["ingest"].run(vector_db.upsert_candidates, [candidate_obj])
+        return {"message": f"Candidate {candidate_obj.name} updated successfully", "id": candidate_id, **result}
+    except ExecutorSaturated:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to update candidate: {str(e)}")
+
+
+@app.post("/api/candidates/upsert/", response_model=Dict[str, Any])
+async def upsert_candidates(candidates: List[Dict[str, Any]]):
+    """
+    Insert or update many candidates, e.g. for activity syncs.
+    
+    Only candidates whose profile text changed are re-embedded; the rest get
+    their metadata updated in place.
+    """
+    try:
+        validated_candidates = [CandidateProfile(**candidate) for candidate in candidates]
+        result = await executors["ingest"].run(vector_db.upsert_candidates, validated_candidates)
+        return {"message": f"{len(validated_candidates)} candidates upserted successfully", **result}
+    except ExecutorSaturated:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to upsert candidates: {str(e)}")
+
+
+def _ingest_uploaded_candidates(content: bytes) -> int:
+    """Parse, validate and index an uploaded JSON file. Runs on the ingest executor."""
+    candidates_data = json.loads(content)
+    
+    # Handle both single candidate and array of candidates
+    if isinstance(candidates_data, dict):
+        candidates_data = [candidates_data]
+    
+    # Convert to CandidateProfile objects
+    candidates = []
+    for data in candidates_data:
+        # Ensure each candidate has an ID
+        if "id" not in data:
+            data["id"] = str(uuid.uuid4())
+        
+        # Convert to CandidateProfile for validation
+        try:
+            candidate_obj = CandidateProfile(**data)
+            candidates.append(candidate_obj)
+        except Exception as e:
+            print(f"Error validating candidate: {e}")
+            continue
+    
+    vector_db.add_candidates_batch(candidates)
+    return len(candidates)
+
+
 @app.post("/api/candidates/upload/", response_model=Dict[str, Any])
 async def upload_candidates(
     file: UploadFile = File(...),
@@ -108,34 +331,138 @@ async def upload_candidates(
     """
     try:
         content = await file.read()
-        candidates_data = json.loads(content)
-        
-        # Handle both single candidate and array of candidates
-        if isinstance(candidates_data, dict):
-            candidates_data = [candidates_data]
-        
-        # Convert to CandidateProfile objects
-        candidates = []
-        for data in candidates_data:
-            # Ensure each candidate has an ID
-            if "id" not in data:
-                data["id"] = str(uuid.uuid4())
-            
-            # Convert to CandidateProfile for validation
-            try:
-                candidate_obj = CandidateProfile(**data)
-                candidates.append(candidate_obj)
-            except Exception as e:
-                print(f"Error validating candidate: {e}")
-                continue
-        
-        vector_db.add_candidates_batch(candidates)
+        count = await executors["ingest"].run(_ingest_uploaded_candidates, content)
         
-        return {"message": f"{len(candidates)} candidates uploaded successfully"}
+        return {"message": f"{count} candidates uploaded successfully"}
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to upload candidates: {str(e)}")
 
 
+async def _run_when_free(subsystem: str, fn, *args):
+    """Run blocking work on an executor, waiting for capacity instead of failing with 429."""
+    while True:
+        try:
+            return await executors[subsystem].run(fn, *args)
+        except ExecutorSaturated:
+            await asyncio.sleep(0.1)
+
+
+def _spool_upload(source):
+    """Copy an upload into an anonymous temporary file and rewind it."""
+    spooled = tempfile.TemporaryFile()
+    try:
+        shutil.copyfileobj(source, spooled, 1 << 20)
+        spooled.seek(0)
+    except Exception:
+        spooled.close()
+        raise
+    return spooled
+
+
+@app.post("/api/candidates/stream/")
+async def stream_candidates(
+    file: UploadFile = File(...),
+    chunk_size: int = Query(256, ge=1, le=5000, description="Number of records validated and committed together")
+):
+    """
+    Ingest an NDJSON or JSON-array upload in chunks, streaming progress as NDJSON.
+    
+    Each chunk is committed as soon as it is embedded, so a failure only
+    affects its own chunk. One progress line is emitted per chunk, with the
+    errors of individual records, followed by a summary line.
+    
+    The upload is spooled to a temporary file first, because the form file
+    is closed as soon as this endpoint returns, before the body is streamed.
+    """
+    try:
+        spooled = await _run_when_free("ingest", _spool_upload, file.file)
+    finally:
+        await file.close()
+    chunks = read_chunks(JsonRecordReader(spooled), chunk_size)
+    
+    def next_chunk_progress():
+        chunk = next(chunks, None)
+        return ingest_records(vector_db, chunk) if chunk else None
+    
+    async def progress_lines():
+        totals = {"records": 0, "added": 0, "failed": 0}
+        chunk_number = 0
+        try:
+            while True:
+                progress = await _run_when_free("ingest", next_chunk_progress)
+                if progress is None:
+                    break
+                for key in totals:
+                    totals[key] += progress[key]
+                yield json.dumps({"chunk": chunk_number, **progress}) + "\n"
+                chunk_number += 1
+        except Exception as e:
+            yield json.dumps({"error": f"Ingest aborted: {str(e)}", **totals}) + "\n"
+            return
+        finally:
+            spooled.close()
+        yield json.dumps({"done": True, "chunks": chunk_number, **totals}) + "\n"
+    
+    return StreamingResponse(progress_lines(), media_type="application/x-ndjson")
+
+
+@app.post("/api/ingest/jobs", response_model=Dict[str, str])
+async def submit_ingest_job(file: UploadFile = File(...)):
+    """
+    Queue an NDJSON or JSON-array upload for background ingestion.
+    """
+    try:
+        job_id = await executors["ingest"].run(ingest_jobs.submit, file.file, file.filename or "")
+        return {"job_id": job_id, "status_url": f"/api/ingest/jobs/{job_id}"}
+    except ExecutorSaturated:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to queue ingest job: {str(e)}")
+    finally:
+        await file.close()
+
+
+@app.get("/api/ingest/jobs", response_model=List[Dict[str, Any]])
+async def list_ingest_jobs():
+    """
+    List ingest jobs, newest first.
+    """
+    return ingest_jobs.list_jobs()
+
+
+@app.get("/api/ingest/jobs/{job_id}", response_model=Dict[str, Any])
+async def get_ingest_job(job_id: str):
+    """
+    Get the progress of an ingest job, including per-record errors.
+    """
+    state = ingest_jobs.status(job_id)
+    if not state:
+        raise HTTPException(status_code=404, detail=f"Ingest job {job_id} not found")
+    return state
+
+
+@app.post("/api/ingest/jobs/{job_id}/cancel", response_model=Dict[str, str])
+async def cancel_ingest_job(job_id: str):
+    """
+    Cancel an ingest job after its current chunk.
+    """
+    if not ingest_jobs.cancel(job_id):
+        raise HTTPException(status_code=409, detail=f"Ingest job {job_id} is not queued or running")
+    return {"message": f"Cancellation requested for ingest job {job_id}"}
+
+
+@app.post("/api/ingest/jobs/{job_id}/resume", response_model=Dict[str, str])
+async def resume_ingest_job(job_id: str):
+    """
+    Resume a cancelled or failed ingest job from its last checkpoint.
+    """
+    if not ingest_jobs.resume(job_id):
+        raise HTTPException(status_code=409, detail=f"Ingest job {job_id} is not cancelled or failed")
+    return {"message": f"Ingest job {job_id} resumed"}
+
+
 @app.post("/api/jobs/match/", response_model=List[CandidateMatch])
 async def match_candidates(
     job: JobDescription,
@@ -148,7 +475,8 @@ async def match_candidates(
     Match candidates to a job description.
     """
     try:
-        matches = candidate_matcher.match_candidates(
+        matches = await executors["search"].run(
+            candidate_matcher.match_candidates,
             job=job,
             top_k=top_k,
             min_experience=min_experience,
@@ -156,6 +484,8 @@ async def match_candidates(
             min_assessment_score=min_assessment_score
         )
         return matches
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to match candidates: {str(e)}")
 
@@ -166,15 +496,55 @@ async def get_candidate_profile(candidate_id: str):
     Get the full profile of a candidate by their ID.
     """
     try:
-        profile = candidate_matcher.get_candidate_profile(candidate_id)
+        profile = await executors["search"].run(candidate_matcher.get_candidate_profile, candidate_id)
         if profile:
             return profile
         else:
             raise HTTPException(status_code=404, detail=f"Candidate {candidate_id} not found")
+    except (HTTPException, ExecutorSaturated):
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to get candidate profile: {str(e)}")
 
 
+def _build_email_template(candidate_id: str, job: JobDescription) -> EmailTemplate:
+    """Score a candidate against a job and write the outreach email. Runs on the search executor."""
+    # Score just this candidate rather than searching the whole pool for it
+    candidate_match = candidate_matcher.score_candidate(job, candidate_id)
+    
+    if not candidate_match:
+        # Fallback to just fetching profile
+        profile = candidate_matcher.get_candidate_profile(candidate_id)
+        if not profile:
+            raise HTTPException(status_code=404, detail=f"Candidate {candidate_id} not found")
+    
+        # Create a minimal match object
+        candidate_match = CandidateMatch(
+            candidate_id=profile["id"],
+            candidate_name=profile["name"],
+            headline=profile.get("headline", ""),
+            current_role=profile.get("current_role", ""),
+            similarity_score=0.0,
+            years_of_experience=profile.get("years_of_experience", 0),
+            location=profile.get("location", ""),
+            skills=profile.get("skills", {}),
+            matching_skills=list(profile.get("skills", {}).keys())[:3],
+            overall_score=0.0,
+            ranking_factors={}
+        )
+    
+    email_template = candidate_matcher.generate_email_template(candidate_match, job)
+    
+    # Construct response
+    response = EmailTemplate(
+        to_email=email_template.get("to_email", "candidate@example.com"),
+        subject=email_template.get("subject", ""),
+        body=email_template.get("body", "")
+    )
+    
+    return response
+
+
 @app.post("/api/email/generate", response_model=EmailTemplate)
 async def generate_email(
     candidate_id: str = Body(...),
@@ -184,50 +554,28 @@ async def generate_email(
     Generate an email template for contacting a candidate.
     """
     try:
-        # Get matching result for the candidate
-        matches = candidate_matcher.match_candidates(job, top_k=100)
-        
-        candidate_match = None
-        for match in matches:
-            if match.candidate_id == candidate_id:
-                candidate_match = match
-                break
-                
-        if not candidate_match:
-            # Fallback to just fetching profile
-            profile = candidate_matcher.get_candidate_profile(candidate_id)
-            if not profile:
-                raise HTTPException(status_code=404, detail=f"Candidate {candidate_id} not found")
-                
-            # Create a minimal match object
-            candidate_match = CandidateMatch(
-                candidate_id=profile["id"],
-                candidate_name=profile["name"],
-                headline=profile.get("headline", ""),
-                current_role=profile.get("current_role", ""),
-                similarity_score=0.0,
-                years_of_experience=profile.get("years_of_experience", 0),
-                location=profile.get("location", ""),
-                skills=profile.get("skills", {}),
-                matching_skills=list(profile.get("skills", {}).keys())[:3],
-                overall_score=0.0,
-                ranking_factors={}
-            )
-            
-        email_template = candidate_matcher.generate_email_template(candidate_match, job)
-        
-        # Construct response
-        response = EmailTemplate(
-            to_email=email_template.get("to_email", "candidate@example.com"),
-            subject=email_template.get("subject", ""),
-            body=email_template.get("body", "")
-        )
-        
-        return response
+        return await executors["search"].run(_build_email_template, candidate_id, job)
+    except (HTTPException, ExecutorSaturated):
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to generate email: {str(e)}")
 
 
+def _send_smtp_email(email_data: EmailTemplate, sender_email: str, sender_password: str) -> None:
+    """Deliver one email over SMTP with the sender's own account. Runs on the email executor."""
+    message = build_message(email_data, sender_email)
+    
+    # Connect to the configured SMTP server (HIRE3X_SMTP_HOST etc.), logging in as the sender
+    try:
+        server = open_smtp_session(SmtpSettings.from_env().with_credentials(sender_email, sender_password))
+        try:
+            server.send_message(message)
+        finally:
+            server.quit()
+    except Exception as e:
+        raise HTTPException(status_code=401, detail=f"Failed to authenticate or send email: {str(e)}")
+
+
 @app.post("/api/email/send", response_model=Dict[str, str])
 async def send_email(
     email_data: EmailTemplate,
@@ -238,30 +586,119 @@ async def send_email(
     Send an email to a candidate (requires email credentials).
     """
     try:
-        # Create a MIME email
-        message = MIMEMultipart()
-        message["From"] = sender_email
-        message["To"] = email_data.to_email
-        message["Subject"] = email_data.subject
-        
-        # Attach the body
-        message.attach(MIMEText(email_data.body, "plain"))
+        await executors["email"].run(_send_smtp_email, email_data, sender_email, sender_password)
+        return {"message": f"Email sent successfully to {email_data.to_email}"}
+    except (HTTPException, ExecutorSaturated):
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to send email: {str(e)}")
+
+
+@app.post("/api/email/batch", response_model=Dict[str, Any])
+async def queue_emails(emails: List[EmailTemplate] = Body(..., min_length=1)):
+    """
+    Queue a batch of emails for delivery from the configured outreach account.
+    
+    The emails are stored durably before this returns and are sent in the
+    background over pooled SMTP sessions; poll the batch for delivery status.
+    """
+    try:
+        queued = await executors["email"].run(mail_queue.enqueue, emails)
+        return {"batch_id": queued["batch_id"], "queued": len(emails), "message_ids": queued["message_ids"]}
+    except ExecutorSaturated:
+        raise
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to queue emails: {str(e)}")
+
+
+@app.get("/api/email/batches/{batch_id}", response_model=Dict[str, Any])
+async def get_email_batch(batch_id: str):
+    """
+    Get the delivery status of a queued batch of emails.
+    """
+    status = await executors["email"].run(mail_queue.batch_status, batch_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Email batch {batch_id} not found")
+    return status
+
+
+@app.get("/api/email/messages/{message_id}", response_model=Dict[str, Any])
+async def get_email_message(message_id: str):
+    """
+    Get the delivery status of one queued email.
+    """
+    status = await executors["email"].run(mail_queue.message_status, message_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail=f"Email {message_id} not found")
+    return status
+
+
+@app.get("/api/email/queue-stats", response_model=Dict[str, int])
+async def get_email_queue_stats():
+    """
+    Get the number of queued, sending, sent and failed emails.
+    """
+    return await executors["email"].run(mail_queue.stats)
+
+
+def _fetch_profiles(candidate_ids: List[str]) -> Dict[str, Optional[Dict[str, Any]]]:
+    """Look up several candidate profiles. Runs on the search executor."""
+    return {candidate_id: candidate_matcher.get_candidate_profile(candidate_id) for candidate_id in candidate_ids}
+
+
+@app.post("/api/candidates/export-pdf/bulk")
+async def export_candidate_pdfs(candidate_ids: List[str] = Body(..., min_length=1)):
+    """
+    Export a shortlist of candidate profiles as a ZIP of PDFs, streamed as it is built.
+    
+    Up to as many PDFs as the pdf executor has workers render concurrently
+    ahead of the one being streamed; cached PDFs are not rendered again.
+    Candidates whose PDF fails to render are listed in errors.txt in the archive.
+    """
+    candidate_ids = list(dict.fromkeys(candidate_ids))
+    profiles = await executors["search"].run(_fetch_profiles, candidate_ids)
+    missing = [candidate_id for candidate_id, profile in profiles.items() if not profile]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Candidates not found: {', '.join(missing)}")
+    
+    async def archive_chunks():
+        archive = ZipStream()
+        renders = {}
+        errors = []
         
-        # Connect to SMTP server (using Gmail as an example)
-        server = smtplib.SMTP("smtp.gmail.com", 587)
-        server.starttls()
+        def start_render(candidate_id):
+            renders[candidate_id] = asyncio.ensure_future(
+                _run_when_free("pdf", pdf_renderer.render, profiles[candidate_id], candidate_id)
+            )
         
-        # Login and send
+        ahead = executors["pdf"].max_workers
         try:
-            server.login(sender_email, sender_password)
-            server.send_message(message)
-            server.quit()
-            return {"message": f"Email sent successfully to {email_data.to_email}"}
-        except Exception as e:
-            raise HTTPException(status_code=401, detail=f"Failed to authenticate or send email: {str(e)}")
-            
-    except Exception as e:
-        raise HTTPException(status_code=400, detail=f"Failed to send email: {str(e)}")
+            for candidate_id in candidate_ids[:ahead]:
+                start_render(candidate_id)
+            for position, candidate_id in enumerate(candidate_ids):
+                if position + ahead < len(candidate_ids):
+                    start_render(candidate_ids[position + ahead])
+                try:
+                    pdf_filename = await renders.pop(candidate_id)
+                except Exception as e:
+                    errors.append(f"{candidate_id}: {e}")
+                    continue
+                yield await asyncio.to_thread(archive.add_file, pdf_filename, f"candidate_{candidate_id}.pdf")
+            if errors:
+                yield archive.add_bytes("errors.txt", "\n".join(errors).encode())
+            yield archive.close()
+        finally:
+            # Stop rendering ahead if the client went away
+            for render in renders.values():
+                render.cancel()
+    
+    return StreamingResponse(
+        archive_chunks(),
+        media_type="application/zip",
+        headers={"Content-Disposition": 'attachment; filename="candidates.zip"'}
+    )
 
 
 @app.post("/api/candidates/export-pdf/{candidate_id}", response_model=Dict[str, str])
@@ -271,111 +708,21 @@ async def export_candidate_pdf(
 ):
     """
     Export a candidate profile as PDF.
+    
+    The PDF is only rendered if the profile (or the template) changed since
+    it was last rendered.
     """
     try:
-        profile = candidate_matcher.get_candidate_profile(candidate_id)
+        profile = await executors["search"].run(candidate_matcher.get_candidate_profile, candidate_id)
         if not profile:
             raise HTTPException(status_code=404, detail=f"Candidate {candidate_id} not found")
             
-        # Generate HTML content for the PDF
-        html_content = f"""
-        <html>
-        <head>
-            <style>
-                body {{ font-family: Arial, sans-serif; margin: 20px; }}
-                h1 {{ color: #333366; }}
-                h2 {{ color: #336699; border-bottom: 1px solid #ccc; padding-bottom: 5px; margin-top: 20px; }}
-                .summary {{ background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin: 10px 0; }}
-                .skills {{ display: flex; flex-wrap: wrap; margin: 10px 0; }}
-                .skill {{ background-color: #e1e1e1; padding: 5px 10px; margin: 5px; border-radius: 15px; }}
-                .assessment {{ background-color: #e1f5fe; padding: 10px; margin: 10px 0; border-radius: 5px; }}
-                .experience {{ margin-bottom: 15px; }}
-                .contact {{ background-color: #f9f9f9; padding: 10px; border-radius: 5px; }}
-            </style>
-        </head>
-        <body>
-            <h1>{profile.get('name', 'Candidate Profile')}</h1>
-            <div class="contact">
-                <p><strong>Email:</strong> {profile.get('email', 'N/A')}</p>
-                <p><strong>Phone:</strong> {profile.get('phone', 'N/A')}</p>
-                <p><strong>Location:</strong> {profile.get('location', 'N/A')}</p>
-                <p><strong>Current Role:</strong> {profile.get('current_role', 'N/A')}</p>
-                <p><strong>Years of Experience:</strong> {profile.get('years_of_experience', 'N/A')}</p>
-            </div>
-            
-            <h2>Summary</h2>
-            <div class="summary">
-                <p>{profile.get('summary', 'No summary available.')}</p>
-            </div>
-            
-            <h2>Skills</h2>
-            <div class="skills">
-        """
-        
-        # Add skills
-        for skill, proficiency in profile.get('skills', {}).items():
-            html_content += f'<div class="skill">{skill} ({int(proficiency * 100)}%)</div>'
-            
-        html_content += """
-            </div>
-            
-            <h2>Experience</h2>
-        """
-        
-        # Add experience
-        for exp in profile.get('experience', []):
-            html_content += f"""
-            <div class="experience">
-                <h3>{exp.get('role', 'Role')} at {exp.get('company', 'Company')}</h3>
-                <p>{exp.get('description', 'No description available.')}</p>
-                <p><strong>Skills Used:</strong> {', '.join(exp.get('skills_used', []))}</p>
-                <p><strong>Achievements:</strong></p>
-                <ul>
-            """
-            
-            for achievement in exp.get('achievements', []):
-                html_content += f'<li>{achievement}</li>'
-                
-            html_content += """
-                </ul>
-            </div>
-            """
-            
-        # Add education
-        html_content += "<h2>Education</h2>"
-        for edu in profile.get('education', []):
-            html_content += f"""
-            <div class="education">
-                <p><strong>{edu.get('degree', 'Degree')}</strong> in {edu.get('field_of_study', 'Field')}</p>
-                <p>{edu.get('institution', 'Institution')}, {edu.get('graduation_year', 'Year')}</p>
-            </div>
-            """
-            
-        # Add Hire3x assessments
-        html_content += "<h2>Hire3x Assessments</h2>"
-        for assessment in profile.get('hire3x_data', {}).get('assessments', []):
-            html_content += f"""
-            <div class="assessment">
-                <h3>{assessment.get('name', 'Assessment')}</h3>
-                <p><strong>Score:</strong> {assessment.get('score', 'N/A')}/100 ({assessment.get('percentile', 'N/A')}th percentile)</p>
-                <p><strong>Skills Evaluated:</strong> {', '.join(assessment.get('skills_evaluated', []))}</p>
-                <p><strong>Completion Time:</strong> {assessment.get('completion_time', 'N/A')} minutes (of {assessment.get('allowed_time', 'N/A')} allowed)</p>
-                <p><strong>Accuracy:</strong> {int(assessment.get('accuracy', 0) * 100)}%</p>
-            </div>
-            """
-            
-        # Close HTML
-        html_content += """
-        </body>
-        </html>
-        """
-        
-        # Generate PDF
-        pdf_filename = f"pdfs/candidate_{candidate_id}.pdf"
-        pdfkit.from_string(html_content, pdf_filename)
+        pdf_filename = await executors["pdf"].run(pdf_renderer.render, profile, candidate_id)
         
         # Return success response with the file path
         return {"message": "PDF generated successfully", "filename": pdf_filename}
+    except (HTTPException, ExecutorSaturated):
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to generate PDF: {str(e)}")
 
@@ -383,13 +730,29 @@ async def export_candidate_pdf(
 @app.get("/api/candidates/pdf/{candidate_id}")
 async def get_candidate_pdf(candidate_id: str):
     """
-    Get the generated PDF for a candidate.
+    Get the PDF of a candidate's current profile, rendering it if it is not cached.
     """
-    pdf_filename = f"pdfs/candidate_{candidate_id}.pdf"
-    if os.path.exists(pdf_filename):
+    try:
+        profile = await executors["search"].run(candidate_matcher.get_candidate_profile, candidate_id)
+        if not profile:
+            raise HTTPException(status_code=404, detail=f"Candidate {candidate_id} not found")
+        
+        pdf_filename = pdf_renderer.cached(profile, candidate_id)
+        if pdf_filename is None:
+            pdf_filename = await executors["pdf"].run(pdf_renderer.render, profile, candidate_id)
         return FileResponse(pdf_filename, media_type="application/pdf", filename=f"candidate_{candidate_id}.pdf")
-    else:
-        raise HTTPException(status_code=404, detail="PDF not found. Please generate it first.")
+    except (HTTPException, ExecutorSaturated):
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=400, detail=f"Failed to generate PDF: {str(e)}")
+
+
+@app.get("/api/pdf/cache-stats", response_model=Dict[str, int])
+async def get_pdf_cache_stats():
+    """
+    Get PDF cache hits and renders.
+    """
+    return pdf_renderer.stats()
 
 
 @app.get("/api/candidates/count/", response_model=Dict[str, int])
@@ -398,19 +761,55 @@ async def get_candidate_count():
     Get the number of candidates in the database.
     """
     try:
-        count = vector_db.get_candidate_count()
+        count = await executors["search"].run(vector_db.get_candidate_count)
         return {"count": count}
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to get candidate count: {str(e)}")
 
 
+@app.get("/api/embeddings/cache-stats", response_model=Dict[str, int])
+async def get_embedding_cache_stats():
+    """
+    Get hit/miss counters for the embedding cache.
+    """
+    return embedding_generator.get_cache_stats()
+
+
+@app.get("/api/embeddings/batching-stats", response_model=Dict[str, Any])
+async def get_embedding_batching_stats():
+    """
+    Get batch-size and queue-wait histograms for query embedding coalescing.
+    """
+    return embedding_generator.get_batching_stats()
+
+
+@app.get("/api/jobs/match/cache-stats", response_model=Dict[str, int])
+async def get_match_cache_stats():
+    """
+    Get hit/miss counters for the match result cache.
+    """
+    return candidate_matcher.result_cache.stats()
+
+
+@app.get("/api/executors/stats", response_model=Dict[str, Dict[str, int]])
+async def get_executor_stats():
+    """
+    Get the load of each blocking-work executor.
+    """
+    return {name: executor.stats() for name, executor in executors.items()}
+
+
 @app.delete("/api/candidates/{candidate_id}", response_model=Dict[str, str])
 async def delete_candidate(candidate_id: str):
     """
     Delete a candidate from the system.
     """
     try:
-        vector_db.delete_candidate(candidate_id)
+        await executors["ingest"].run(vector_db.delete_candidate, candidate_id)
         return {"message": f"Candidate {candidate_id} deleted successfully"}
+    except ExecutorSaturated:
+        raise
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Failed to delete candidate: {str(e)}")
\ No newline at end of file
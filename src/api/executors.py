@@ -0,0 +1,100 @@
+import os
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict
+import logging
+
+# Configure logging
+logger = logging.getLogger("hire3x.executors")
+
+
+class ExecutorSaturated(Exception):
+    """Raised when a subsystem executor has no free worker or queue slot."""
+
+    def __init__(self, name: str):
+        super().__init__(f"The {name} subsystem is at capacity, please retry shortly")
+        self.name = name
+
+
+class SubsystemExecutor:
+    def __init__(self, name: str, max_workers: int, max_queue: int):
+        """
+        Initialize a bounded thread pool for one blocking subsystem.
+
+        At most ``max_workers`` calls run at once and at most ``max_queue`` more
+        wait for a worker. Further calls are rejected immediately with
+        ExecutorSaturated so the API can answer 429 instead of piling up work.
+
+        Args:
+            name: Subsystem name used in logs and errors
+            max_workers: Number of worker threads
+            max_queue: Number of calls allowed to wait for a worker
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"hire3x-{name}")
+        self._in_flight = 0
+        self.rejected = 0
+
+    async def run(self, fn: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Run a blocking callable on the pool without blocking the event loop.
+
+        Args:
+            fn: The blocking function
+            *args: Positional arguments for ``fn``
+            **kwargs: Keyword arguments for ``fn``
+
+        Returns:
+            The return value of ``fn``
+        """
+        # Only touched from the event loop thread, so no lock is needed
+        if self._in_flight >= self.max_workers + self.max_queue:
+            self.rejected += 1
+            logger.warning(f"Rejecting {self.name} call: {self._in_flight} calls in flight")
+            raise ExecutorSaturated(self.name)
+
+        self._in_flight += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, functools.partial(fn, *args, **kwargs))
+        finally:
+            self._in_flight -= 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the current load of the executor.
+
+        Returns:
+            Dictionary with in-flight, capacity and rejection counts
+        """
+        return {
+            "in_flight": self._in_flight,
+            "max_workers": self.max_workers,
+            "max_queue": self.max_queue,
+            "rejected": self.rejected
+        }
+
+    def shutdown(self) -> None:
+        """Stop accepting work and wait for running calls to finish."""
+        self._pool.shutdown(wait=True)
+
+
+def create_executor(name: str, default_workers: int, default_queue: int) -> SubsystemExecutor:
+    """
+    Create a subsystem executor sized from HIRE3X_<NAME>_WORKERS / HIRE3X_<NAME>_QUEUE.
+
+    Args:
+        name: Subsystem name
+        default_workers: Worker count if the environment does not set one
+        default_queue: Queue length if the environment does not set one
+
+    Returns:
+        The executor
+    """
+    prefix = f"HIRE3X_{name.upper()}"
+    workers = int(os.environ.get(f"{prefix}_WORKERS", default_workers))
+    queue = int(os.environ.get(f"{prefix}_QUEUE", default_queue))
+    return SubsystemExecutor(name, workers, queue)
@@ -0,0 +1,191 @@
+import os
+import gc
+import sys
+import time
+import signal
+import socket
+import importlib
+from typing import Dict, Optional
+import logging
+
+# Configure logging
+logger = logging.getLogger("hire3x.prefork")
+
+# Workers that exit sooner than this after starting are restarted with a delay
+MIN_WORKER_UPTIME = 5.0
+
+
+def create_listening_socket(host: str, port: int, backlog: int = 2048) -> socket.socket:
+    """
+    Bind the server socket once in the parent so every worker accepts on it.
+
+    Args:
+        host: Host to listen on
+        port: Port to listen on
+        backlog: Listen backlog
+
+    Returns:
+        The listening socket
+    """
+    family = socket.AF_INET6 if ":" in host else socket.AF_INET
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    sock.set_inheritable(True)
+    return sock
+
+
+class PreforkServer:
+    def __init__(
+        self,
+        app_path: str,
+        host: str = "0.0.0.0",
+        port: int = 8000,
+        workers: int = 2,
+        log_level: str = "info",
+        graceful_timeout: int = 30
+    ):
+        """
+        Initialize a preforking launcher for the API.
+
+        The parent imports the app and calls its module's ``preload_components``
+        (if any) so the embedding weights and vector matrix are loaded once.
+        It then freezes the garbage collector's view of those objects and forks
+        the workers. Each worker shares the preloaded pages copy-on-write
+        instead of loading its own copy, calls ``reopen_after_fork`` (if any)
+        to replace inherited connections, and serves the shared socket with
+        uvicorn. Crashed workers are restarted.
+
+        Args:
+            app_path: App to serve as "module:attribute"
+            host: Host to listen on
+            port: Port to listen on
+            workers: Number of worker processes
+            log_level: uvicorn log level
+            graceful_timeout: Seconds workers get to finish after SIGTERM before being killed
+        """
+        if not hasattr(os, "fork"):
+            raise RuntimeError("Prefork serving requires os.fork (not available on this platform)")
+        self.app_path = app_path
+        self.host = host
+        self.port = port
+        self.workers = workers
+        self.log_level = log_level
+        self.graceful_timeout = graceful_timeout
+
+        self._app_module = None
+        self._app = None
+        self._socket: Optional[socket.socket] = None
+        self._children: Dict[int, int] = {}
+        self._started: Dict[int, float] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        """Preload, fork the workers and supervise them until SIGINT or SIGTERM."""
+        self._socket = create_listening_socket(self.host, self.port)
+        logger.info(f"Listening on http://{self.host}:{self.port} with {self.workers} workers")
+
+        module_name, attribute = self.app_path.split(":", 1)
+        self._app_module = importlib.import_module(module_name)
+        self._app = getattr(self._app_module, attribute)
+
+        started = time.perf_counter()
+        preload = getattr(self._app_module, "preload_components", None)
+        if preload:
+            preload()
+        logger.info(f"Preloaded shared components in {time.perf_counter() - started:.2f}s")
+
+        # Keep the preloaded objects out of the children's garbage collections,
+        # which would otherwise write to (and so un-share) their pages
+        gc.collect()
+        gc.freeze()
+
+        signal.signal(signal.SIGTERM, self._handle_stop)
+        signal.signal(signal.SIGINT, self._handle_stop)
+        signal.signal(signal.SIGALRM, self._handle_kill)
+
+        for index in range(self.workers):
+            self._spawn(index)
+        self._supervise()
+        self._socket.close()
+        logger.info("All workers stopped")
+
+    def _spawn(self, index: int) -> None:
+        """Fork one worker process."""
+        pid = os.fork()
+        if pid == 0:
+            exit_code = 1
+            try:
+                self._serve(index)
+                exit_code = 0
+            except BaseException:
+                logger.exception(f"Worker {index} crashed")
+            finally:
+                os._exit(exit_code)
+
+        self._children[pid] = index
+        self._started[pid] = time.monotonic()
+        logger.info(f"Started worker {index} (pid {pid})")
+
+    def _serve(self, index: int) -> None:
+        """Body of a worker process: reset inherited state and run uvicorn on the shared socket."""
+        signal.signal(signal.SIGTERM, signal.SIG_DFL)
+        signal.signal(signal.SIGINT, signal.SIG_DFL)
+        signal.signal(signal.SIGALRM, signal.SIG_DFL)
+        os.environ["HIRE3X_WORKER_INDEX"] = str(index)
+
+        # Split the cores between workers instead of each using all of them
+        torch = sys.modules.get("torch")
+        if torch is not None:
+            torch.set_num_threads(max(1, (os.cpu_count() or 1) // self.workers))
+
+        reopen = getattr(self._app_module, "reopen_after_fork", None)
+        if reopen:
+            reopen()
+
+        import uvicorn
+        config = uvicorn.Config(self._app, log_level=self.log_level, lifespan="on")
+        uvicorn.Server(config).run(sockets=[self._socket])
+
+    def _supervise(self) -> None:
+        """Wait for workers to exit, restarting them unless the server is stopping."""
+        while self._children:
+            try:
+                pid, status = os.wait()
+            except ChildProcessError:
+                break
+            index = self._children.pop(pid, None)
+            if index is None:
+                continue
+            uptime = time.monotonic() - self._started.pop(pid)
+            if self._stopping:
+                continue
+
+            logger.warning(f"Worker {index} (pid {pid}) exited with status {status} after {uptime:.1f}s; restarting")
+            if uptime < MIN_WORKER_UPTIME:
+                # Back off so a worker that cannot start does not spin
+                time.sleep(1.0)
+            self._spawn(index)
+
+    def _handle_stop(self, signum, frame) -> None:
+        """Ask every worker to shut down gracefully."""
+        if self._stopping:
+            return
+        self._stopping = True
+        logger.info(f"Stopping {len(self._children)} workers")
+        for pid in list(self._children):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+        signal.alarm(self.graceful_timeout)
+
+    def _handle_kill(self, signum, frame) -> None:
+        """Kill workers that did not finish within the graceful timeout."""
+        for pid in list(self._children):
+            logger.warning(f"Killing worker pid {pid} after {self.graceful_timeout}s")
+            try:
+                os.kill(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
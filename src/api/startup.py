@@ -0,0 +1,156 @@
+import time
+import asyncio
+import threading
+from typing import Any, Callable, Dict, Optional
+import logging
+
+# Configure logging
+logger = logging.getLogger("hire3x.startup")
+
+# Component states
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class ServiceNotReady(Exception):
+    """Raised when a request needs components that are still loading or failed to load."""
+
+    def __init__(self, error: Optional[str] = None):
+        if error:
+            super().__init__(f"The service failed to start: {error}")
+        else:
+            super().__init__("The service is starting up, please retry shortly")
+        self.error = error
+
+
+class ComponentLoader:
+    def __init__(self):
+        """
+        Initialize tracking of components loaded in the background at startup.
+
+        Each component is loaded on a worker thread so that independent
+        components (the embedding model, the vector store) load concurrently
+        while the event loop keeps answering liveness checks. The loader is
+        ready once ``mark_ready`` is called after every component has loaded.
+        """
+        self._lock = threading.Lock()
+        self._components: Dict[str, Dict[str, Any]] = {}
+        self._loaded: Dict[str, Any] = {}
+        self._ready = threading.Event()
+        self._error: Optional[str] = None
+        self._started_at = time.time()
+
+    async def load(self, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Load one component on a worker thread, recording its state and load time.
+
+        Args:
+            name: Component name reported by ``status``
+            fn: Blocking function building the component
+            *args: Positional arguments for ``fn``
+
+        Returns:
+            The component returned by ``fn``
+        """
+        return await asyncio.to_thread(self.load_now, name, fn, *args)
+
+    def load_now(self, name: str, fn: Callable[..., Any], *args: Any) -> Any:
+        """
+        Load one component on the calling thread, e.g. in a prefork parent before forking.
+
+        A component that is already loaded (including one loaded before the
+        fork) is returned as is instead of being loaded again.
+
+        Args:
+            name: Component name reported by ``status``
+            fn: Blocking function building the component
+            *args: Positional arguments for ``fn``
+
+        Returns:
+            The component returned by ``fn``
+        """
+        with self._lock:
+            if name in self._loaded:
+                return self._loaded[name]
+            self._components[name] = {"status": LOADING, "seconds": None, "error": None}
+
+        started = time.perf_counter()
+        try:
+            component = fn(*args)
+        except Exception as e:
+            logger.error(f"Failed to load {name}: {e}")
+            with self._lock:
+                self._components[name].update(status=FAILED, error=str(e))
+                self._error = f"{name}: {e}"
+            raise
+
+        elapsed = time.perf_counter() - started
+        with self._lock:
+            self._components[name].update(status=READY, seconds=round(elapsed, 3))
+            self._loaded[name] = component
+        logger.info(f"Loaded {name} in {elapsed:.2f}s")
+        return component
+
+    def loaded(self, name: str) -> Optional[Any]:
+        """
+        Get a component that has finished loading.
+
+        Args:
+            name: Component name
+
+        Returns:
+            The component, or None if it is not loaded
+        """
+        with self._lock:
+            return self._loaded.get(name)
+
+    def mark_ready(self) -> None:
+        """Record that every component has loaded."""
+        self._ready.set()
+        logger.info(f"All components ready {time.time() - self._started_at:.2f}s after startup")
+
+    @property
+    def ready(self) -> bool:
+        """Whether every component has loaded."""
+        return self._ready.is_set()
+
+    def check_ready(self) -> None:
+        """Raise ServiceNotReady unless every component has loaded."""
+        if not self._ready.is_set():
+            raise ServiceNotReady(self._error)
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until every component has loaded.
+
+        Args:
+            timeout: Seconds to wait (forever if omitted)
+
+        Returns:
+            True if the components are ready
+        """
+        return self._ready.wait(timeout)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Get the readiness of the service and the state of each component.
+
+        Returns:
+            Dictionary with the overall status, uptime and per-component states
+        """
+        with self._lock:
+            components = {name: dict(state) for name, state in self._components.items()}
+        if self._ready.is_set():
+            status = READY
+        elif self._error:
+            status = FAILED
+        else:
+            status = LOADING if components else PENDING
+        return {
+            "status": status,
+            "uptime_seconds": round(time.time() - self._started_at, 3),
+            "components": components,
+            "error": self._error
+        }
@@ -1,4 +1,5 @@
-from typing import List, Optional, Dict, Any, Union, TypeVar, cast
+from typing import List, Optional, Dict, Any, Union, TypeVar, Tuple, cast
+import hashlib
 from pydantic import BaseModel, Field
 
 # Define a Float type alias for clarity (instead of using the non-existent Float from typing)
@@ -56,8 +57,8 @@ class Course(BaseModel):
     completion_status: str
     completion_date: Optional[str] = None
     assignments_total: int
-    assignment_avg_score: float
-    instructor_evaluation: float
+    assignment_avg_score: Optional[float] = None  # None while the course is in progress
+    instructor_evaluation: Optional[float] = None
     capstone_project_score: Optional[float] = None
 
 
@@ -116,7 +117,53 @@ class CandidateProfile(BaseModel):
     
     def to_text(self) -> str:
         """Convert the candidate profile to a text representation for embedding."""
-        text_parts = [
+        text_parts = self._overview_lines() + self._education_lines()
+        
+        # Add work experience
+        text_parts.append("Work Experience:")
+        for exp in self.experience:
+            text_parts.extend(self._experience_lines(exp, indent="  "))
+        
+        text_parts.extend(self._project_lines())
+        text_parts.extend(self._certification_lines())
+        text_parts.extend(self._assessment_lines())
+        text_parts.extend(self._course_lines())
+        
+        return "\n".join(text_parts)
+
+    def to_sections(self) -> List[Tuple[str, str]]:
+        """
+        Split the profile into separately embeddable sections.
+
+        Each section stays well under the embedding model's sequence limit,
+        unlike ``to_text()`` which is truncated for long profiles. Sections
+        are built from the same formatters as ``to_text()``.
+
+        Returns:
+            List of (section name, text) pairs: "profile", one "experience:<i>"
+            per work experience entry, then "projects" and "assessments" if present
+        """
+        sections = [("profile", "\n".join(self._overview_lines() + self._education_lines()))]
+
+        for i, exp in enumerate(self.experience):
+            sections.append((f"experience:{i}", "\n".join(self._experience_lines(exp))))
+
+        if self.projects:
+            sections.append(("projects", "\n".join(self._project_lines())))
+
+        assessment_parts = self._certification_lines()
+        if self.hire3x_data.assessments:
+            assessment_parts.extend(self._assessment_lines())
+        if self.hire3x_data.courses:
+            assessment_parts.extend(self._course_lines())
+        if assessment_parts:
+            sections.append(("assessments", "\n".join(assessment_parts)))
+
+        return sections
+
+    def _overview_lines(self) -> List[str]:
+        """Headline fields of the profile."""
+        return [
             f"Name: {self.name}",
             f"Headline: {self.headline}",
             f"Summary: {self.summary}",
@@ -127,51 +174,67 @@ class CandidateProfile(BaseModel):
             f"Desired Role: {self.desired_role}" if self.desired_role else "",
             f"Preferred Work Type: {self.preferred_work_type}" if self.preferred_work_type else ""
         ]
-        
-        # Add education
-        text_parts.append("Education:")
+
+    def _education_lines(self) -> List[str]:
+        """Education entries under an "Education:" heading."""
+        lines = ["Education:"]
         for edu in self.education:
             grad_year = f", {edu.graduation_year}" if edu.graduation_year else ""
-            text_parts.append(f"  {edu.degree} in {edu.field_of_study} from {edu.institution}{grad_year}")
-        
-        # Add work experience
-        text_parts.append("Work Experience:")
-        for exp in self.experience:
-            current = "(Current)" if exp.current else ""
-            text_parts.append(f"  {exp.role} at {exp.company} {current}")
-            text_parts.append(f"  Description: {exp.description}")
-            text_parts.append(f"  Skills Used: {', '.join(exp.skills_used)}")
-            if exp.achievements:
-                text_parts.append(f"  Achievements: {', '.join(exp.achievements)}")
-        
-        # Add projects
-        if self.projects:
-            text_parts.append("Projects:")
-            for project in self.projects:
-                text_parts.append(f"  {project.name}: {project.description}")
-                text_parts.append(f"  Technologies: {', '.join(project.technologies)}")
-        
-        # Add certifications
-        if self.certifications:
-            text_parts.append("Certifications:")
-            for cert in self.certifications:
-                text_parts.append(f"  {cert.name}")
-                text_parts.append(f"  Skills Validated: {', '.join(cert.skills_validated)}")
-        
-        # Add Hire3x assessments
-        text_parts.append("Hire3x Assessments:")
+            lines.append(f"  {edu.degree} in {edu.field_of_study} from {edu.institution}{grad_year}")
+        return lines
+
+    @staticmethod
+    def _experience_lines(exp: WorkExperience, indent: str = "") -> List[str]:
+        """One work experience entry, each line prefixed with ``indent``."""
+        current = "(Current)" if exp.current else ""
+        lines = [
+            f"{exp.role} at {exp.company} {current}",
+            f"Description: {exp.description}",
+            f"Skills Used: {', '.join(exp.skills_used)}"
+        ]
+        if exp.achievements:
+            lines.append(f"Achievements: {', '.join(exp.achievements)}")
+        return [indent + line for line in lines]
+
+    def _project_lines(self) -> List[str]:
+        """Projects under a "Projects:" heading, or nothing if there are none."""
+        if not self.projects:
+            return []
+        lines = ["Projects:"]
+        for project in self.projects:
+            lines.append(f"  {project.name}: {project.description}")
+            lines.append(f"  Technologies: {', '.join(project.technologies)}")
+        return lines
+
+    def _certification_lines(self) -> List[str]:
+        """Certifications under a "Certifications:" heading, or nothing if there are none."""
+        if not self.certifications:
+            return []
+        lines = ["Certifications:"]
+        for cert in self.certifications:
+            lines.append(f"  {cert.name}")
+            lines.append(f"  Skills Validated: {', '.join(cert.skills_validated)}")
+        return lines
+
+    def _assessment_lines(self) -> List[str]:
+        """Hire3x assessment results under a "Hire3x Assessments:" heading."""
+        lines = ["Hire3x Assessments:"]
         for assessment in self.hire3x_data.assessments:
-            text_parts.append(f"  {assessment.name}: Score {assessment.score}/100, {assessment.percentile}th percentile")
-            text_parts.append(f"  Skills Evaluated: {', '.join(assessment.skills_evaluated)}")
-            text_parts.append(f"  Completion Time: {assessment.completion_time} minutes (of {assessment.allowed_time} allowed)")
-        
-        # Add courses
-        text_parts.append("Courses Completed:")
+            lines.append(f"  {assessment.name}: Score {assessment.score}/100, {assessment.percentile}th percentile")
+            lines.append(f"  Skills Evaluated: {', '.join(assessment.skills_evaluated)}")
+            lines.append(f"  Completion Time: {assessment.completion_time} minutes (of {assessment.allowed_time} allowed)")
+        return lines
+
+    def _course_lines(self) -> List[str]:
+        """Hire3x courses under a "Courses Completed:" heading; in-progress courses have no score yet."""
+        lines = ["Courses Completed:"]
         for course in self.hire3x_data.courses:
-            text_parts.append(f"  {course.name} ({course.category}): Score {course.assignment_avg_score}/100")
-        
-        return "\n".join(text_parts)
-    
+            if course.assignment_avg_score is None:
+                lines.append(f"  {course.name} ({course.category}): {course.completion_status}")
+            else:
+                lines.append(f"  {course.name} ({course.category}): Score {course.assignment_avg_score}/100")
+        return lines
+
     def get_metadata(self) -> Dict[str, Any]:
         """Extract metadata for storage in ChromaDB."""
         # Basic metadata
@@ -296,6 +359,10 @@ class JobDescription(BaseModel):
             text_parts.append(f"Salary Range: ${self.salary_range['min']:,} - ${self.salary_range['max']:,}")
         
         return "\n".join(text_parts)
+    
+    def content_hash(self) -> str:
+        """Hash of every field of the job description, used as a cache key."""
+        return hashlib.sha256(self.model_dump_json().encode("utf-8")).hexdigest()
 
 
 class CandidateMatch(BaseModel):
@@ -0,0 +1,934 @@
+import os
+import json
+import mmap
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import List, Dict, Any, Optional, Callable, Set
+from contextlib import contextmanager
+import numpy as np
+import logging
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# Configure logging
+logger = logging.getLogger("hire3x.vector_backends")
+
+# Backend used when none is configured explicitly
+DEFAULT_BACKEND = os.environ.get("HIRE3X_VECTOR_BACKEND", "chroma")
+
+# Largest pre-filtered ID list pushed into a ChromaDB "$in" clause
+CHROMA_MAX_FILTER_IDS = 10000
+
+# In-memory vector format of the numpy backend: None (float32), "float16" or "int8"
+DEFAULT_QUANTIZATION = os.environ.get("HIRE3X_VECTOR_QUANTIZATION") or None
+QUANTIZATION_MODES = ("float16", "int8")
+
+# Entries kept in the numpy backend's change log; a process further behind reloads everything
+CHANGE_LOG_ROWS = 100000
+
+# Refreshes remembered for changed_since; a reader further behind rebuilds everything
+CHANGE_HISTORY = 64
+
+
+def mapped_resident_bytes(path: str) -> Optional[int]:
+    """
+    Bytes of a file's memory mappings resident in this process, from /proc/self/smaps.
+
+    Args:
+        path: Path of the mapped file
+
+    Returns:
+        Resident bytes, or None where /proc is not available
+    """
+    path = os.path.realpath(path)
+    try:
+        resident = 0
+        in_mapping = False
+        with open("/proc/self/smaps") as f:
+            for line in f:
+                fields = line.split()
+                if fields and "-" in fields[0] and len(fields) >= 5:
+                    # Mapping header: address range, permissions, offset, device, inode, path
+                    in_mapping = len(fields) >= 6 and fields[5] == path
+                elif in_mapping and fields[0] == "Rss:":
+                    resident += int(fields[1]) * 1024
+        return resident
+    except OSError:
+        return None
+
+
+class VectorBackend(ABC):
+    """
+    Storage and nearest-neighbour search for candidate vectors.
+
+    Query results use the ChromaDB result layout (one inner list per query) so
+    that VectorDatabase can format them the same way regardless of backend.
+    Distances are cosine-style: lower is closer and ``1 - distance`` is the
+    similarity used by the matcher.
+    """
+
+    @abstractmethod
+    def add(
+        self,
+        ids: List[str],
+        embeddings: Optional[List[List[float]]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ) -> None:
+        """Add records to the store."""
+
+    @abstractmethod
+    def upsert(
+        self,
+        ids: List[str],
+        embeddings: Optional[List[List[float]]],
+        documents: List[str],
+        metadatas: List[Dict[str, Any]]
+    ) -> None:
+        """Insert records, replacing the vector, document and metadata of existing IDs."""
+
+    @abstractmethod
+    def update_metadata(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Replace the metadata of existing records, keeping their vectors and documents."""
+
+    @abstractmethod
+    def query(
+        self,
+        embedding: Optional[List[float]],
+        n_results: int,
+        where: Optional[Dict[str, Any]] = None,
+        text: Optional[str] = None,
+        ids: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Return the ``n_results`` nearest records to a query embedding (or text).
+
+        ``ids``, when given, is the already-resolved set of records satisfying
+        ``where``; backends search only that subset and may skip re-evaluating
+        the clause.
+        """
+
+    @abstractmethod
+    def query_ids(self, embedding: List[float], ids: List[str]) -> Dict[str, Any]:
+        """Score specific records against a query embedding, in the same layout as ``query``."""
+
+    @abstractmethod
+    def get(
+        self,
+        ids: Optional[List[str]] = None,
+        include_embeddings: bool = False,
+        include_documents: bool = True
+    ) -> Dict[str, Any]:
+        """Fetch records by ID (all records if ``ids`` is None); "documents" is omitted unless include_documents."""
+
+    @abstractmethod
+    def delete(self, ids: List[str]) -> None:
+        """Delete records by ID."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of stored records."""
+
+    # Bumped whenever the backend reloads records written by another process
+    generation = 0
+
+    def refresh(self) -> None:
+        """Pick up records written by other processes since the last call (no-op by default)."""
+
+    def changed_since(self, generation: int) -> Optional[Set[str]]:
+        """
+        IDs of the records picked up from other processes after ``generation``.
+
+        Returns:
+            Set of changed (added, updated or deleted) IDs, or None if they are not
+            known and everything must be treated as changed
+        """
+        return None
+
+    def reopen(self) -> None:
+        """Reopen file handles and connections in a forked child, keeping in-memory state."""
+        raise NotImplementedError(f"{type(self).__name__} cannot be shared across a fork")
+
+
+class ChromaBackend(VectorBackend):
+    def __init__(
+        self,
+        collection_name: str,
+        persist_directory: str,
+        embed_texts: Optional[Callable[[List[str]], List[List[float]]]] = None
+    ):
+        """
+        Initialize a backend on a persistent ChromaDB collection.
+
+        Args:
+            collection_name: Name of the collection to use
+            persist_directory: Directory to persist the database
+            embed_texts: Function embedding a list of texts (ChromaDB's default
+                embedding function is used if omitted)
+        """
+        import chromadb
+        from chromadb.utils import embedding_functions
+
+        # Initialize ChromaDB client
+        logger.info(f"Initializing ChromaDB client with persistence at {persist_directory}")
+        try:
+            self.client = chromadb.PersistentClient(path=persist_directory)
+            logger.info("ChromaDB client initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize ChromaDB client: {e}")
+            raise
+
+        # Initialize collection with embedding function
+        try:
+            if embed_texts:
+                # Create a wrapper class for ChromaDB
+                class CustomEmbeddingFunction(embedding_functions.EmbeddingFunction):
+                    def __call__(self, texts):
+                        return embed_texts(texts)
+
+                logger.info(f"Creating/getting collection '{collection_name}' with custom embedding function")
+                self.collection = self.client.get_or_create_collection(
+                    name=collection_name,
+                    embedding_function=CustomEmbeddingFunction()
+                )
+            else:
+                # Use default embedding function
+                logger.info(f"Creating/getting collection '{collection_name}' with default embedding function")
+                self.collection = self.client.get_or_create_collection(
+                    name=collection_name
+                )
+
+            logger.info(f"Collection initialized with {self.collection.count()} documents")
+        except Exception as e:
+            logger.error(f"Failed to initialize collection: {e}")
+            raise
+
+    def add(self, ids, embeddings, documents, metadatas) -> None:
+        self.collection.add(
+            ids=ids,
+            embeddings=embeddings,
+            documents=documents,
+            metadatas=metadatas
+        )
+
+    def upsert(self, ids, embeddings, documents, metadatas) -> None:
+        self.collection.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=documents,
+            metadatas=metadatas
+        )
+
+    def update_metadata(self, ids, metadatas) -> None:
+        self.collection.update(ids=ids, metadatas=metadatas)
+
+    def query(self, embedding, n_results, where=None, text=None, ids=None) -> Dict[str, Any]:
+        if ids is not None and len(ids) <= CHROMA_MAX_FILTER_IDS:
+            # Every stored metadata carries its own id, so the subset becomes a where clause
+            where = {"id": {"$in": list(ids)}}
+            n_results = min(n_results, len(ids))
+        return self.collection.query(
+            query_embeddings=[embedding] if embedding else None,
+            query_texts=[text] if not embedding else None,
+            n_results=n_results,
+            where=where
+        )
+
+    def query_ids(self, embedding, ids) -> Dict[str, Any]:
+        records = self.get(ids=ids, include_embeddings=True)
+        if not records["ids"]:
+            return {"ids": [[]], "distances": [[]], "metadatas": [[]], "documents": [[]]}
+
+        query_vector = np.asarray(embedding, dtype=np.float32)
+        vectors = np.asarray(records["embeddings"], dtype=np.float32)
+
+        # Match the distance function the collection was created with
+        space = (self.collection.metadata or {}).get("hnsw:space", "l2")
+        if space == "cosine":
+            norms = np.linalg.norm(vectors, axis=1) * np.linalg.norm(query_vector)
+            norms[norms == 0] = 1.0
+            distances = 1.0 - (vectors @ query_vector) / norms
+        elif space == "ip":
+            distances = 1.0 - vectors @ query_vector
+        else:
+            distances = np.sum((vectors - query_vector) ** 2, axis=1)
+
+        return {
+            "ids": [records["ids"]],
+            "distances": [distances.tolist()],
+            "metadatas": [records["metadatas"]],
+            "documents": [records["documents"]]
+        }
+
+    def get(self, ids=None, include_embeddings=False, include_documents=True) -> Dict[str, Any]:
+        include = ["metadatas"]
+        if include_documents:
+            include.append("documents")
+        if include_embeddings:
+            include.append("embeddings")
+        return self.collection.get(ids=ids, include=include)
+
+    def delete(self, ids) -> None:
+        self.collection.delete(ids=ids)
+
+    def count(self) -> int:
+        return self.collection.count()
+
+
+class NumpyBackend(VectorBackend):
+    def __init__(
+        self,
+        collection_name: str,
+        persist_directory: str,
+        initial_capacity: int = 1024,
+        quantization: Optional[str] = None,
+        rescore_factor: int = 4,
+        block_rows: int = 1024
+    ):
+        """
+        Initialize an exact in-process vector index.
+
+        Normalized embeddings live in one contiguous float32 matrix backed by a
+        memory-mapped file, so a top-k query is a single matrix-vector product
+        followed by ``argpartition``. Metadata is held in memory for filtering;
+        documents and metadata are persisted in a SQLite table next to the matrix.
+
+        With ``quantization`` set, a float16 or int8 (per-row scaled) copy of
+        the matrix is kept in memory for the first pass. The best
+        ``n_results * rescore_factor`` rows are then rescored with the float32
+        vectors from the memmap, so only those rows are read from disk. The
+        float32 pages touched while quantizing or writing are released again,
+        leaving the quantized copy as the only resident one.
+
+        Several processes (e.g. prefork workers) may share the directory.
+        Writes are serialized with a file lock and append the IDs they touch
+        to a change log in SQLite. When SQLite reports commits from another
+        process, only the rows logged since the last seen entry are reloaded
+        (and requantized).
+
+        Args:
+            collection_name: Name of the collection (used as the directory name)
+            persist_directory: Directory to persist the index
+            initial_capacity: Number of rows to allocate when the matrix file is created
+            quantization: None, "float16" or "int8"
+            rescore_factor: Candidates rescored at full precision per requested result
+            block_rows: Rows dequantized at a time during the first pass
+        """
+        if quantization is not None and quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Unknown vector quantization: {quantization}")
+        self.quantization = quantization
+        self.rescore_factor = rescore_factor
+        self.block_rows = block_rows
+        self._quantized: Optional[np.ndarray] = None
+        self._scales: Optional[np.ndarray] = None
+
+        self.directory = os.path.join(persist_directory, collection_name)
+        os.makedirs(self.directory, exist_ok=True)
+
+        self.vectors_path = os.path.join(self.directory, "vectors.f32")
+        self.initial_capacity = initial_capacity
+        self._lock = threading.RLock()
+
+        self.dimension: Optional[int] = None
+        self._vectors: Optional[np.memmap] = None
+        self._ids: List[Optional[str]] = []
+        self._metadatas: List[Optional[Dict[str, Any]]] = []
+        self._rows: Dict[str, int] = {}
+        self._free_rows: List[int] = []
+        self._alive = np.zeros(0, dtype=bool)
+        # Last change log entry applied, and (generation, changed IDs or None) per refresh
+        self._seq = 0
+        self._history = deque(maxlen=CHANGE_HISTORY)
+
+        logger.info(f"Opening exact vector index at {self.directory}")
+        try:
+            self._connect()
+            self._load()
+        except Exception as e:
+            logger.error(f"Failed to open exact vector index: {e}")
+            raise
+
+        logger.info(f"Exact vector index initialized with {self.count()} documents")
+
+    def refresh(self) -> None:
+        with self._lock:
+            self._refresh()
+
+    def reopen(self) -> None:
+        # SQLite connections and flock handles must not be used across fork(); the
+        # memmapped matrix and the in-memory metadata stay shared copy-on-write
+        with self._lock:
+            self._connect()
+            # Check the change log on next use for writes made since the parent loaded
+            self._data_version = None
+
+    def changed_since(self, generation: int) -> Optional[Set[str]]:
+        with self._lock:
+            changed: Set[str] = set()
+            expected = generation + 1
+            for entry_generation, ids in self._history:
+                if entry_generation <= generation:
+                    continue
+                if entry_generation != expected or ids is None:
+                    return None
+                changed.update(ids)
+                expected += 1
+            return changed if expected == self.generation + 1 else None
+
+    def add(self, ids, embeddings, documents, metadatas) -> None:
+        if embeddings is None:
+            raise ValueError("The numpy backend requires precomputed embeddings")
+
+        matrix = self._normalize(np.asarray(embeddings, dtype=np.float32))
+
+        with self._exclusive():
+            if self.dimension is None:
+                self._set_dimension(matrix.shape[1])
+
+            rows = []
+            next_row = len(self._ids)
+            for candidate_id in ids:
+                row = self._rows.get(candidate_id)
+                if row is None:
+                    if self._free_rows:
+                        row = self._free_rows.pop()
+                    else:
+                        row = next_row
+                        next_row += 1
+                rows.append(row)
+                self._rows[candidate_id] = row
+
+            self._ensure_capacity(max(rows) + 1)
+            self._vectors[rows] = matrix
+            self._vectors.flush()
+            if self.quantization:
+                self._store_quantized(np.asarray(rows), matrix)
+                self._release_vectors(np.asarray(rows))
+
+            for candidate_id, row, metadata in zip(ids, rows, metadatas):
+                while len(self._ids) <= row:
+                    self._ids.append(None)
+                    self._metadatas.append(None)
+                self._ids[row] = candidate_id
+                self._metadatas[row] = metadata
+                self._alive[row] = True
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO records (id, row, document, metadata) VALUES (?, ?, ?, ?)",
+                [(candidate_id, row, document, json.dumps(metadata))
+                 for candidate_id, row, document, metadata in zip(ids, rows, documents, metadatas)]
+            )
+            self._log_changes(ids)
+
+    def upsert(self, ids, embeddings, documents, metadatas) -> None:
+        # add already replaces existing rows in place
+        self.add(ids, embeddings, documents, metadatas)
+
+    def update_metadata(self, ids, metadatas) -> None:
+        with self._exclusive():
+            updates = []
+            for candidate_id, metadata in zip(ids, metadatas):
+                row = self._rows.get(candidate_id)
+                if row is None:
+                    continue
+                self._metadatas[row] = metadata
+                updates.append((json.dumps(metadata), candidate_id))
+
+            self._conn.executemany("UPDATE records SET metadata = ? WHERE id = ?", updates)
+            self._log_changes([candidate_id for _, candidate_id in updates])
+
+    def query(self, embedding, n_results, where=None, text=None, ids=None) -> Dict[str, Any]:
+        if embedding is None:
+            raise ValueError("The numpy backend requires a query embedding")
+
+        with self._lock:
+            self._refresh()
+            n_rows = len(self._ids)
+            if n_rows == 0:
+                return {"ids": [[]], "distances": [[]], "metadatas": [[]], "documents": [[]]}
+            vectors = self._vectors
+            if ids is not None:
+                candidates = np.zeros(n_rows, dtype=bool)
+                candidates[[self._rows[candidate_id] for candidate_id in ids if candidate_id in self._rows]] = True
+            elif where:
+                candidates = self._alive[:n_rows].copy()
+                candidates &= np.array(
+                    [metadata is not None and matches_where(metadata, where) for metadata in self._metadatas],
+                    dtype=bool
+                )
+            else:
+                candidates = self._alive[:n_rows].copy()
+
+        query_vector = self._normalize(np.asarray(embedding, dtype=np.float32).reshape(1, -1))[0]
+        rows = np.flatnonzero(candidates)
+        if len(rows) == 0:
+            return {"ids": [[]], "distances": [[]], "metadatas": [[]], "documents": [[]]}
+
+        if self.quantization:
+            return self._query_quantized(rows, n_rows, query_vector, n_results)
+
+        # Full scan is cheaper than a gather when most rows qualify
+        if len(rows) == n_rows:
+            scores = vectors[:n_rows] @ query_vector
+        else:
+            scores = vectors[rows] @ query_vector
+
+        k = min(n_results, len(rows))
+        top = np.argpartition(-scores, k - 1)[:k] if k < len(rows) else np.arange(len(rows))
+        top = top[np.argsort(-scores[top], kind="stable")]
+
+        return self._result_rows(rows[top], 1.0 - scores[top])
+
+    def query_ids(self, embedding, ids) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            rows = np.array(
+                [self._rows[candidate_id] for candidate_id in ids if candidate_id in self._rows],
+                dtype=np.int64
+            )
+            vectors = self._vectors
+        if len(rows) == 0:
+            return {"ids": [[]], "distances": [[]], "metadatas": [[]], "documents": [[]]}
+
+        query_vector = self._normalize(np.asarray(embedding, dtype=np.float32).reshape(1, -1))[0]
+        scores = vectors[rows] @ query_vector
+        return self._result_rows(rows, 1.0 - scores)
+
+    def get(self, ids=None, include_embeddings=False, include_documents=True) -> Dict[str, Any]:
+        with self._lock:
+            self._refresh()
+            if ids is None:
+                rows = [row for row, candidate_id in enumerate(self._ids) if candidate_id is not None]
+            else:
+                rows = [self._rows[candidate_id] for candidate_id in ids if candidate_id in self._rows]
+
+            result = {
+                "ids": [self._ids[row] for row in rows],
+                "metadatas": [self._metadatas[row] for row in rows]
+            }
+            if include_documents:
+                result["documents"] = self._documents(result["ids"])
+            if include_embeddings:
+                result["embeddings"] = [self._vectors[row].tolist() for row in rows]
+            return result
+
+    def delete(self, ids) -> None:
+        with self._exclusive():
+            for candidate_id in ids:
+                row = self._rows.pop(candidate_id, None)
+                if row is None:
+                    continue
+                self._ids[row] = None
+                self._metadatas[row] = None
+                self._alive[row] = False
+                self._free_rows.append(row)
+
+            self._conn.executemany("DELETE FROM records WHERE id = ?", [(candidate_id,) for candidate_id in ids])
+            self._log_changes(ids)
+
+    def count(self) -> int:
+        with self._lock:
+            self._refresh()
+            return len(self._rows)
+
+    def memory_stats(self) -> Dict[str, Optional[int]]:
+        """
+        Get the size of the vectors searched in memory versus at full precision.
+
+        ``search_bytes`` and ``full_precision_bytes`` are array sizes;
+        ``mapped_resident_bytes`` is how much of the float32 matrix file is
+        actually resident in this process (None where it cannot be measured).
+
+        Returns:
+            Dictionary with row count and byte sizes
+        """
+        with self._lock:
+            n_rows = len(self._ids)
+            dimension = self.dimension or 0
+            full_bytes = n_rows * dimension * 4
+            if self.quantization:
+                search_bytes = n_rows * dimension * self._quantized.itemsize if self._quantized is not None else 0
+                if self._scales is not None:
+                    search_bytes += n_rows * self._scales.itemsize
+            else:
+                search_bytes = full_bytes
+            return {
+                "rows": n_rows,
+                "search_bytes": search_bytes,
+                "full_precision_bytes": full_bytes,
+                "mapped_resident_bytes": mapped_resident_bytes(self.vectors_path)
+            }
+
+    def _query_quantized(self, rows: np.ndarray, n_rows: int, query_vector: np.ndarray, n_results: int) -> Dict[str, Any]:
+        """First pass on the quantized matrix, then rescore the best rows at full precision."""
+        with self._lock:
+            quantized, scales, vectors = self._quantized, self._scales, self._vectors
+
+        # Dequantize cache-sized blocks into one reused buffer
+        full_scan = len(rows) == n_rows
+        scores = np.empty(len(rows), dtype=np.float32)
+        buffer = np.empty((min(self.block_rows, len(rows)), self.dimension), dtype=np.float32)
+        for start in range(0, len(rows), self.block_rows):
+            stop = min(start + self.block_rows, len(rows))
+            block = quantized[start:stop] if full_scan else quantized[rows[start:stop]]
+            np.copyto(buffer[:stop - start], block, casting="unsafe")
+            scores[start:stop] = buffer[:stop - start] @ query_vector
+        if scales is not None:
+            scores *= scales[:n_rows] if full_scan else scales[rows]
+
+        # Shortlist on approximate scores, then rank the shortlist exactly
+        k = min(n_results, len(rows))
+        shortlist_size = min(len(rows), k * self.rescore_factor)
+        if shortlist_size < len(rows):
+            shortlist = np.argpartition(-scores, shortlist_size - 1)[:shortlist_size]
+        else:
+            shortlist = np.arange(len(rows))
+        shortlist_rows = rows[shortlist]
+        order = np.argsort(shortlist_rows)
+        exact = np.empty(len(shortlist_rows), dtype=np.float32)
+        exact[order] = vectors[shortlist_rows[order]] @ query_vector
+
+        top = np.argsort(-exact, kind="stable")[:k]
+        return self._result_rows(shortlist_rows[top], 1.0 - exact[top])
+
+    def _store_quantized(self, rows: np.ndarray, matrix: np.ndarray) -> None:
+        """Write quantized copies of normalized rows. Caller holds the lock."""
+        if self.quantization == "float16":
+            self._quantized[rows] = matrix.astype(np.float16)
+            return
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        self._quantized[rows] = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+        self._scales[rows] = scales
+
+    def _release_vectors(self, rows: Optional[np.ndarray] = None) -> None:
+        """
+        Drop float32 matrix pages from this process's memory after quantizing. Caller holds the lock.
+
+        Only this process's mapping is released: the pages stay in the file and
+        the host's page cache, and rescoring faults back in the rows it reads.
+
+        Args:
+            rows: Rows just written (defaults to the whole matrix)
+        """
+        mapping = getattr(self._vectors, "_mmap", None)
+        if mapping is None or not hasattr(mmap, "MADV_DONTNEED"):
+            return
+        self._vectors.flush()
+        if rows is None:
+            mapping.madvise(mmap.MADV_DONTNEED)
+            return
+
+        # Release each run of consecutive rows, widened to whole pages
+        row_bytes = self.dimension * self._vectors.itemsize
+        rows = np.unique(rows)
+        for run in np.split(rows, np.flatnonzero(np.diff(rows) != 1) + 1):
+            start = int(run[0]) * row_bytes // mmap.PAGESIZE * mmap.PAGESIZE
+            stop = min(int(run[-1] + 1) * row_bytes, len(mapping))
+            mapping.madvise(mmap.MADV_DONTNEED, start, stop - start)
+
+    def _resize_quantized(self, capacity: int) -> None:
+        """Grow the in-memory quantized matrix to ``capacity`` rows. Caller holds the lock."""
+        dtype = np.float16 if self.quantization == "float16" else np.int8
+        quantized = np.zeros((capacity, self.dimension), dtype=dtype)
+        if self._quantized is not None:
+            quantized[:len(self._quantized)] = self._quantized[:capacity]
+        self._quantized = quantized
+        if self.quantization == "int8":
+            scales = np.ones(capacity, dtype=np.float32)
+            if self._scales is not None:
+                scales[:len(self._scales)] = self._scales[:capacity]
+            self._scales = scales
+
+    @contextmanager
+    def _exclusive(self):
+        """Hold this process's lock and the cross-process write lock, with records up to date."""
+        with self._lock:
+            if fcntl is not None:
+                fcntl.flock(self._lock_file, fcntl.LOCK_EX)
+            try:
+                self._refresh()
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(self._lock_file, fcntl.LOCK_UN)
+
+    def _refresh(self) -> None:
+        """Apply records another process committed since we last looked. Caller holds the lock."""
+        # data_version only changes for commits made by other connections
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version == self._data_version:
+            return
+        self._data_version = version
+
+        oldest = self._conn.execute("SELECT MIN(seq) FROM changes").fetchone()[0]
+        if self.dimension is None or (oldest is not None and oldest > self._seq + 1):
+            # Nothing loaded yet, or the log was pruned past the last entry we applied
+            logger.info(f"Reloading vector index at {self.directory} after writes by another process")
+            self._ids, self._metadatas, self._rows, self._free_rows = [], [], {}, []
+            self._quantized = self._scales = None
+            self._load()
+            self.generation += 1
+            self._history.append((self.generation, None))
+            return
+
+        changes = self._conn.execute("SELECT seq, id FROM changes WHERE seq > ? ORDER BY seq", (self._seq,)).fetchall()
+        if not changes:
+            return
+        self._seq = changes[-1][0]
+        ids = list(dict.fromkeys(candidate_id for _, candidate_id in changes))
+        self._apply_changes(ids)
+        self.generation += 1
+        self._history.append((self.generation, ids))
+
+    def _apply_changes(self, ids: List[str]) -> None:
+        """Reload the rows of changed IDs from SQLite and requantize them. Caller holds the lock."""
+        records = []
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            records.extend(self._conn.execute(
+                f"SELECT id, row, metadata FROM records WHERE id IN ({placeholders})", chunk
+            ).fetchall())
+
+        # The writer may have grown the matrix file
+        n_rows = max([len(self._ids)] + [record_row + 1 for _, record_row, _ in records])
+        row_bytes = self.dimension * np.dtype(np.float32).itemsize
+        if os.path.getsize(self.vectors_path) > len(self._vectors) * row_bytes or n_rows > len(self._vectors):
+            self._remap(n_rows)
+        freed = list(range(len(self._ids), n_rows))
+        self._ids.extend([None] * (n_rows - len(self._ids)))
+        self._metadatas.extend([None] * (n_rows - len(self._metadatas)))
+
+        # Clear every old row first, as a freed row may be reused by another changed ID
+        for candidate_id in ids:
+            row = self._rows.pop(candidate_id, None)
+            if row is not None and self._ids[row] == candidate_id:
+                self._ids[row] = None
+                self._metadatas[row] = None
+                self._alive[row] = False
+                freed.append(row)
+        rows = []
+        for candidate_id, record_row, metadata in records:
+            self._ids[record_row] = candidate_id
+            self._metadatas[record_row] = json.loads(metadata)
+            self._rows[candidate_id] = record_row
+            self._alive[record_row] = True
+            rows.append(record_row)
+        self._free_rows = [row for row in dict.fromkeys(self._free_rows + freed) if self._ids[row] is None]
+
+        if self.quantization and rows:
+            rows = np.asarray(rows)
+            self._store_quantized(rows, np.asarray(self._vectors[rows]))
+            self._release_vectors(rows)
+
+    def _log_changes(self, ids: List[str]) -> None:
+        """Append changed IDs to the change log and commit the write. Caller holds the write lock."""
+        self._conn.executemany("INSERT INTO changes (id) VALUES (?)", [(candidate_id,) for candidate_id in ids])
+        self._seq = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+        self._conn.execute("DELETE FROM changes WHERE seq <= ?", (self._seq - CHANGE_LOG_ROWS,))
+        self._conn.commit()
+
+    def _connect(self) -> None:
+        """Open the SQLite table of documents and metadata, and the write lock file."""
+        self._lock_file = open(os.path.join(self.directory, "write.lock"), "a")
+        self._conn = sqlite3.connect(os.path.join(self.directory, "records.sqlite"), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS records "
+            "(id TEXT PRIMARY KEY, row INTEGER NOT NULL, document TEXT, metadata TEXT)"
+        )
+        self._conn.execute("CREATE TABLE IF NOT EXISTS info (key TEXT PRIMARY KEY, value TEXT)")
+        self._conn.execute("CREATE TABLE IF NOT EXISTS changes (seq INTEGER PRIMARY KEY AUTOINCREMENT, id TEXT NOT NULL)")
+        self._conn.commit()
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def _load(self) -> None:
+        """Rebuild the in-memory row maps from SQLite and map the matrix file."""
+        # Read the log position first: changes committed while loading are applied again later
+        self._seq = self._conn.execute("SELECT COALESCE(MAX(seq), 0) FROM changes").fetchone()[0]
+        row = self._conn.execute("SELECT value FROM info WHERE key = 'dimension'").fetchone()
+        if row is None:
+            return
+
+        self.dimension = int(row[0])
+        records = self._conn.execute("SELECT id, row, metadata FROM records").fetchall()
+        n_rows = max((record[1] for record in records), default=-1) + 1
+
+        self._ids = [None] * n_rows
+        self._metadatas = [None] * n_rows
+        for candidate_id, record_row, metadata in records:
+            self._ids[record_row] = candidate_id
+            self._metadatas[record_row] = json.loads(metadata)
+            self._rows[candidate_id] = record_row
+        self._free_rows = [r for r in range(n_rows) if self._ids[r] is None]
+
+        self._map_vectors(max(n_rows, self.initial_capacity))
+        self._alive = np.zeros(len(self._vectors), dtype=bool)
+        self._alive[list(self._rows.values())] = True
+
+        if self.quantization:
+            # Quantize from the full-precision file a block at a time
+            self._resize_quantized(len(self._vectors))
+            for start in range(0, n_rows, self.block_rows):
+                stop = min(start + self.block_rows, n_rows)
+                self._store_quantized(np.arange(start, stop), np.asarray(self._vectors[start:stop]))
+            self._release_vectors()
+
+    def _set_dimension(self, dimension: int) -> None:
+        """Record the embedding dimension and create the matrix file."""
+        self.dimension = dimension
+        self._conn.execute("INSERT OR REPLACE INTO info (key, value) VALUES ('dimension', ?)", (str(dimension),))
+        self._conn.commit()
+        self._map_vectors(self.initial_capacity)
+        self._alive = np.zeros(len(self._vectors), dtype=bool)
+        if self.quantization:
+            self._resize_quantized(len(self._vectors))
+
+    def _ensure_capacity(self, n_rows: int) -> None:
+        """Grow the matrix file (doubling) so it holds at least ``n_rows`` rows."""
+        capacity = len(self._vectors)
+        if n_rows <= capacity:
+            return
+
+        while capacity < n_rows:
+            capacity *= 2
+        self._remap(capacity)
+
+    def _remap(self, capacity: int) -> None:
+        """Map the matrix file again with room for at least ``capacity`` rows, growing the row arrays."""
+        self._vectors.flush()
+        self._map_vectors(capacity)
+        alive = np.zeros(len(self._vectors), dtype=bool)
+        alive[:len(self._alive)] = self._alive
+        self._alive = alive
+        if self.quantization:
+            self._resize_quantized(len(self._vectors))
+
+    def _map_vectors(self, capacity: int) -> None:
+        """Memory-map the matrix file with room for ``capacity`` rows."""
+        row_bytes = self.dimension * np.dtype(np.float32).itemsize
+        size = os.path.getsize(self.vectors_path) if os.path.exists(self.vectors_path) else 0
+        capacity = max(capacity, size // row_bytes)
+        if size < capacity * row_bytes:
+            with open(self.vectors_path, "ab") as f:
+                f.truncate(capacity * row_bytes)
+        self._vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(capacity, self.dimension))
+        mapping = getattr(self._vectors, "_mmap", None)
+        if self.quantization and mapping is not None and hasattr(mmap, "MADV_RANDOM"):
+            # Rescoring reads scattered rows; without this, readahead pulls in their neighbours too
+            mapping.madvise(mmap.MADV_RANDOM)
+
+    def _documents(self, ids: List[str]) -> List[str]:
+        """Fetch stored documents for IDs, preserving order."""
+        if not ids:
+            return []
+        documents = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            for candidate_id, document in self._conn.execute(
+                f"SELECT id, document FROM records WHERE id IN ({placeholders})", chunk
+            ):
+                documents[candidate_id] = document
+        return [documents.get(candidate_id, "") for candidate_id in ids]
+
+    def _result_rows(self, rows: np.ndarray, distances: np.ndarray) -> Dict[str, Any]:
+        """Build a ChromaDB-style single-query result for the given rows."""
+        with self._lock:
+            ids = [self._ids[row] for row in rows]
+            metadatas = [self._metadatas[row] for row in rows]
+            documents = self._documents(ids)
+        return {
+            "ids": [ids],
+            "distances": [distances.tolist()],
+            "metadatas": [metadatas],
+            "documents": [documents]
+        }
+
+    @staticmethod
+    def _normalize(matrix: np.ndarray) -> np.ndarray:
+        """L2-normalize rows, leaving zero vectors untouched."""
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return matrix / norms
+
+
+def matches_where(metadata: Dict[str, Any], where: Dict[str, Any]) -> bool:
+    """
+    Evaluate a ChromaDB-style ``where`` clause against one metadata dictionary.
+
+    Supports ``$and``/``$or`` and the ``$eq``, ``$ne``, ``$gt``, ``$gte``, ``$lt``,
+    ``$lte``, ``$in`` and ``$nin`` operators, plus bare ``{field: value}`` equality.
+    """
+    for key, condition in where.items():
+        if key == "$and":
+            if not all(matches_where(metadata, clause) for clause in condition):
+                return False
+            continue
+        if key == "$or":
+            if not any(matches_where(metadata, clause) for clause in condition):
+                return False
+            continue
+
+        value = metadata.get(key)
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+
+        for operator, operand in condition.items():
+            try:
+                if operator == "$eq":
+                    ok = value == operand
+                elif operator == "$ne":
+                    ok = value != operand
+                elif operator == "$gt":
+                    ok = value is not None and value > operand
+                elif operator == "$gte":
+                    ok = value is not None and value >= operand
+                elif operator == "$lt":
+                    ok = value is not None and value < operand
+                elif operator == "$lte":
+                    ok = value is not None and value <= operand
+                elif operator == "$in":
+                    ok = value in operand
+                elif operator == "$nin":
+                    ok = value not in operand
+                else:
+                    raise ValueError(f"Unsupported where operator: {operator}")
+            except TypeError:
+                ok = False
+            if not ok:
+                return False
+    return True
+
+
+def create_backend(
+    name: Optional[str],
+    collection_name: str,
+    persist_directory: str,
+    embed_texts: Optional[Callable[[List[str]], List[List[float]]]] = None
+) -> VectorBackend:
+    """
+    Create a vector backend by name.
+
+    Args:
+        name: "chroma" or "numpy" (defaults to the HIRE3X_VECTOR_BACKEND environment variable);
+            the numpy backend is quantized per HIRE3X_VECTOR_QUANTIZATION ("float16" or "int8")
+        collection_name: Name of the collection to use
+        persist_directory: Directory to persist the backend
+        embed_texts: Function embedding a list of texts (used by ChromaDB for text queries)
+
+    Returns:
+        The vector backend
+    """
+    name = (name or DEFAULT_BACKEND).lower()
+    if name == "chroma":
+        return ChromaBackend(collection_name, persist_directory, embed_texts)
+    if name == "numpy":
+        return NumpyBackend(collection_name, persist_directory, quantization=DEFAULT_QUANTIZATION)
+    raise ValueError(f"Unknown vector backend: {name}")
@@ -0,0 +1,206 @@
+import threading
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Set, Tuple
+import numpy as np
+import logging
+
+# Configure logging
+logger = logging.getLogger("hire3x.metadata_index")
+
+# Metadata fields indexed as sorted numeric columns
+NUMERIC_FIELDS = [
+    "years_of_experience",
+    "avg_assessment_score",
+    "avg_assessment_percentile",
+    "hire3x_profile_completion",
+    "hire3x_activity_score"
+]
+
+# Metadata fields indexed as value -> positions inverted lists
+CATEGORICAL_FIELDS = [
+    "location",
+    "preferred_work_type",
+    "highest_degree"
+]
+
+NUMERIC_OPERATORS = {"$eq", "$gt", "$gte", "$lt", "$lte"}
+CATEGORICAL_OPERATORS = {"$eq", "$in"}
+
+
+class MetadataIndex:
+    def __init__(self):
+        """
+        Initialize a columnar index over candidate metadata.
+
+        Numeric fields are answered from sorted value arrays with binary search
+        and categorical fields from inverted lists, so a filter resolves to the
+        set of allowed candidate IDs before any vector similarity is computed.
+        Sorted arrays are rebuilt lazily after the index changes.
+        """
+        self._lock = threading.RLock()
+        self._ids: List[Optional[str]] = []
+        self._alive: List[bool] = []
+        self._positions: Dict[str, int] = {}
+        self._numeric: Dict[str, List[float]] = {field: [] for field in NUMERIC_FIELDS}
+        self._categorical: Dict[str, Dict[Any, Set[int]]] = {field: defaultdict(set) for field in CATEGORICAL_FIELDS}
+        self._category_values: Dict[str, List[Any]] = {field: [] for field in CATEGORICAL_FIELDS}
+        self._sorted: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def add(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """
+        Index (or re-index) candidates.
+
+        Args:
+            ids: Candidate IDs
+            metadatas: Metadata dictionaries from CandidateProfile.get_metadata()
+        """
+        with self._lock:
+            for candidate_id, metadata in zip(ids, metadatas):
+                position = self._positions.get(candidate_id)
+                if position is None:
+                    position = len(self._ids)
+                    self._positions[candidate_id] = position
+                    self._ids.append(candidate_id)
+                    self._alive.append(True)
+                    for values in self._numeric.values():
+                        values.append(np.nan)
+                    for values in self._category_values.values():
+                        values.append(None)
+                else:
+                    self._unindex_categories(position)
+
+                for field in NUMERIC_FIELDS:
+                    value = metadata.get(field)
+                    try:
+                        self._numeric[field][position] = float(value) if value is not None else np.nan
+                    except (TypeError, ValueError):
+                        self._numeric[field][position] = np.nan
+
+                for field in CATEGORICAL_FIELDS:
+                    value = metadata.get(field)
+                    self._category_values[field][position] = value
+                    if value is not None:
+                        self._categorical[field][value].add(position)
+
+            self._sorted.clear()
+
+    def remove(self, ids: List[str]) -> None:
+        """
+        Drop candidates from the index.
+
+        Args:
+            ids: Candidate IDs to remove
+        """
+        with self._lock:
+            for candidate_id in ids:
+                position = self._positions.pop(candidate_id, None)
+                if position is None:
+                    continue
+                self._ids[position] = None
+                self._alive[position] = False
+                for values in self._numeric.values():
+                    values[position] = np.nan
+                self._unindex_categories(position)
+
+            self._sorted.clear()
+
+    def supports(self, filters: Dict[str, Any]) -> bool:
+        """
+        Check whether every condition of a filter can be answered by the index.
+
+        Args:
+            filters: Mapping of field to condition, e.g. {"years_of_experience": {"$gte": 3}}
+
+        Returns:
+            True if the index can resolve the filter
+        """
+        for field, condition in filters.items():
+            if not isinstance(condition, dict):
+                condition = {"$eq": condition}
+            if field in NUMERIC_FIELDS:
+                allowed = NUMERIC_OPERATORS
+            elif field in CATEGORICAL_FIELDS:
+                allowed = CATEGORICAL_OPERATORS
+            else:
+                return False
+            if not set(condition).issubset(allowed):
+                return False
+        return True
+
+    def allowed_ids(self, filters: Dict[str, Any]) -> List[str]:
+        """
+        Resolve a filter to the IDs of the candidates that satisfy it.
+
+        Args:
+            filters: Mapping of field to condition (see ``supports``)
+
+        Returns:
+            IDs of matching candidates
+        """
+        with self._lock:
+            mask = np.array(self._alive, dtype=bool)
+
+            for field, condition in filters.items():
+                if not isinstance(condition, dict):
+                    condition = {"$eq": condition}
+                for operator, operand in condition.items():
+                    if field in NUMERIC_FIELDS:
+                        mask &= self._numeric_mask(field, operator, operand)
+                    else:
+                        mask &= self._categorical_mask(field, operator, operand)
+
+            return [self._ids[position] for position in np.flatnonzero(mask)]
+
+    def _numeric_mask(self, field: str, operator: str, operand: float) -> np.ndarray:
+        """Positions whose numeric value satisfies the operator, via binary search on the sorted column."""
+        values, positions = self._sorted_column(field)
+        operand = float(operand)
+
+        if operator == "$gte":
+            selected = positions[np.searchsorted(values, operand, side="left"):]
+        elif operator == "$gt":
+            selected = positions[np.searchsorted(values, operand, side="right"):]
+        elif operator == "$lte":
+            selected = positions[:np.searchsorted(values, operand, side="right")]
+        elif operator == "$lt":
+            selected = positions[:np.searchsorted(values, operand, side="left")]
+        else:
+            selected = positions[
+                np.searchsorted(values, operand, side="left"):np.searchsorted(values, operand, side="right")
+            ]
+
+        mask = np.zeros(len(self._ids), dtype=bool)
+        mask[selected] = True
+        return mask
+
+    def _categorical_mask(self, field: str, operator: str, operand: Any) -> np.ndarray:
+        """Positions whose categorical value equals (or is in) the operand."""
+        operands = operand if operator == "$in" else [operand]
+        mask = np.zeros(len(self._ids), dtype=bool)
+        for value in operands:
+            positions = self._categorical[field].get(value)
+            if positions:
+                mask[list(positions)] = True
+        return mask
+
+    def _sorted_column(self, field: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (sorted values, positions) for a numeric field, excluding missing values."""
+        column = self._sorted.get(field)
+        if column is None:
+            values = np.array(self._numeric[field], dtype=np.float64)
+            present = np.flatnonzero(~np.isnan(values))
+            order = present[np.argsort(values[present], kind="stable")]
+            column = (values[order], order)
+            self._sorted[field] = column
+        return column
+
+    def _unindex_categories(self, position: int) -> None:
+        """Remove a position from every inverted list."""
+        for field, values in self._category_values.items():
+            value = values[position]
+            if value is not None:
+                self._categorical[field][value].discard(position)
+                values[position] = None
@@ -0,0 +1,162 @@
+import os
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Iterable
+import logging
+
+from src.data_processing.hire3x_models import CandidateProfile
+
+# Configure logging
+logger = logging.getLogger("hire3x.profile_store")
+
+
+class CandidateProfileStore:
+    def __init__(self, db_path: str = "./data/profiles.sqlite", cache_size: int = 1024):
+        """
+        Initialize a persistent store of full candidate profiles keyed by ID.
+
+        Profiles are kept as JSON in an embedded SQLite table with the candidate
+        ID as primary key, so lookups stay constant-time as the pool grows. A
+        bounded in-memory LRU sits in front of the table for hot profiles.
+
+        Args:
+            db_path: Path to the SQLite database file
+            cache_size: Maximum number of profiles held in the in-memory LRU
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.db_path = db_path
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+        logger.info(f"Opening candidate profile store at {db_path}")
+        try:
+            self._connect()
+        except Exception as e:
+            logger.error(f"Failed to open candidate profile store: {e}")
+            raise
+
+    def put(self, candidate: CandidateProfile) -> None:
+        """
+        Insert or replace a single candidate profile.
+
+        Args:
+            candidate: The candidate profile to store
+        """
+        self.put_many([candidate])
+
+    def put_many(self, candidates: List[CandidateProfile]) -> None:
+        """
+        Insert or replace several candidate profiles in one transaction.
+
+        Args:
+            candidates: The candidate profiles to store
+        """
+        if not candidates:
+            return
+
+        profiles = [candidate.model_dump() for candidate in candidates]
+        rows = [(profile["id"], json.dumps(profile)) for profile in profiles]
+
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO profiles (id, profile) VALUES (?, ?)",
+                rows
+            )
+            self._conn.commit()
+
+            for profile in profiles:
+                self._remember(profile["id"], profile)
+
+    def get(self, candidate_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a candidate profile by ID.
+
+        Args:
+            candidate_id: ID of the candidate
+
+        Returns:
+            The profile as a dictionary, or None if it is not stored
+        """
+        with self._lock:
+            profile = self._cache.get(candidate_id)
+            if profile is not None:
+                self._cache.move_to_end(candidate_id)
+                return profile
+
+            row = self._conn.execute(
+                "SELECT profile FROM profiles WHERE id = ?",
+                (candidate_id,)
+            ).fetchone()
+
+            if row is None:
+                return None
+
+            profile = json.loads(row[0])
+            self._remember(candidate_id, profile)
+            return profile
+
+    def delete(self, candidate_id: str) -> None:
+        """
+        Remove a candidate profile from the store.
+
+        Args:
+            candidate_id: ID of the candidate to remove
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM profiles WHERE id = ?", (candidate_id,))
+            self._conn.commit()
+            self._cache.pop(candidate_id, None)
+
+    def count(self) -> int:
+        """
+        Get the number of stored profiles.
+
+        Returns:
+            Number of profiles
+        """
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM profiles").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying SQLite connection."""
+        with self._lock:
+            self._conn.close()
+
+    def clear_cache(self) -> None:
+        """Drop every profile from the in-memory LRU, e.g. after another process changed the store."""
+        with self._lock:
+            self._cache.clear()
+
+    def forget(self, candidate_ids: Iterable[str]) -> None:
+        """Drop specific profiles from the in-memory LRU, e.g. after another process changed them."""
+        with self._lock:
+            for candidate_id in candidate_ids:
+                self._cache.pop(candidate_id, None)
+
+    def reopen(self) -> None:
+        """Open a fresh SQLite connection in a forked child; the parent's must not be reused."""
+        with self._lock:
+            self._connect()
+
+    def _connect(self) -> None:
+        """Open the SQLite table of profiles."""
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS profiles (id TEXT PRIMARY KEY, profile TEXT NOT NULL)"
+        )
+        self._conn.commit()
+
+    def _remember(self, candidate_id: str, profile: Dict[str, Any]) -> None:
+        """Add a profile to the LRU, evicting the least recently used entry if full."""
+        self._cache[candidate_id] = profile
+        self._cache.move_to_end(candidate_id)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
@@ -0,0 +1,271 @@
+import threading
+from collections import defaultdict
+from typing import List, Dict, Any, Optional, Callable, Tuple, Set
+import numpy as np
+import logging
+
+from src.data_processing.hire3x_models import CandidateProfile
+from src.database.backends import VectorBackend
+
+# Configure logging
+logger = logging.getLogger("hire3x.sections")
+
+# Section aggregation modes
+AGGREGATE_MAX = "max"
+AGGREGATE_WEIGHTED = "weighted"
+
+# Weight of each section type in the weighted aggregation
+SECTION_WEIGHTS = {
+    "profile": 1.0,
+    "experience": 1.0,
+    "projects": 0.7,
+    "assessments": 0.5
+}
+
+# Sections requested per wanted candidate in the first section query, and
+# candidates shortlisted by max-sim per result before weighted rescoring
+SECTION_OVERSAMPLE = 4
+
+
+def section_type(section_name: str) -> str:
+    """Section type of a section name, e.g. "experience" for "experience:2"."""
+    return section_name.split(":", 1)[0]
+
+
+def build_section_records(candidates: List[CandidateProfile]) -> Tuple[List[str], List[str], List[Dict[str, Any]]]:
+    """
+    Build the section records of candidates.
+
+    Args:
+        candidates: Candidate profiles
+
+    Returns:
+        Tuple of (section IDs, section texts, section metadatas), in candidate then section order
+    """
+    ids, texts, metadatas = [], [], []
+    for candidate in candidates:
+        for name, text in candidate.to_sections():
+            section_id = f"{candidate.id}#{name}"
+            ids.append(section_id)
+            texts.append(text)
+            metadatas.append({"id": section_id, "candidate_id": candidate.id, "section": name})
+    return ids, texts, metadatas
+
+
+class SectionIndex:
+    def __init__(self, backend: VectorBackend, aggregation: str = AGGREGATE_MAX):
+        """
+        Initialize multi-vector storage of candidate profile sections.
+
+        Every section from ``CandidateProfile.to_sections`` is stored as its own
+        vector tagged with the candidate ID. Searches score sections and then
+        aggregate them per candidate, either by the best section (max-sim) or by
+        a weighted mean over all of a candidate's sections.
+
+        Args:
+            backend: Vector backend holding the section vectors
+            aggregation: "max" or "weighted"
+        """
+        if aggregation not in (AGGREGATE_MAX, AGGREGATE_WEIGHTED):
+            raise ValueError(f"Unknown section aggregation: {aggregation}")
+        self.backend = backend
+        self.aggregation = aggregation
+        self._lock = threading.RLock()
+        self._section_ids: Optional[Dict[str, List[str]]] = None
+        self._generation = backend.generation
+
+    def preload(self) -> None:
+        """Load the candidate -> section IDs map now rather than on first use."""
+        with self._lock:
+            self._load()
+
+    def add(
+        self,
+        candidates: List[CandidateProfile],
+        embeddings: Optional[np.ndarray] = None,
+        embed_texts: Optional[Callable[[List[str]], np.ndarray]] = None
+    ) -> None:
+        """
+        Store (or replace) the sections of candidates.
+
+        Args:
+            candidates: Candidate profiles
+            embeddings: Section embeddings in ``build_section_records`` order (optional)
+            embed_texts: Function embedding section texts, used when ``embeddings`` is omitted
+        """
+        ids, texts, metadatas = build_section_records(candidates)
+        if not ids:
+            return
+        if embeddings is None and embed_texts is not None:
+            embeddings = embed_texts(texts)
+
+        with self._lock:
+            section_ids = self._load()
+            stale = []
+            new_ids: Dict[str, List[str]] = defaultdict(list)
+            for section_id, metadata in zip(ids, metadatas):
+                new_ids[metadata["candidate_id"]].append(section_id)
+            for candidate_id, candidate_sections in new_ids.items():
+                keep = set(candidate_sections)
+                stale.extend(s for s in section_ids.get(candidate_id, []) if s not in keep)
+                section_ids[candidate_id] = candidate_sections
+
+            self.backend.upsert(
+                ids=ids,
+                embeddings=np.asarray(embeddings).tolist() if embeddings is not None else None,
+                documents=texts,
+                metadatas=metadatas
+            )
+            if stale:
+                self.backend.delete(ids=stale)
+
+    def remove(self, candidate_ids: List[str]) -> None:
+        """
+        Delete every section of candidates.
+
+        Args:
+            candidate_ids: Candidate IDs
+        """
+        with self._lock:
+            section_ids = self._load()
+            stale = [s for candidate_id in candidate_ids for s in section_ids.pop(candidate_id, [])]
+            if stale:
+                self.backend.delete(ids=stale)
+
+    def search(
+        self,
+        embedding: List[float],
+        top_k: int,
+        allowed_ids: Optional[List[str]] = None
+    ) -> List[Tuple[str, float, str]]:
+        """
+        Find the candidates whose sections best match a query embedding.
+
+        Weighted aggregation is approximate: candidates are shortlisted by their
+        best section (``top_k * SECTION_OVERSAMPLE`` of them) and only the
+        shortlist is rescored over all sections. A candidate whose best section
+        ranks below the shortlist but whose weighted mean would make the top_k
+        is missed.
+
+        Args:
+            embedding: Query embedding
+            top_k: Number of candidates to return
+            allowed_ids: Restrict the search to these candidates (optional)
+
+        Returns:
+            List of (candidate ID, aggregated distance, best section name), closest first
+        """
+        with self._lock:
+            section_ids = self._load()
+            allowed_sections = None
+            if allowed_ids is not None:
+                allowed_sections = [s for candidate_id in allowed_ids for s in section_ids.get(candidate_id, [])]
+                total = len(allowed_sections)
+            else:
+                total = sum(len(sections) for sections in section_ids.values())
+        if total == 0:
+            return []
+
+        shortlist = top_k * SECTION_OVERSAMPLE if self.aggregation == AGGREGATE_WEIGHTED else top_k
+
+        # Widen the section query until it covers the shortlist with distinct candidates
+        n_results = min(total, shortlist * SECTION_OVERSAMPLE)
+        while True:
+            results = self.backend.query(embedding, n_results, ids=allowed_sections)
+            best = self._best_sections(results)
+            if allowed_ids is not None:
+                # Backends may ignore very large ID subsets, so enforce it here
+                allowed = set(allowed_ids)
+                best = {candidate_id: hit for candidate_id, hit in best.items() if candidate_id in allowed}
+            if len(best) >= shortlist or n_results >= total:
+                break
+            n_results = min(total, n_results * 2)
+
+        ranked = sorted(best.items(), key=lambda item: -item[1][0])[:shortlist]
+        if self.aggregation == AGGREGATE_WEIGHTED:
+            return self.score(embedding, [candidate_id for candidate_id, _ in ranked])[:top_k]
+        return [(candidate_id, 1.0 - similarity, section) for candidate_id, (similarity, section) in ranked]
+
+    def score(self, embedding: List[float], candidate_ids: List[str]) -> List[Tuple[str, float, str]]:
+        """
+        Score specific candidates by aggregating all of their sections.
+
+        Args:
+            embedding: Query embedding
+            candidate_ids: Candidate IDs
+
+        Returns:
+            List of (candidate ID, aggregated distance, best section name), closest first
+        """
+        with self._lock:
+            section_ids = self._load()
+            wanted = [s for candidate_id in candidate_ids for s in section_ids.get(candidate_id, [])]
+        if not wanted:
+            return []
+
+        results = self.backend.query_ids(embedding, wanted)
+        similarities: Dict[str, List[Tuple[float, str]]] = defaultdict(list)
+        for metadata, distance in zip(results["metadatas"][0], results["distances"][0]):
+            similarities[metadata["candidate_id"]].append((1.0 - distance, metadata["section"]))
+
+        scored = []
+        for candidate_id, sections in similarities.items():
+            best_similarity, best_section = max(sections)
+            if self.aggregation == AGGREGATE_WEIGHTED:
+                weights = np.array([SECTION_WEIGHTS.get(section_type(name), 1.0) for _, name in sections])
+                values = np.array([similarity for similarity, _ in sections])
+                similarity = float(weights @ values / weights.sum())
+            else:
+                similarity = best_similarity
+            scored.append((candidate_id, 1.0 - similarity, best_section))
+
+        scored.sort(key=lambda item: item[1])
+        return scored
+
+    @staticmethod
+    def _best_sections(results: Dict[str, Any]) -> Dict[str, Tuple[float, str]]:
+        """Reduce section hits to each candidate's best (similarity, section name)."""
+        best: Dict[str, Tuple[float, str]] = {}
+        if not results or not results.get("ids") or not results["ids"][0]:
+            return best
+        for metadata, distance in zip(results["metadatas"][0], results["distances"][0]):
+            candidate_id = metadata["candidate_id"]
+            similarity = 1.0 - distance
+            if candidate_id not in best or similarity > best[candidate_id][0]:
+                best[candidate_id] = (similarity, metadata["section"])
+        return best
+
+    def _load(self) -> Dict[str, List[str]]:
+        """Build the candidate -> section IDs map from the backend on first use. Caller holds the lock."""
+        # Keep it in step with sections another process wrote since
+        self.backend.refresh()
+        if self._section_ids is not None and self._generation != self.backend.generation:
+            changed = self.backend.changed_since(self._generation)
+            self._generation = self.backend.generation
+            if changed is None:
+                self._section_ids = None
+            elif changed:
+                self._apply_changes(changed)
+        if self._section_ids is None:
+            self._generation = self.backend.generation
+            records = self.backend.get(include_documents=False)
+            section_ids: Dict[str, List[str]] = defaultdict(list)
+            for section_id, metadata in zip(records["ids"], records["metadatas"]):
+                section_ids[metadata["candidate_id"]].append(section_id)
+            self._section_ids = dict(section_ids)
+            logger.info(f"Loaded {len(records['ids'])} sections for {len(self._section_ids)} candidates")
+        return self._section_ids
+
+    def _apply_changes(self, changed: Set[str]) -> None:
+        """Update the candidate -> section IDs map for sections added or deleted elsewhere. Caller holds the lock."""
+        records = self.backend.get(ids=list(changed), include_documents=False)
+        present = set(records["ids"])
+        for section_id in changed - present:
+            # Section IDs are "<candidate ID>#<section name>"
+            candidate_sections = self._section_ids.get(section_id.rsplit("#", 1)[0])
+            if candidate_sections and section_id in candidate_sections:
+                candidate_sections.remove(section_id)
+        for section_id, metadata in zip(records["ids"], records["metadatas"]):
+            candidate_sections = self._section_ids.setdefault(metadata["candidate_id"], [])
+            if section_id not in candidate_sections:
+                candidate_sections.append(section_id)
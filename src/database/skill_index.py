@@ -0,0 +1,237 @@
+import threading
+from typing import List, Dict, Optional, Iterable, Tuple
+import numpy as np
+import logging
+
+# Configure logging
+logger = logging.getLogger("hire3x.skill_index")
+
+# Alias -> canonical skill name (both lowercased)
+SKILL_SYNONYMS = {
+    "js": "javascript",
+    "es6": "javascript",
+    "ts": "typescript",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "react.js": "react",
+    "reactjs": "react",
+    "vue": "vue.js",
+    "vuejs": "vue.js",
+    "angularjs": "angular",
+    "py": "python",
+    "python3": "python",
+    "golang": "go",
+    "k8s": "kubernetes",
+    "postgres": "postgresql",
+    "mongo": "mongodb",
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "nlp": "natural language processing",
+    "cv": "computer vision",
+    "amazon web services": "aws",
+    "google cloud": "gcp",
+    "google cloud platform": "gcp",
+    "microsoft azure": "azure",
+    "c sharp": "c#",
+    "csharp": "c#",
+    "cpp": "c++",
+    "ci-cd": "ci/cd",
+    "cicd": "ci/cd",
+    "tf": "tensorflow",
+    "sklearn": "scikit-learn",
+    "rn": "react native",
+}
+
+
+def normalize_skill(name: str) -> str:
+    """Lowercase and whitespace-normalize a skill name, then resolve synonyms."""
+    key = " ".join(name.lower().split())
+    return SKILL_SYNONYMS.get(key, key)
+
+
+class SkillIndex:
+    def __init__(self, initial_capacity: int = 1024):
+        """
+        Initialize an inverted index from normalized skill name to candidates.
+
+        Each skill maps to a packed bitmap over candidate positions, so skill
+        coverage for many candidates is computed with bit operations instead of
+        string scans.
+
+        Args:
+            initial_capacity: Number of candidate positions allocated up front
+        """
+        self._lock = threading.RLock()
+        self._capacity = max(8, initial_capacity)
+        self._ids: List[Optional[str]] = []
+        self._positions: Dict[str, int] = {}
+        self._free_positions: List[int] = []
+        self._doc_skills: List[List[Tuple[str, str]]] = []
+        self._bitmaps: Dict[str, np.ndarray] = {}
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def add(self, ids: List[str], skill_lists: List[Iterable[str]]) -> None:
+        """
+        Index (or re-index) the skills of candidates.
+
+        Args:
+            ids: Candidate IDs
+            skill_lists: Skill names of each candidate
+        """
+        with self._lock:
+            for candidate_id, skills in zip(ids, skill_lists):
+                position = self._positions.get(candidate_id)
+                if position is None:
+                    position = self._allocate(candidate_id)
+                else:
+                    self._clear(position)
+
+                doc_skills = []
+                for skill in skills:
+                    if not skill:
+                        continue
+                    canonical = normalize_skill(skill)
+                    doc_skills.append((canonical, skill))
+                    self._set_bit(canonical, position)
+                self._doc_skills[position] = doc_skills
+
+    def remove(self, ids: List[str]) -> None:
+        """
+        Drop candidates from the index.
+
+        Args:
+            ids: Candidate IDs to remove
+        """
+        with self._lock:
+            for candidate_id in ids:
+                position = self._positions.pop(candidate_id, None)
+                if position is None:
+                    continue
+                self._clear(position)
+                self._ids[position] = None
+                self._free_positions.append(position)
+
+    def membership(self, skills: List[str], ids: List[str]) -> np.ndarray:
+        """
+        Look up which of the given candidates have each skill.
+
+        Args:
+            skills: Canonical skill names (see normalize_skill)
+            ids: Candidate IDs (unknown IDs have no skills)
+
+        Returns:
+            Boolean matrix of shape (len(skills), len(ids))
+        """
+        with self._lock:
+            positions = np.array([self._positions.get(candidate_id, -1) for candidate_id in ids], dtype=np.int64)
+            known = positions >= 0
+            safe = np.where(known, positions, 0)
+            result = np.zeros((len(skills), len(ids)), dtype=bool)
+            for row, skill in enumerate(skills):
+                bitmap = self._bitmaps.get(skill)
+                if bitmap is not None:
+                    result[row] = ((bitmap[safe >> 3] >> (safe & 7)) & 1).astype(bool) & known
+            return result
+
+    def candidates_with_skills(
+        self,
+        skills: List[str],
+        min_count: int,
+        allowed_ids: Optional[List[str]] = None,
+        limit: Optional[int] = None
+    ) -> List[str]:
+        """
+        Find candidates that have at least ``min_count`` of the given skills.
+
+        Args:
+            skills: Canonical skill names (see normalize_skill)
+            min_count: Minimum number of the skills a candidate must have
+            allowed_ids: Restrict results to these candidates (optional)
+            limit: Maximum number of IDs to return, best coverage first (optional)
+
+        Returns:
+            Candidate IDs ordered by how many of the skills they have
+        """
+        skills = list(dict.fromkeys(skills))
+        if not skills or min_count <= 0:
+            return []
+
+        with self._lock:
+            n = len(self._ids)
+            counts = np.zeros(n, dtype=np.int32)
+            for skill in skills:
+                bitmap = self._bitmaps.get(skill)
+                if bitmap is not None:
+                    counts += np.unpackbits(bitmap, bitorder="little")[:n]
+
+            if allowed_ids is not None:
+                allowed = np.zeros(n, dtype=bool)
+                allowed[[self._positions[i] for i in allowed_ids if i in self._positions]] = True
+                counts[~allowed] = 0
+
+            positions = np.flatnonzero(counts >= min_count)
+            positions = positions[np.argsort(-counts[positions], kind="stable")]
+            if limit is not None:
+                positions = positions[:limit]
+            return [self._ids[position] for position in positions]
+
+    def matching_skills(self, candidate_id: str, skills: Iterable[str]) -> List[str]:
+        """
+        Get a candidate's own skill names that match any of the given skills.
+
+        Args:
+            candidate_id: ID of the candidate
+            skills: Canonical skill names (see normalize_skill)
+
+        Returns:
+            The candidate's skill names, in profile order
+        """
+        wanted = set(skills)
+        with self._lock:
+            position = self._positions.get(candidate_id)
+            if position is None:
+                return []
+            return [original for canonical, original in self._doc_skills[position] if canonical in wanted]
+
+    def __contains__(self, candidate_id: str) -> bool:
+        return candidate_id in self._positions
+
+    def _allocate(self, candidate_id: str) -> int:
+        """Assign a bitmap position to a new candidate."""
+        if self._free_positions:
+            position = self._free_positions.pop()
+            self._ids[position] = candidate_id
+        else:
+            position = len(self._ids)
+            self._ids.append(candidate_id)
+            self._doc_skills.append([])
+            if position >= self._capacity:
+                self._grow()
+        self._positions[candidate_id] = position
+        return position
+
+    def _grow(self) -> None:
+        """Double the capacity of every bitmap."""
+        self._capacity *= 2
+        for skill, bitmap in self._bitmaps.items():
+            grown = np.zeros(self._capacity // 8 + 1, dtype=np.uint8)
+            grown[:len(bitmap)] = bitmap
+            self._bitmaps[skill] = grown
+
+    def _set_bit(self, skill: str, position: int) -> None:
+        bitmap = self._bitmaps.get(skill)
+        if bitmap is None:
+            bitmap = np.zeros(self._capacity // 8 + 1, dtype=np.uint8)
+            self._bitmaps[skill] = bitmap
+        bitmap[position >> 3] |= np.uint8(1 << (position & 7))
+
+    def _clear(self, position: int) -> None:
+        """Unset every skill bit of a position."""
+        mask = np.uint8(~(1 << (position & 7)) & 0xFF)
+        for canonical, _ in self._doc_skills[position]:
+            bitmap = self._bitmaps.get(canonical)
+            if bitmap is not None:
+                bitmap[position >> 3] &= mask
+        self._doc_skills[position] = []
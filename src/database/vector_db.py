@@ -1,73 +1,167 @@
 import os
+import hashlib
+import threading
 from typing import List, Dict, Any, Tuple, Optional
-import chromadb
-from chromadb.utils import embedding_functions
 import numpy as np
 import logging
 
 from src.data_processing.hire3x_models import CandidateProfile, JobDescription
 from src.embeddings.generator import EmbeddingGenerator
+from src.database.profile_store import CandidateProfileStore
+from src.database.backends import create_backend, DEFAULT_BACKEND
+from src.database.metadata_index import MetadataIndex
+from src.database.skill_index import SkillIndex
+from src.database.sections import SectionIndex, AGGREGATE_MAX
 
 # Configure logging
 logger = logging.getLogger("hire3x.vector_db")
 
+
+def text_fingerprint(text: str) -> str:
+    """Fingerprint of an embedded profile text, stored in metadata to detect text changes."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
 class VectorDatabase:
     def __init__(
         self, 
         collection_name: str = "candidates", 
-        persist_directory: str = "./data/chroma",
-        embedding_generator: Optional[EmbeddingGenerator] = None
+        persist_directory: Optional[str] = None,
+        embedding_generator: Optional[EmbeddingGenerator] = None,
+        batch_size: int = 64,
+        profile_store: Optional[CandidateProfileStore] = None,
+        backend: Optional[str] = None,
+        multi_vector: Optional[bool] = None,
+        section_aggregation: str = AGGREGATE_MAX,
+        defer_embedding_generator: bool = False
     ):
         """
-        Initialize the vector database with ChromaDB.
+        Initialize the vector database on a pluggable vector backend.
         
         Args:
             collection_name: Name of the collection to use
-            persist_directory: Directory to persist the database
+            persist_directory: Directory to persist the database (defaults to ./data/chroma
+                for the chroma backend and ./data/vectors for the numpy backend)
             embedding_generator: EmbeddingGenerator instance to use
+            batch_size: Number of profiles per encode call when adding batches
+            profile_store: Store for full candidate profiles (defaults to profiles.sqlite
+                next to the persist directory)
+            backend: Vector backend name, "chroma" or "numpy" (defaults to the
+                HIRE3X_VECTOR_BACKEND environment variable, then "chroma")
+            multi_vector: Also index profile sections as separate vectors and search
+                them (defaults to the HIRE3X_MULTI_VECTOR environment variable)
+            section_aggregation: How section scores combine per candidate, "max" or "weighted"
+            defer_embedding_generator: The generator is attached later with
+                attach_embedding_generator, e.g. while the model loads in the background
         """
+        self.backend_name = (backend or DEFAULT_BACKEND).lower()
+        if persist_directory is None:
+            persist_directory = "./data/vectors" if self.backend_name == "numpy" else "./data/chroma"
         os.makedirs(persist_directory, exist_ok=True)
+        self.batch_size = batch_size
         
-        # Initialize ChromaDB client
-        logger.info(f"Initializing ChromaDB client with persistence at {persist_directory}")
-        try:
-            self.client = chromadb.PersistentClient(path=persist_directory)
-            logger.info("ChromaDB client initialized successfully")
-        except Exception as e:
-            logger.error(f"Failed to initialize ChromaDB client: {e}")
-            raise
+        # Bumped on every add, update or delete so cached search results can detect staleness
+        self.data_version = 0
+        
+        # Full profiles are kept outside the vector store for direct lookups by ID
+        if profile_store is None:
+            profile_store = CandidateProfileStore(
+                os.path.join(os.path.dirname(os.path.abspath(persist_directory)), "profiles.sqlite")
+            )
+        self.profile_store = profile_store
         
         # Store the embedding generator
         self.embedding_generator = embedding_generator
         
-        # Initialize collection with embedding function
-        try:
-            if embedding_generator:
-                # Create a custom embedding function that uses our embedding generator
-                def generate_embeddings(texts):
-                    return [self.embedding_generator.generate_embedding(text).tolist() for text in texts]
-                
-                # Create a wrapper class for ChromaDB
-                class CustomEmbeddingFunction(embedding_functions.EmbeddingFunction):
-                    def __call__(self, texts):
-                        return generate_embeddings(texts)
-                
-                logger.info(f"Creating/getting collection '{collection_name}' with custom embedding function")
-                self.collection = self.client.get_or_create_collection(
-                    name=collection_name,
-                    embedding_function=CustomEmbeddingFunction()
-                )
-            else:
-                # Use default embedding function
-                logger.info(f"Creating/getting collection '{collection_name}' with default embedding function")
-                self.collection = self.client.get_or_create_collection(
-                    name=collection_name
-                )
-            
-            logger.info(f"Collection initialized with {self.collection.count()} documents")
-        except Exception as e:
-            logger.error(f"Failed to initialize collection: {e}")
-            raise
+        # Text queries go through our embedding generator when we have (or will have) one
+        embed_texts = None
+        if embedding_generator or defer_embedding_generator:
+            def embed_texts(texts):
+                if self.embedding_generator is None:
+                    raise RuntimeError("No embedding generator attached yet")
+                return [self.embedding_generator.generate_embedding(text).tolist() for text in texts]
+        
+        self.backend = create_backend(self.backend_name, collection_name, persist_directory, embed_texts)
+        
+        # Optional multi-vector mode: one vector per profile section in a sibling collection
+        if multi_vector is None:
+            multi_vector = os.environ.get("HIRE3X_MULTI_VECTOR", "").lower() in ("1", "true", "yes")
+        self.sections = None
+        if multi_vector:
+            self.sections = SectionIndex(
+                create_backend(self.backend_name, f"{collection_name}_sections", persist_directory, embed_texts),
+                aggregation=section_aggregation
+            )
+        
+        # Metadata and skill indexes, built from the backend on first use
+        self.metadata_index = MetadataIndex()
+        self.skill_index = SkillIndex()
+        self._fingerprints: Dict[str, Optional[str]] = {}
+        self._indexes_ready = False
+        self._index_lock = threading.RLock()
+        self._synced_generation = self.backend.generation
+    
+    def attach_embedding_generator(self, embedding_generator: EmbeddingGenerator) -> None:
+        """
+        Attach the embedding generator of a database opened with ``defer_embedding_generator``.
+        
+        Args:
+            embedding_generator: EmbeddingGenerator instance to use
+        """
+        self.embedding_generator = embedding_generator
+    
+    def preload(self) -> None:
+        """
+        Build the in-memory metadata, skill and section indexes now rather than on the first search.
+        """
+        self._ensure_indexes()
+        if self.sections:
+            self.sections.preload()
+    
+    def sync(self) -> None:
+        """
+        Pick up candidates written by other processes, e.g. other prefork workers.
+        
+        When the backend picked up records written elsewhere, the changed
+        candidates are re-indexed (everything is rebuilt on next use if the
+        backend cannot tell which changed), their cached profiles are dropped
+        and the data version is bumped so cached match results expire.
+        """
+        self.backend.refresh()
+        with self._index_lock:
+            if self.backend.generation == self._synced_generation:
+                return
+            changed = self.backend.changed_since(self._synced_generation)
+            self._synced_generation = self.backend.generation
+            if changed is None:
+                self.metadata_index = MetadataIndex()
+                self.skill_index = SkillIndex()
+                self._fingerprints = {}
+                self._indexes_ready = False
+            elif self._indexes_ready and changed:
+                records = self.backend.get(ids=list(changed), include_documents=False)
+                present = set(records["ids"])
+                self._index_removed([candidate_id for candidate_id in changed if candidate_id not in present])
+                self._index_added(records["ids"], records["metadatas"])
+        if changed is None:
+            self.profile_store.clear_cache()
+        else:
+            self.profile_store.forget(changed)
+        self.data_version += 1
+    
+    def reopen(self) -> None:
+        """
+        Reopen database connections in a forked worker process.
+        
+        In-memory indexes and memory-mapped vectors built before the fork stay
+        shared copy-on-write with the parent; only the SQLite connections,
+        which must not cross a fork, are replaced. Only backends that support
+        it (numpy) can be shared this way.
+        """
+        self.profile_store.reopen()
+        self.backend.reopen()
+        if self.sections:
+            self.sections.backend.reopen()
     
     def add_candidate(self, candidate: CandidateProfile) -> None:
         """
@@ -89,26 +183,36 @@ class VectorDatabase:
             
             # Get metadata
             metadata = candidate.get_metadata()
+            metadata["text_fingerprint"] = text_fingerprint(text)
             
-            # Add to collection
-            self.collection.add(
+            # Add to the vector store
+            self.backend.add(
                 ids=[candidate.id],
                 embeddings=[embedding] if embedding else None,
                 documents=[text],
                 metadatas=[metadata]
             )
+            if self.sections:
+                self.sections.add([candidate], embed_texts=self._embed_section_texts)
+            self.profile_store.put(candidate)
+            self._index_added([candidate.id], [metadata])
+            self.data_version += 1
             
             logger.info(f"Successfully added candidate: {candidate.name}")
         except Exception as e:
             logger.error(f"Failed to add candidate {candidate.name}: {e}")
             raise
     
-    def add_candidates_batch(self, candidates: List[CandidateProfile]) -> None:
+    def add_candidates_batch(self, candidates: List[CandidateProfile], batch_size: Optional[int] = None) -> None:
         """
         Add multiple candidates to the database.
         
+        All profile texts are embedded through the generator's batched encoder
+        instead of one encode call per candidate.
+        
         Args:
             candidates: List of candidate profiles to add
+            batch_size: Number of profiles per encode call (defaults to the database's batch size)
         """
         if not candidates:
             logger.warning("No candidates provided to add_candidates_batch")
@@ -117,52 +221,108 @@ class VectorDatabase:
         try:
             logger.info(f"Adding batch of {len(candidates)} candidates")
             
-            ids = []
-            texts = []
-            metadatas = []
-            embeddings = []
-            
-            for candidate in candidates:
-                ids.append(candidate.id)
-                texts.append(candidate.to_text())
-                metadatas.append(candidate.get_metadata())
-                
-                if self.embedding_generator:
-                    embedding = self.embedding_generator.generate_candidate_embedding(candidate).tolist()
-                    embeddings.append(embedding)
-            
-            # Add to collection
-            self.collection.add(
+            ids = [candidate.id for candidate in candidates]
+            texts = [candidate.to_text() for candidate in candidates]
+            metadatas = [candidate.get_metadata() for candidate in candidates]
+            
+            embeddings = None
+            if self.embedding_generator:
+                embeddings = self.embedding_generator.generate_batch_embeddings(
+                    texts,
+                    batch_size=batch_size or self.batch_size
+                )
+            
+            self.add_embedded_candidates(candidates, embeddings, texts=texts, metadatas=metadatas)
+        except Exception as e:
+            logger.error(f"Failed to add candidates batch: {e}")
+            raise
+    
+    def add_embedded_candidates(
+        self,
+        candidates: List[CandidateProfile],
+        embeddings: Optional[np.ndarray],
+        texts: Optional[List[str]] = None,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+        section_embeddings: Optional[np.ndarray] = None
+    ) -> None:
+        """
+        Add candidates whose embeddings were computed elsewhere (e.g. by indexer workers).
+        
+        Args:
+            candidates: List of candidate profiles to add
+            embeddings: One embedding row per candidate (None lets the backend embed the texts)
+            texts: Profile texts, if already computed
+            metadatas: Profile metadata, if already computed
+            section_embeddings: Section embeddings in build_section_records order, used in
+                multi-vector mode (embedded here if omitted)
+        """
+        if not candidates:
+            return
+        
+        ids = [candidate.id for candidate in candidates]
+        if texts is None:
+            texts = [candidate.to_text() for candidate in candidates]
+        if metadatas is None:
+            metadatas = [candidate.get_metadata() for candidate in candidates]
+        for metadata, text in zip(metadatas, texts):
+            metadata["text_fingerprint"] = text_fingerprint(text)
+        
+        try:
+            # Add to the vector store
+            self.backend.add(
                 ids=ids,
-                embeddings=embeddings if embeddings else None,
+                embeddings=np.asarray(embeddings).tolist() if embeddings is not None else None,
                 documents=texts,
                 metadatas=metadatas
             )
+            if self.sections:
+                self.sections.add(candidates, section_embeddings, embed_texts=self._embed_section_texts)
+            self.profile_store.put_many(candidates)
+            self._index_added(ids, metadatas)
+            self.data_version += 1
             
             logger.info(f"Successfully added {len(candidates)} candidates")
         except Exception as e:
-            logger.error(f"Failed to add candidates batch: {e}")
+            logger.error(f"Failed to add embedded candidates: {e}")
             raise
     
     def search_candidates(
         self, 
         job: JobDescription, 
         top_k: int = 10, 
-        filters: Optional[Dict[str, Any]] = None
+        filters: Optional[Dict[str, Any]] = None,
+        skills: Optional[List[str]] = None,
+        min_skill_matches: int = 0
     ) -> List[Dict[str, Any]]:
         """
         Search for candidates matching a job description.
 
+        When ``skills`` and ``min_skill_matches`` are given, candidates having at
+        least that many of the skills are looked up in the skill index and
+        unioned with the vector hits, so strong skill matches are not lost just
+        because they fall outside the embedding top-k.
+
         Args:
             job: The job description to search with
             top_k: Number of top results to return
             filters: Optional filters to apply
+            skills: Canonical skill names for the skill candidate stage (optional)
+            min_skill_matches: Minimum number of ``skills`` a skill candidate must have
         Returns:
             List of matching candidates with scores
         """
         try:
             logger.info(f"Searching for candidates matching job: {job.title}")
             
+            # Resolve structured filters to an ID subset up front when the index can answer them
+            allowed_ids = None
+            if filters and self.metadata_index.supports(filters):
+                self._ensure_indexes()
+                allowed_ids = self.metadata_index.allowed_ids(filters)
+                logger.info(f"Metadata index narrowed search to {len(allowed_ids)} candidates")
+                if not allowed_ids:
+                    return []
+            
             job_text = job.to_text()
             job_embedding = None
             
@@ -182,29 +342,182 @@ class VectorDatabase:
                     # For single condition, use as is
                     where_clause = filters
         
-        # Run the query
-            logger.info(f"Executing query with top_k={top_k}, filters={where_clause}")
-            results = self.collection.query(
-                query_embeddings=[job_embedding] if job_embedding else None,
-                query_texts=[job_text] if not job_embedding else None,
-                n_results=top_k,
-                where=where_clause
-            )
-        
-            formatted_results = self._format_results(results)
+            use_sections = bool(self.sections is not None and job_embedding and (not filters or allowed_ids is not None))
+            if use_sections:
+                # Multi-vector mode: rank candidates by their aggregated section scores
+                logger.info(f"Executing section query with top_k={top_k}")
+                formatted_results = self._section_results(
+                    self.sections.search(job_embedding, top_k, allowed_ids=allowed_ids)
+                )
+            else:
+                # Run the query
+                logger.info(f"Executing query with top_k={top_k}, filters={where_clause}")
+                results = self.backend.query(
+                    embedding=job_embedding,
+                    n_results=top_k,
+                    where=where_clause,
+                    text=job_text,
+                    ids=allowed_ids
+                )
+                formatted_results = self._format_results(results)
             logger.info(f"Query returned {len(formatted_results)} results")
             
+            # Union in candidates that satisfy the skill requirement but missed the vector top-k
+            if skills and min_skill_matches > 0 and job_embedding:
+                self._ensure_indexes()
+                if filters and allowed_ids is None:
+                    logger.warning("Skipping skill candidate stage: filters are not supported by the metadata index")
+                else:
+                    seen = {result["id"] for result in formatted_results}
+                    skill_ids = self.skill_index.candidates_with_skills(
+                        skills,
+                        min_skill_matches,
+                        allowed_ids=allowed_ids,
+                        limit=top_k
+                    )
+                    extra_ids = [candidate_id for candidate_id in skill_ids if candidate_id not in seen]
+                    if extra_ids:
+                        if use_sections:
+                            extra_results = self._section_results(self.sections.score(job_embedding, extra_ids))
+                        else:
+                            extra_results = self._format_results(self.backend.query_ids(job_embedding, extra_ids))
+                        logger.info(f"Skill index added {len(extra_results)} candidates")
+                        formatted_results.extend(extra_results)
+            
             return formatted_results
         except Exception as e:
             logger.error(f"Error searching candidates: {e}")
             raise
         
+    def score_candidates(self, job: JobDescription, candidate_ids: List[str]) -> List[Dict[str, Any]]:
+        """
+        Score specific candidates against a job description without a search.
+        
+        Each candidate's stored vector (or, in multi-vector mode, its stored
+        sections) is compared with the job embedding directly, so the cost
+        depends on the number of IDs rather than on the size of the pool.
+        
+        Args:
+            job: The job description to score against
+            candidate_ids: IDs of the candidates to score
+            
+        Returns:
+            Results in the same format as search_candidates, in ``candidate_ids``
+            order; unknown IDs are left out
+        """
+        if not candidate_ids:
+            return []
+        if not self.embedding_generator:
+            raise ValueError("Scoring specific candidates requires an embedding generator")
+        
+        try:
+            self._ensure_indexes()
+            job_embedding = self.embedding_generator.generate_job_embedding(job).tolist()
+            
+            formatted_results = []
+            if self.sections is not None:
+                formatted_results = self._section_results(self.sections.score(job_embedding, candidate_ids))
+            
+            # Candidates without stored sections are scored on their profile vector
+            scored = {result["id"] for result in formatted_results}
+            remaining = [candidate_id for candidate_id in candidate_ids if candidate_id not in scored]
+            if remaining:
+                formatted_results.extend(self._format_results(self.backend.query_ids(job_embedding, remaining)))
+            
+            position = {candidate_id: i for i, candidate_id in enumerate(candidate_ids)}
+            formatted_results.sort(key=lambda result: position[result["id"]])
+            return formatted_results
+        except Exception as e:
+            logger.error(f"Error scoring candidates: {e}")
+            raise
+    
+    def _ensure_indexes(self) -> None:
+        """Populate the metadata and skill indexes from every record in the backend, once."""
+        self.sync()
+        with self._index_lock:
+            if self._indexes_ready:
+                return
+            
+            logger.info("Building metadata and skill indexes from the vector store")
+            records = self.backend.get(include_documents=False)
+            self.metadata_index.add(records["ids"], records["metadatas"])
+            self.skill_index.add(records["ids"], [self._metadata_skills(m) for m in records["metadatas"]])
+            self._fingerprints = {
+                candidate_id: (metadata or {}).get("text_fingerprint")
+                for candidate_id, metadata in zip(records["ids"], records["metadatas"])
+            }
+            self._indexes_ready = True
+            logger.info(f"Indexes built with {len(self.metadata_index)} candidates")
+    
+    def _index_added(self, ids: List[str], metadatas: List[Dict[str, Any]]) -> None:
+        """Keep the metadata and skill indexes in step with added or updated records."""
+        with self._index_lock:
+            if self._indexes_ready:
+                self.metadata_index.add(ids, metadatas)
+                self.skill_index.add(ids, [self._metadata_skills(m) for m in metadatas])
+                for candidate_id, metadata in zip(ids, metadatas):
+                    self._fingerprints[candidate_id] = metadata.get("text_fingerprint")
+    
+    def _index_removed(self, ids: List[str]) -> None:
+        """Keep the metadata and skill indexes in step with deleted records."""
+        with self._index_lock:
+            if self._indexes_ready:
+                self.metadata_index.remove(ids)
+                self.skill_index.remove(ids)
+                for candidate_id in ids:
+                    self._fingerprints.pop(candidate_id, None)
+    
+    @staticmethod
+    def _metadata_skills(metadata: Dict[str, Any]) -> List[str]:
+        """Split the comma-joined skills string stored in metadata."""
+        skills = (metadata or {}).get("skills", "")
+        return skills.split(",") if skills else []
+    
+    def _embed_section_texts(self, texts: List[str]) -> Optional[np.ndarray]:
+        """Embed section texts with the generator (None lets the backend embed them)."""
+        if not self.embedding_generator:
+            return None
+        return self.embedding_generator.generate_batch_embeddings(texts, batch_size=self.batch_size)
+    
+    def _section_results(self, hits: List[Tuple[str, float, str]]) -> List[Dict[str, Any]]:
+        """
+        Turn aggregated section hits into formatted results with candidate metadata.
+        
+        Args:
+            hits: (candidate ID, aggregated distance, best section name) tuples
+            
+        Returns:
+            Formatted results in hit order, with the best matching section of each candidate
+        """
+        if not hits:
+            return []
+        
+        records = self.backend.get(ids=[candidate_id for candidate_id, _, _ in hits])
+        by_id = {
+            candidate_id: (metadata, document)
+            for candidate_id, metadata, document in zip(records["ids"], records["metadatas"], records["documents"])
+        }
+        
+        formatted_results = []
+        for candidate_id, distance, section in hits:
+            if candidate_id not in by_id:
+                continue
+            metadata, document = by_id[candidate_id]
+            formatted_results.append({
+                "id": candidate_id,
+                "score": distance,
+                "metadata": metadata,
+                "document": document,
+                "matched_section": section
+            })
+        return formatted_results
+    
     def _format_results(self, results: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Format the query results.
         
         Args:
-            results: The raw query results from ChromaDB
+            results: The raw query results from the vector backend
             
         Returns:
             Formatted results
@@ -235,7 +548,12 @@ class VectorDatabase:
         """
         try:
             logger.info(f"Deleting candidate with ID: {candidate_id}")
-            self.collection.delete(ids=[candidate_id])
+            self.backend.delete(ids=[candidate_id])
+            if self.sections:
+                self.sections.remove([candidate_id])
+            self.profile_store.delete(candidate_id)
+            self._index_removed([candidate_id])
+            self.data_version += 1
             logger.info(f"Successfully deleted candidate {candidate_id}")
         except Exception as e:
             logger.error(f"Failed to delete candidate {candidate_id}: {e}")
@@ -249,7 +567,7 @@ class VectorDatabase:
             Number of candidates
         """
         try:
-            count = self.collection.count()
+            count = self.backend.count()
             logger.info(f"Database contains {count} candidates")
             return count
         except Exception as e:
@@ -268,7 +586,7 @@ class VectorDatabase:
         """
         try:
             logger.info(f"Retrieving candidate with ID: {candidate_id}")
-            result = self.collection.get(ids=[candidate_id])
+            result = self.backend.get(ids=[candidate_id])
             
             if not result or not result["ids"]:
                 logger.warning(f"Candidate {candidate_id} not found")
@@ -288,28 +606,93 @@ class VectorDatabase:
     
     def update_candidate(self, candidate: CandidateProfile) -> None:
         """
-        Update an existing candidate in the database.
+        Update an existing candidate in the database (added if it does not exist).
         
         Args:
             candidate: The updated candidate profile
         """
+        logger.info(f"Updating candidate: {candidate.name}")
+        self.upsert_candidates([candidate])
+    
+    def upsert_candidates(
+        self,
+        candidates: List[CandidateProfile],
+        batch_size: Optional[int] = None
+    ) -> Dict[str, int]:
+        """
+        Insert or update candidates, re-embedding only those whose profile text changed.
+        
+        The fingerprint of each profile's ``to_text()`` is compared with the one
+        stored at indexing time. New candidates and candidates with a changed
+        text are embedded; candidates with an unchanged text keep their stored
+        embedding. The whole batch is written with a single backend upsert.
+        Without an embedding generator the backend embeds the documents itself,
+        so every candidate in the batch is re-embedded.
+        
+        Args:
+            candidates: List of candidate profiles
+            batch_size: Number of profiles per encode call (defaults to the database's batch size)
+            
+        Returns:
+            Dictionary with the number of candidates re-embedded and updated in place
+        """
+        if not candidates:
+            return {"embedded": 0, "metadata_only": 0}
+        
         try:
-            logger.info(f"Updating candidate: {candidate.name}")
+            self._ensure_indexes()
             
-            # Check if candidate exists
-            existing = self.get_candidate(candidate.id)
-            if not existing:
-                logger.warning(f"Candidate {candidate.id} not found, adding as new")
-                self.add_candidate(candidate)
-                return
+            texts = [candidate.to_text() for candidate in candidates]
+            metadatas = [candidate.get_metadata() for candidate in candidates]
+            for metadata, text in zip(metadatas, texts):
+                metadata["text_fingerprint"] = text_fingerprint(text)
             
-            # Delete the existing candidate
-            self.delete_candidate(candidate.id)
+            with self._index_lock:
+                changed = [
+                    i for i, candidate in enumerate(candidates)
+                    if self._fingerprints.get(candidate.id) != metadatas[i]["text_fingerprint"]
+                ]
+            changed_set = set(changed)
+            unchanged = [i for i in range(len(candidates)) if i not in changed_set]
+            ids = [candidate.id for candidate in candidates]
             
-            # Add the updated candidate
-            self.add_candidate(candidate)
+            embeddings = None
+            if self.embedding_generator:
+                embeddings = [None] * len(candidates)
+                if unchanged:
+                    stored = self.backend.get(
+                        ids=[ids[i] for i in unchanged],
+                        include_embeddings=True,
+                        include_documents=False
+                    )
+                    stored_embeddings = dict(zip(stored["ids"], stored["embeddings"]))
+                    for i in unchanged:
+                        embeddings[i] = stored_embeddings.get(ids[i])
+                    # Rows deleted since the fingerprints were read are embedded again
+                    missing = [i for i in unchanged if embeddings[i] is None]
+                    if missing:
+                        changed = sorted(changed + missing)
+                        unchanged = [i for i in unchanged if embeddings[i] is not None]
+                if changed:
+                    new_embeddings = self.embedding_generator.generate_batch_embeddings(
+                        [texts[i] for i in changed],
+                        batch_size=batch_size or self.batch_size
+                    )
+                    for i, embedding in zip(changed, new_embeddings):
+                        embeddings[i] = embedding.tolist()
+            else:
+                changed, unchanged = list(range(len(candidates))), []
             
-            logger.info(f"Successfully updated candidate: {candidate.name}")
+            self.backend.upsert(ids=ids, embeddings=embeddings, documents=texts, metadatas=metadatas)
+            if self.sections and changed:
+                self.sections.add([candidates[i] for i in changed], embed_texts=self._embed_section_texts)
+            
+            self.profile_store.put_many(candidates)
+            self._index_added(ids, metadatas)
+            self.data_version += 1
+            
+            logger.info(f"Upserted {len(candidates)} candidates ({len(changed)} re-embedded)")
+            return {"embedded": len(changed), "metadata_only": len(unchanged)}
         except Exception as e:
-            logger.error(f"Failed to update candidate {candidate.name}: {e}")
-            raise
\ No newline at end of file
+            logger.error(f"Failed to upsert candidates: {e}")
+            raise
@@ -0,0 +1,169 @@
+import os
+import time
+import queue
+import threading
+from bisect import bisect_left
+from concurrent.futures import Future
+from typing import Callable, List, Dict, Any, Optional, Tuple
+import numpy as np
+import logging
+
+# Configure logging
+logger = logging.getLogger("hire3x.batching")
+
+# Upper bounds of the histogram buckets (the last bucket is open-ended)
+BATCH_SIZE_BUCKETS = [1, 2, 4, 8, 16, 32, 64, 128]
+QUEUE_WAIT_MS_BUCKETS = [1, 2, 5, 10, 20, 50, 100, 250]
+
+
+class Histogram:
+    def __init__(self, buckets: List[float]):
+        """
+        Initialize a fixed-bucket histogram.
+
+        Args:
+            buckets: Sorted upper bounds of the buckets
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.total = 0.0
+        self.samples = 0
+
+    def observe(self, value: float) -> None:
+        """Record one sample."""
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.samples += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Return the bucket counts, sample count and mean."""
+        labels = [f"<={bound}" for bound in self.buckets] + [f">{self.buckets[-1]}"]
+        return {
+            "buckets": dict(zip(labels, self.counts)),
+            "count": self.samples,
+            "mean": self.total / self.samples if self.samples else 0.0
+        }
+
+
+class EmbeddingBatcher:
+    def __init__(
+        self,
+        encode_batch: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 5.0
+    ):
+        """
+        Initialize a coalescer that turns concurrent single-text requests into batches.
+
+        Callers block in ``embed`` while a background thread collects texts for
+        up to ``max_wait_ms`` after the first one arrives (or until
+        ``max_batch_size`` texts are waiting), encodes them with one
+        ``encode_batch`` call and hands each row back to its caller.
+
+        Args:
+            encode_batch: Function embedding a list of texts into a 2-D array
+            max_batch_size: Maximum number of texts per encode call
+            max_wait_ms: Longest time the first text of a batch waits for company
+        """
+        self.encode_batch = encode_batch
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        self._stats_lock = threading.Lock()
+        self._batch_sizes = Histogram(BATCH_SIZE_BUCKETS)
+        self._queue_wait_ms = Histogram(QUEUE_WAIT_MS_BUCKETS)
+
+        self._worker_lock = threading.Lock()
+        self._worker_pid: Optional[int] = None
+        self._start_worker()
+
+    def submit(self, text: str) -> Future:
+        """
+        Queue a text for embedding.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            A future resolving to the embedding
+        """
+        if self._worker_pid != os.getpid():
+            self._start_worker()
+        future: Future = Future()
+        self._queue.put((text, future, time.perf_counter()))
+        return future
+
+    def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a text as part of the next batch, blocking until it is done.
+
+        Args:
+            text: The text to embed
+
+        Returns:
+            A numpy array containing the embedding
+        """
+        return self.submit(text).result()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get batch-size and queue-wait histograms.
+
+        Returns:
+            Dictionary with the configuration, pending count and both histograms
+        """
+        with self._stats_lock:
+            return {
+                "max_batch_size": self.max_batch_size,
+                "max_wait_ms": self.max_wait * 1000.0,
+                "pending": self._queue.qsize(),
+                "batch_size": self._batch_sizes.snapshot(),
+                "queue_wait_ms": self._queue_wait_ms.snapshot()
+            }
+
+    def _start_worker(self) -> None:
+        """Start the worker thread, again in a forked child where the parent's thread does not exist."""
+        with self._worker_lock:
+            if self._worker_pid == os.getpid():
+                return
+            # A queue inherited across fork still lists the parent's worker as its waiter
+            self._queue: "queue.Queue[Tuple[str, Future, float]]" = queue.Queue()
+            self._worker = threading.Thread(target=self._run, name="hire3x-embedding-batcher", daemon=True)
+            self._worker.start()
+            self._worker_pid = os.getpid()
+
+    def _collect(self) -> List[Tuple[str, Future, float]]:
+        """Block for one request, then gather more until the batch is full or the wait is over."""
+        batch = [self._queue.get()]
+        deadline = batch[0][2] + self.max_wait
+        while len(batch) < self.max_batch_size:
+            remaining = deadline - time.perf_counter()
+            try:
+                if remaining <= 0:
+                    batch.append(self._queue.get_nowait())
+                else:
+                    batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self) -> None:
+        """Worker loop: collect a batch, encode it and resolve its futures."""
+        while True:
+            batch = self._collect()
+            started = time.perf_counter()
+
+            with self._stats_lock:
+                self._batch_sizes.observe(len(batch))
+                for _, _, enqueued in batch:
+                    self._queue_wait_ms.observe((started - enqueued) * 1000.0)
+
+            try:
+                embeddings = self.encode_batch([text for text, _, _ in batch])
+                for (_, future, _), embedding in zip(batch, embeddings):
+                    future.set_result(embedding)
+            except Exception as e:
+                logger.error(f"Error embedding batch of {len(batch)} texts: {e}")
+                for _, future, _ in batch:
+                    if not future.done():
+                        future.set_exception(e)
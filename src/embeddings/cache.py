@@ -0,0 +1,209 @@
+import os
+import hashlib
+import threading
+from contextlib import contextmanager
+from collections import OrderedDict
+from typing import Dict, Optional
+import numpy as np
+import logging
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
+# Configure logging
+logger = logging.getLogger("hire3x.embedding_cache")
+
+KEY_SIZE = 32  # sha256 digest length in bytes
+
+
+class EmbeddingCache:
+    def __init__(self, cache_dir: str, dimension: int, memory_size: int = 10000):
+        """
+        Initialize a two-tier embedding cache keyed by content hash.
+
+        The memory tier is a bounded LRU. The disk tier is an append-only file of
+        fixed-size (key, vector) records that is memory-mapped for reads, so
+        cached embeddings survive restarts without being loaded eagerly.
+
+        Args:
+            cache_dir: Directory holding the on-disk tier
+            dimension: Embedding dimension of the vectors being cached
+            memory_size: Maximum number of embeddings kept in the memory tier
+        """
+        os.makedirs(cache_dir, exist_ok=True)
+
+        self.dimension = dimension
+        self.memory_size = memory_size
+        self.path = os.path.join(cache_dir, f"embeddings-{dimension}d.bin")
+        self.record_dtype = np.dtype([("key", "u1", (KEY_SIZE,)), ("vector", "<f4", (dimension,))])
+
+        self._memory: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._rows: Dict[bytes, int] = {}
+        self._mmap: Optional[np.memmap] = None
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.memory_hits = 0
+        self.disk_hits = 0
+
+        self._load_disk_index()
+        logger.info(f"Embedding cache opened at {self.path} with {len(self._rows)} persisted entries")
+
+    @staticmethod
+    def make_key(model_name: str, text: str) -> bytes:
+        """
+        Build the cache key for a text embedded with a given model.
+
+        Whitespace is collapsed so trivially reformatted text maps to the same key.
+
+        Args:
+            model_name: Name of the embedding model
+            text: The text being embedded
+
+        Returns:
+            A sha256 digest
+        """
+        normalized = " ".join(text.split())
+        return hashlib.sha256(f"{model_name}\0{normalized}".encode("utf-8")).digest()
+
+    def get(self, key: bytes) -> Optional[np.ndarray]:
+        """
+        Look up an embedding by key, checking memory first and then disk.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            A copy of the cached embedding, or None on a miss
+        """
+        with self._lock:
+            embedding = self._memory.get(key)
+            if embedding is not None:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                self.memory_hits += 1
+                return embedding.copy()
+
+            row = self._rows.get(key)
+            if row is not None:
+                embedding = np.array(self._mapped(row + 1)[row]["vector"], dtype=np.float32)
+                self._remember(key, embedding)
+                self.hits += 1
+                self.disk_hits += 1
+                return embedding.copy()
+
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, embedding: np.ndarray) -> None:
+        """
+        Store an embedding in both tiers.
+
+        Args:
+            key: Cache key from make_key
+            embedding: The embedding to store
+        """
+        embedding = np.asarray(embedding, dtype=np.float32)
+        if embedding.shape != (self.dimension,):
+            logger.warning(f"Not caching embedding with unexpected shape {embedding.shape}")
+            return
+
+        with self._lock:
+            self._remember(key, embedding.copy())
+            if key in self._rows:
+                return
+
+            record = np.zeros(1, dtype=self.record_dtype)
+            record["key"] = np.frombuffer(key, dtype=np.uint8)
+            record["vector"] = embedding
+
+            try:
+                with self._locked_for_append() as (f, end):
+                    f.write(record.tobytes())
+                    f.flush()
+                self._rows[key] = end // self.record_dtype.itemsize
+            except OSError as e:
+                logger.error(f"Failed to persist embedding to cache: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters and tier sizes.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "memory_hits": self.memory_hits,
+                "disk_hits": self.disk_hits,
+                "memory_entries": len(self._memory),
+                "disk_entries": len(self._rows)
+            }
+
+    def _load_disk_index(self) -> None:
+        """Read the keys of all complete records in the disk tier."""
+        if not os.path.exists(self.path):
+            return
+
+        # Drop a partially written trailing record left by an interrupted append
+        with self._locked_for_append():
+            pass
+
+        records = self._mapped()
+        if records is None:
+            return
+
+        for row, key in enumerate(records["key"]):
+            self._rows[key.tobytes()] = row
+
+    @contextmanager
+    def _locked_for_append(self):
+        """
+        Open the disk tier for appending under an exclusive file lock.
+
+        A partially written trailing record, left by a writer that died mid-append,
+        is truncated first so the next record starts on a record boundary.
+
+        Yields:
+            The open file and the offset the next record will be written at
+        """
+        with open(self.path, "ab") as f:
+            if fcntl:
+                fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                end = f.seek(0, os.SEEK_END)
+                partial = end % self.record_dtype.itemsize
+                if partial:
+                    logger.warning(f"Dropping {partial} bytes of a partially written record from {self.path}")
+                    end -= partial
+                    f.truncate(end)
+                yield f, end
+            finally:
+                if fcntl:
+                    fcntl.flock(f, fcntl.LOCK_UN)
+
+    def _mapped(self, min_rows: int = 0) -> Optional[np.memmap]:
+        """Return a memory map covering every complete record on disk."""
+        if self._mmap is not None and min_rows and len(self._mmap) >= min_rows:
+            return self._mmap
+
+        size = os.path.getsize(self.path) if os.path.exists(self.path) else 0
+        count = size // self.record_dtype.itemsize
+        if count == 0:
+            return None
+
+        if self._mmap is None or len(self._mmap) < count:
+            self._mmap = np.memmap(self.path, dtype=self.record_dtype, mode="r", shape=(count,))
+        return self._mmap
+
+    def _remember(self, key: bytes, embedding: np.ndarray) -> None:
+        """Add an embedding to the memory tier, evicting the least recently used entry if full."""
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
@@ -1,33 +1,98 @@
 import os
-from typing import Union, List, Optional
-from sentence_transformers import SentenceTransformer
+from typing import Union, List, Dict, Optional, Any
 import numpy as np
 import logging
 
 from src.data_processing.hire3x_models import CandidateProfile, JobDescription
+from src.embeddings.cache import EmbeddingCache
+from src.embeddings.batching import EmbeddingBatcher
 
 # Configure logging
 logger = logging.getLogger("hire3x.embeddings")
 
+# Inference backend used when none is passed: "torch" or "onnx"
+DEFAULT_EMBEDDING_BACKEND = os.environ.get("HIRE3X_EMBEDDING_BACKEND", "torch")
+
+# Use the int8-quantized ONNX export when the onnx backend is selected
+DEFAULT_ONNX_QUANTIZED = os.environ.get("HIRE3X_ONNX_QUANTIZED", "").lower() in ("1", "true", "yes")
+
 class EmbeddingGenerator:
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_dir: str = "./models"):
+    def __init__(
+        self,
+        model_name: str = "all-MiniLM-L6-v2",
+        cache_dir: str = "./models",
+        batch_size: int = 64,
+        embedding_cache_dir: Optional[str] = "./data/embedding_cache",
+        embedding_cache_size: int = 10000,
+        micro_batch_size: int = 32,
+        micro_batch_wait_ms: float = 5.0,
+        backend: Optional[str] = None,
+        onnx_quantized: Optional[bool] = None
+    ):
         """
         Initialize the embedding generator with a pre-trained model.
         
         Args:
             model_name: The name of the sentence-transformers model to use
             cache_dir: Directory to cache the model
+            batch_size: Default number of texts per encode call in batch mode
+            embedding_cache_dir: Directory for the persistent embedding cache (None disables caching)
+            embedding_cache_size: Number of embeddings kept in the in-memory cache tier
+            micro_batch_size: Maximum number of concurrent job texts encoded together
+            micro_batch_wait_ms: How long a job text waits for others to share its batch (0 disables coalescing)
+            backend: "torch" (sentence-transformers) or "onnx" (ONNX Runtime export of the cached
+                snapshot, see scripts/export_onnx.py); defaults to HIRE3X_EMBEDDING_BACKEND
+            onnx_quantized: Use the int8-quantized ONNX export (defaults to HIRE3X_ONNX_QUANTIZED)
         """
         os.makedirs(cache_dir, exist_ok=True)
         
-        logger.info(f"Initializing EmbeddingGenerator with model: {model_name}")
+        self.model_name = model_name
+        self.batch_size = batch_size
+        self.backend = (backend or DEFAULT_EMBEDDING_BACKEND).lower()
+        if self.backend not in ("torch", "onnx"):
+            raise ValueError(f"Unknown embedding backend: {self.backend}")
+        
+        logger.info(f"Initializing EmbeddingGenerator with model: {model_name} ({self.backend} backend)")
         try:
-            self.model = SentenceTransformer(model_name, cache_folder=cache_dir)
+            if self.backend == "onnx":
+                from src.embeddings.onnx_backend import OnnxSentenceEncoder, resolve_snapshot_dir
+                if onnx_quantized is None:
+                    onnx_quantized = DEFAULT_ONNX_QUANTIZED
+                self.model = OnnxSentenceEncoder(
+                    resolve_snapshot_dir(model_name, cache_dir),
+                    quantized=onnx_quantized
+                )
+            else:
+                # Imported here so the onnx backend never pays for loading PyTorch
+                from sentence_transformers import SentenceTransformer
+                self.model = SentenceTransformer(model_name, cache_folder=cache_dir)
             self.embedding_dimension = self.model.get_sentence_embedding_dimension()
             logger.info(f"Model loaded successfully. Embedding dimension: {self.embedding_dimension}")
         except Exception as e:
             logger.error(f"Failed to load model {model_name}: {e}")
             raise
+        
+        # Quantized embeddings differ slightly, so they are cached apart from full-precision ones
+        self._cache_namespace = model_name
+        if self.backend == "onnx" and onnx_quantized:
+            self._cache_namespace = f"{model_name}:onnx-int8"
+        
+        self.embedding_cache = None
+        if embedding_cache_dir:
+            self.embedding_cache = EmbeddingCache(
+                embedding_cache_dir,
+                self.embedding_dimension,
+                memory_size=embedding_cache_size
+            )
+        
+        self.batcher = None
+        if micro_batch_wait_ms > 0 and micro_batch_size > 1:
+            # Job embeddings reach the batcher only after missing the cache, so it skips the lookup
+            self.batcher = EmbeddingBatcher(
+                self._encode_uncached,
+                max_batch_size=micro_batch_size,
+                max_wait_ms=micro_batch_wait_ms
+            )
     
     def generate_embedding(self, text: str) -> np.ndarray:
         """
@@ -39,8 +104,17 @@ class EmbeddingGenerator:
         Returns:
             A numpy array containing the embedding
         """
+        cache_key = None
+        if self.embedding_cache:
+            cache_key = EmbeddingCache.make_key(self._cache_namespace, text)
+            cached = self.embedding_cache.get(cache_key)
+            if cached is not None:
+                return cached
+        
         try:
             embedding = self.model.encode(text, show_progress_bar=False)
+            if cache_key is not None:
+                self.embedding_cache.put(cache_key, embedding)
             return embedding
         except Exception as e:
             logger.error(f"Error generating embedding: {e}")
@@ -66,6 +140,9 @@ class EmbeddingGenerator:
         """
         Generate an embedding for a job description.
         
+        Cache misses go through the micro-batcher, so concurrent searches
+        share one forward pass instead of running one each.
+        
         Args:
             job: The job description
             
@@ -74,26 +151,107 @@ class EmbeddingGenerator:
         """
         logger.info(f"Generating embedding for job: {job.title}")
         text = job.to_text()
-        return self.generate_embedding(text)
+        if self.batcher is None:
+            return self.generate_embedding(text)
+        
+        if self.embedding_cache:
+            cached = self.embedding_cache.get(EmbeddingCache.make_key(self._cache_namespace, text))
+            if cached is not None:
+                return cached
+        return self.batcher.embed(text)
     
-    def generate_batch_embeddings(self, texts: List[str]) -> np.ndarray:
+    def generate_batch_embeddings(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
         """
         Generate embeddings for a batch of texts.
         
+        Texts are sorted by length and encoded in chunks of ``batch_size`` so
+        that each forward pass pads to a similar sequence length. Texts already
+        in the embedding cache are not re-encoded. The returned rows are in the
+        same order as ``texts``.
+        
         Args:
             texts: List of texts to embed
+            batch_size: Number of texts per encode call (defaults to the generator's batch size)
             
         Returns:
             A numpy array containing the embeddings
         """
-        logger.info(f"Generating batch embeddings for {len(texts)} texts")
-        try:
-            embeddings = self.model.encode(texts, show_progress_bar=True)
-            return embeddings
-        except Exception as e:
-            logger.error(f"Error generating batch embeddings: {e}")
-            # Return zero embeddings as fallback
-            return np.zeros((len(texts), self.embedding_dimension))
+        if not texts:
+            return np.zeros((0, self.embedding_dimension), dtype=np.float32)
+        
+        batch_size = batch_size or self.batch_size
+        embeddings = np.zeros((len(texts), self.embedding_dimension), dtype=np.float32)
+        
+        # Serve what we can from the cache and only encode the rest
+        pending = list(range(len(texts)))
+        if self.embedding_cache:
+            pending = []
+            for i, text in enumerate(texts):
+                cached = self.embedding_cache.get(EmbeddingCache.make_key(self._cache_namespace, text))
+                if cached is not None:
+                    embeddings[i] = cached
+                else:
+                    pending.append(i)
+        
+        logger.info(
+            f"Generating batch embeddings for {len(pending)} of {len(texts)} texts (batch size {batch_size})"
+        )
+        if pending:
+            embeddings[pending] = self._encode_uncached([texts[i] for i in pending], batch_size)
+        return embeddings
+    
+    def _encode_uncached(self, texts: List[str], batch_size: Optional[int] = None) -> np.ndarray:
+        """
+        Encode texts without looking them up in the embedding cache, then cache the results.
+        
+        Args:
+            texts: List of texts to embed
+            batch_size: Number of texts per encode call (defaults to the generator's batch size)
+            
+        Returns:
+            A numpy array containing the embeddings, in the same order as ``texts``
+        """
+        batch_size = batch_size or self.batch_size
+        embeddings = np.zeros((len(texts), self.embedding_dimension), dtype=np.float32)
+        
+        # Longest texts first so padding within a chunk stays minimal
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        
+        for start in range(0, len(order), batch_size):
+            chunk = order[start:start + batch_size]
+            try:
+                chunk_embeddings = self.model.encode(
+                    [texts[i] for i in chunk],
+                    batch_size=len(chunk),
+                    show_progress_bar=False
+                )
+                embeddings[chunk] = chunk_embeddings
+                if self.embedding_cache:
+                    for i, embedding in zip(chunk, chunk_embeddings):
+                        self.embedding_cache.put(EmbeddingCache.make_key(self._cache_namespace, texts[i]), embedding)
+            except Exception as e:
+                logger.error(f"Error generating batch embeddings for chunk starting at {start}: {e}")
+                # Leave zero embeddings as fallback for this chunk
+        
+        return embeddings
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters for the embedding cache.
+        
+        Returns:
+            Cache statistics, or an empty dictionary if caching is disabled
+        """
+        return self.embedding_cache.stats() if self.embedding_cache else {}
+    
+    def get_batching_stats(self) -> Dict[str, Any]:
+        """
+        Get batch-size and queue-wait histograms of the job embedding micro-batcher.
+        
+        Returns:
+            Batcher statistics, or an empty dictionary if coalescing is disabled
+        """
+        return self.batcher.stats() if self.batcher else {}
     
     def get_model_name(self) -> str:
         """
@@ -102,7 +260,7 @@ class EmbeddingGenerator:
         Returns:
             The model name
         """
-        return self.model.get_sentence_embedding_dimension_name()
+        return self.model_name
     
     def get_embedding_dimension(self) -> int:
         """
@@ -0,0 +1,179 @@
+import os
+import json
+from typing import Union, List, Optional
+import numpy as np
+import logging
+
+# Configure logging
+logger = logging.getLogger("hire3x.embeddings")
+
+# File names of the exported models inside a snapshot's onnx/ directory
+ONNX_MODEL_FILE = "model.onnx"
+ONNX_QUANTIZED_MODEL_FILE = "model_quantized.onnx"
+
+
+def resolve_snapshot_dir(model_name: str, cache_dir: str = "./models") -> str:
+    """
+    Find the local snapshot of a sentence-transformers model in a Hugging Face cache directory.
+
+    Args:
+        model_name: Model name, e.g. "all-MiniLM-L6-v2" or "sentence-transformers/all-MiniLM-L6-v2"
+        cache_dir: Cache directory the model was downloaded to
+
+    Returns:
+        Path of the snapshot directory
+    """
+    if os.path.isdir(model_name):
+        return model_name
+    if "/" not in model_name:
+        model_name = f"sentence-transformers/{model_name}"
+
+    model_dir = os.path.join(cache_dir, "models--" + model_name.replace("/", "--"))
+    snapshots_dir = os.path.join(model_dir, "snapshots")
+    ref_path = os.path.join(model_dir, "refs", "main")
+    if os.path.exists(ref_path):
+        with open(ref_path) as f:
+            snapshot = os.path.join(snapshots_dir, f.read().strip())
+        if os.path.isdir(snapshot):
+            return snapshot
+    if os.path.isdir(snapshots_dir):
+        snapshots = sorted(os.listdir(snapshots_dir))
+        if snapshots:
+            return os.path.join(snapshots_dir, snapshots[-1])
+    raise FileNotFoundError(f"No local snapshot of {model_name} in {cache_dir}")
+
+
+def onnx_model_path(snapshot_dir: str, quantized: bool = False) -> str:
+    """
+    Path of the exported ONNX model of a snapshot (see scripts/export_onnx.py).
+
+    Args:
+        snapshot_dir: Model snapshot directory
+        quantized: Whether to use the dynamically int8-quantized model
+
+    Returns:
+        Path of the ONNX model file
+    """
+    return os.path.join(snapshot_dir, "onnx", ONNX_QUANTIZED_MODEL_FILE if quantized else ONNX_MODEL_FILE)
+
+
+class OnnxSentenceEncoder:
+    def __init__(
+        self,
+        snapshot_dir: str,
+        model_path: Optional[str] = None,
+        quantized: bool = False,
+        max_seq_length: Optional[int] = None,
+        intra_op_threads: Optional[int] = None
+    ):
+        """
+        Initialize a sentence encoder running an exported transformer through ONNX Runtime.
+
+        It mirrors the snapshot's sentence-transformers pipeline: the same
+        ``tokenizer.json`` with truncation at ``max_seq_length``, mean pooling
+        over the attention mask and, if the snapshot has a Normalize module,
+        L2 normalization. Only ``tokenizers`` and ``onnxruntime`` are needed,
+        not PyTorch.
+
+        Args:
+            snapshot_dir: Model snapshot directory with tokenizer.json and the onnx/ export
+            model_path: ONNX model file (defaults to the snapshot's export)
+            quantized: Use the int8-quantized export when model_path is omitted
+            max_seq_length: Maximum tokens per text (defaults to sentence_bert_config.json)
+            intra_op_threads: ONNX Runtime intra-op threads (defaults to the runtime's choice)
+        """
+        import onnxruntime
+        from tokenizers import Tokenizer
+
+        self.snapshot_dir = snapshot_dir
+        self.model_path = model_path or onnx_model_path(snapshot_dir, quantized)
+        if not os.path.exists(self.model_path):
+            raise FileNotFoundError(
+                f"ONNX model {self.model_path} not found; export it with scripts/export_onnx.py"
+            )
+
+        if max_seq_length is None:
+            max_seq_length = self._read_json("sentence_bert_config.json").get("max_seq_length", 256)
+        self.max_seq_length = max_seq_length
+        self.normalize = any(
+            module.get("type", "").endswith("Normalize") for module in self._read_json("modules.json", [])
+        )
+
+        self.tokenizer = Tokenizer.from_file(os.path.join(snapshot_dir, "tokenizer.json"))
+        self.tokenizer.enable_truncation(max_length=max_seq_length)
+        self.tokenizer.enable_padding(pad_id=self.tokenizer.token_to_id("[PAD]") or 0, pad_token="[PAD]")
+
+        options = onnxruntime.SessionOptions()
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        if intra_op_threads:
+            options.intra_op_num_threads = intra_op_threads
+        self.session = onnxruntime.InferenceSession(
+            self.model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"]
+        )
+        self._input_names = {model_input.name for model_input in self.session.get_inputs()}
+        self.embedding_dimension = self.session.get_outputs()[0].shape[-1]
+        logger.info(f"Loaded ONNX model {self.model_path} (max sequence length {max_seq_length})")
+
+    def encode(
+        self,
+        sentences: Union[str, List[str]],
+        batch_size: int = 32,
+        show_progress_bar: bool = False
+    ) -> np.ndarray:
+        """
+        Embed one text or a list of texts, like ``SentenceTransformer.encode``.
+
+        Args:
+            sentences: A text or list of texts
+            batch_size: Number of texts per forward pass
+            show_progress_bar: Accepted for API compatibility; ignored
+
+        Returns:
+            A 1-D embedding for a single text, otherwise an array with one row per text
+        """
+        single = isinstance(sentences, str)
+        texts = [sentences] if single else list(sentences)
+        if not texts:
+            return np.zeros((0, self.embedding_dimension), dtype=np.float32)
+
+        embeddings = np.zeros((len(texts), self.embedding_dimension), dtype=np.float32)
+        for start in range(0, len(texts), batch_size):
+            embeddings[start:start + batch_size] = self._encode_batch(texts[start:start + batch_size])
+        return embeddings[0] if single else embeddings
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """
+        Get the dimension of the embeddings produced by the model.
+
+        Returns:
+            The embedding dimension
+        """
+        return self.embedding_dimension
+
+    def _encode_batch(self, texts: List[str]) -> np.ndarray:
+        """Tokenize, run and pool one batch of texts."""
+        encodings = self.tokenizer.encode_batch(texts)
+        input_ids = np.array([encoding.ids for encoding in encodings], dtype=np.int64)
+        attention_mask = np.array([encoding.attention_mask for encoding in encodings], dtype=np.int64)
+
+        inputs = {"input_ids": input_ids, "attention_mask": attention_mask}
+        if "token_type_ids" in self._input_names:
+            inputs["token_type_ids"] = np.array([encoding.type_ids for encoding in encodings], dtype=np.int64)
+        token_embeddings = self.session.run(None, inputs)[0]
+
+        # Mean pooling over real (non-padding) tokens
+        mask = attention_mask[:, :, None].astype(np.float32)
+        pooled = (token_embeddings * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+        if self.normalize:
+            pooled /= np.clip(np.linalg.norm(pooled, axis=1, keepdims=True), 1e-12, None)
+        return pooled
+
+    def _read_json(self, name: str, default=None):
+        """Read a JSON file of the snapshot, or return ``default`` if it is missing."""
+        path = os.path.join(self.snapshot_dir, name)
+        if not os.path.exists(path):
+            return {} if default is None else default
+        with open(path) as f:
+            return json.load(f)
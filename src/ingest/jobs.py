@@ -0,0 +1,368 @@
+import os
+import re
+import json
+import time
+import uuid
+import shutil
+import threading
+from contextlib import contextmanager
+from concurrent.futures import ThreadPoolExecutor
+from typing import BinaryIO, List, Dict, Any, Optional
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+from src.ingest.stream import JsonRecordReader, read_chunks, ingest_records
+
+# Configure logging
+logger = logging.getLogger("hire3x.ingest")
+
+# Job states
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+# At most this many per-record errors are kept in a job's state
+MAX_STORED_ERRORS = 200
+
+# Job IDs are uuid4 hex strings; anything else is not looked up on disk
+JOB_ID_PATTERN = re.compile(r"[0-9a-f]{32}")
+
+
+class IngestJobManager:
+    def __init__(
+        self,
+        vector_db,
+        jobs_dir: str = "./data/ingest",
+        workers: int = 1,
+        chunk_size: int = 256
+    ):
+        """
+        Initialize a background ingest job queue with on-disk checkpoints.
+
+        Each job lives in ``jobs_dir/<job_id>/`` as a copy of the uploaded
+        source plus a ``state.json`` checkpoint. The checkpoint is rewritten
+        after every committed chunk with the byte offset to continue from, so a
+        job interrupted by a crash or restart resumes where it left off.
+
+        ``state.json`` is the only record of a job, so every worker process of
+        a prefork server sees the same jobs. A job is run, cancelled or resumed
+        only while holding an exclusive lock on its ``lock`` file, which the
+        running process keeps until the job stops; a running job is cancelled
+        through a ``cancel`` flag file it checks between chunks.
+
+        Args:
+            vector_db: The VectorDatabase jobs ingest into
+            jobs_dir: Directory holding job sources and checkpoints
+            workers: Number of jobs processed concurrently
+            chunk_size: Number of records validated and committed together
+        """
+        self.vector_db = vector_db
+        self.jobs_dir = jobs_dir
+        self.chunk_size = chunk_size
+        os.makedirs(jobs_dir, exist_ok=True)
+
+        # Jobs locked by this process; guards threads where flock is unavailable
+        self._lock = threading.Lock()
+        self._locked: set = set()
+        self._stopping = threading.Event()
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="hire3x-ingest-job")
+
+    def submit(self, source: BinaryIO, filename: str = "") -> str:
+        """
+        Store an upload as a new job and queue it.
+
+        Args:
+            source: Binary file-like object with NDJSON or a JSON array of candidates
+            filename: Original file name, kept for reference
+
+        Returns:
+            The job ID
+        """
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(self.jobs_dir, job_id)
+        os.makedirs(job_dir)
+        with open(os.path.join(job_dir, "source"), "wb") as f:
+            shutil.copyfileobj(source, f, 1 << 20)
+
+        now = time.time()
+        self._save({
+            "id": job_id,
+            "filename": filename,
+            "status": QUEUED,
+            "offset": 0,
+            "mode": None,
+            "records": 0,
+            "added": 0,
+            "failed": 0,
+            "chunks": 0,
+            "errors": [],
+            "error": None,
+            "created_at": now,
+            "updated_at": now
+        })
+
+        logger.info(f"Queued ingest job {job_id} ({filename})")
+        self._pool.submit(self._run, job_id)
+        return job_id
+
+    def status(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the state of a job.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            The job state, or None if the job is unknown
+        """
+        return self._read(job_id)
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """
+        Get the state of every job, newest first (without per-record errors).
+
+        Returns:
+            List of job states
+        """
+        jobs = []
+        for job_id in os.listdir(self.jobs_dir):
+            state = self._read(job_id)
+            if state:
+                state.pop("errors", None)
+                jobs.append(state)
+        return sorted(jobs, key=lambda state: state["created_at"], reverse=True)
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Stop a job after its current chunk. Committed chunks are kept.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            True if the job was queued or running
+        """
+        state = self._read(job_id)
+        if not state or state["status"] not in (QUEUED, RUNNING):
+            return False
+
+        with self._job_lock(job_id) as acquired:
+            if acquired:
+                # Nothing is running the job, so cancel it right away (a queued
+                # copy of it in any worker's pool then finds it cancelled)
+                state = self._read(job_id)
+                if state["status"] not in (QUEUED, RUNNING):
+                    return False
+                self._set_status(state, CANCELLED)
+            else:
+                # The process running the job stops at its next chunk
+                with open(self._path(job_id, "cancel"), "w"):
+                    pass
+        logger.info(f"Cancellation requested for ingest job {job_id}")
+        return True
+
+    def resume(self, job_id: str) -> bool:
+        """
+        Re-queue a cancelled or failed job from its last checkpoint.
+
+        Args:
+            job_id: ID of the job
+
+        Returns:
+            True if the job was re-queued
+        """
+        with self._job_lock(job_id) as acquired:
+            state = self._read(job_id) if acquired else None
+            if not state or state["status"] not in (CANCELLED, FAILED):
+                return False
+            state["error"] = None
+            # A flag written just as the job last stopped must not cancel the resumed run
+            self._clear_cancel(job_id)
+            self._set_status(state, QUEUED)
+
+        logger.info(f"Resuming ingest job {job_id} from offset {state['offset']}")
+        self._pool.submit(self._run, job_id)
+        return True
+
+    def resume_pending(self) -> int:
+        """
+        Queue jobs that are queued, or were running in a process that has stopped.
+
+        A job another live process is running holds its lock and is skipped. Every
+        worker may call this; a job queued by several workers runs in whichever
+        takes its lock first, and the others find it no longer pending.
+
+        Returns:
+            Number of jobs queued
+        """
+        pending = []
+        for job_id in os.listdir(self.jobs_dir):
+            state = self._read(job_id)
+            if not state or state["status"] not in (QUEUED, RUNNING):
+                continue
+            with self._job_lock(job_id) as acquired:
+                if acquired:
+                    pending.append(job_id)
+
+        for job_id in pending:
+            logger.info(f"Resuming interrupted ingest job {job_id}")
+            self._pool.submit(self._run, job_id)
+        return len(pending)
+
+    def shutdown(self) -> None:
+        """Stop workers after their current chunk; unfinished jobs resume on next start."""
+        # Running jobs stay marked as running, and their released locks let resume_pending pick them up
+        self._stopping.set()
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+    def _run(self, job_id: str) -> None:
+        """Process one job from its checkpoint until it finishes, fails or is cancelled."""
+        with self._job_lock(job_id) as acquired:
+            if acquired:
+                self._process(job_id)
+
+    def _process(self, job_id: str) -> None:
+        """Run a job whose lock this process holds."""
+        state = self._read(job_id)
+        # Already finished, or cancelled while it waited in the queue
+        if not state or state["status"] not in (QUEUED, RUNNING):
+            return
+        cancel_path = self._path(job_id, "cancel")
+        if os.path.exists(cancel_path):
+            self._finish(state, CANCELLED)
+            logger.info(f"Ingest job {job_id} cancelled before it started")
+            return
+        self._set_status(state, RUNNING)
+
+        source_path = self._path(job_id, "source")
+        try:
+            with open(source_path, "rb") as f:
+                f.seek(state["offset"])
+                reader = JsonRecordReader(
+                    f,
+                    start_offset=state["offset"],
+                    start_number=state["records"],
+                    mode=state["mode"]
+                )
+                for chunk in read_chunks(reader, self.chunk_size):
+                    if self._stopping.is_set() or os.path.exists(cancel_path):
+                        break
+
+                    progress = ingest_records(self.vector_db, chunk)
+                    state["offset"] = progress["end_offset"]
+                    state["mode"] = reader.mode
+                    state["records"] += progress["records"]
+                    state["added"] += progress["added"]
+                    state["failed"] += progress["failed"]
+                    state["chunks"] += 1
+                    room = MAX_STORED_ERRORS - len(state["errors"])
+                    if room > 0:
+                        state["errors"].extend(progress["errors"][:room])
+                    state["updated_at"] = time.time()
+                    self._save(state)
+
+            if os.path.exists(cancel_path):
+                self._finish(state, CANCELLED)
+                logger.info(f"Ingest job {job_id} cancelled at offset {state['offset']}")
+            elif not self._stopping.is_set():
+                self._finish(state, COMPLETED)
+                logger.info(
+                    f"Ingest job {job_id} completed: {state['added']} added, {state['failed']} failed"
+                )
+        except Exception as e:
+            logger.error(f"Ingest job {job_id} failed at offset {state['offset']}: {e}")
+            state["error"] = str(e)
+            self._finish(state, FAILED)
+
+    @contextmanager
+    def _job_lock(self, job_id: str):
+        """
+        Try to take a job's exclusive lock without waiting.
+
+        Yields:
+            True if this thread now holds the lock, False if another thread or process does
+        """
+        if not JOB_ID_PATTERN.fullmatch(job_id):
+            yield False
+            return
+        with self._lock:
+            if job_id in self._locked:
+                acquired = False
+            else:
+                self._locked.add(job_id)
+                acquired = True
+        if not acquired:
+            yield False
+            return
+
+        try:
+            try:
+                lock_file = open(self._path(job_id, "lock"), "a")
+            except FileNotFoundError:
+                # Unknown job
+                yield False
+                return
+            with lock_file:
+                if fcntl is not None:
+                    try:
+                        fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                    except BlockingIOError:
+                        yield False
+                        return
+                # Closing the file releases the lock, also if this process dies
+                yield True
+        finally:
+            with self._lock:
+                self._locked.discard(job_id)
+
+    def _finish(self, state: Dict[str, Any], status: str) -> None:
+        """Move a job to a terminal state and clear its cancel flag. Caller holds the job lock."""
+        self._set_status(state, status)
+        self._clear_cancel(state["id"])
+
+    def _clear_cancel(self, job_id: str) -> None:
+        """Remove a job's cancel flag if it has one."""
+        try:
+            os.remove(self._path(job_id, "cancel"))
+        except FileNotFoundError:
+            pass
+
+    def _set_status(self, state: Dict[str, Any], status: str) -> None:
+        """Change a job's status and persist it. Caller holds the job lock."""
+        state["status"] = status
+        state["updated_at"] = time.time()
+        self._save(state)
+
+    def _path(self, job_id: str, name: str) -> str:
+        """Path of a file in a job's directory."""
+        return os.path.join(self.jobs_dir, job_id, name)
+
+    def _save(self, state: Dict[str, Any]) -> None:
+        """Atomically write a job's checkpoint. Caller holds the job lock or is creating the job."""
+        path = self._path(state["id"], "state.json")
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+
+    def _read(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Read a job's checkpoint, or None if the job is unknown or its checkpoint unreadable."""
+        if not JOB_ID_PATTERN.fullmatch(job_id):
+            return None
+        path = self._path(job_id, "state.json")
+        try:
+            with open(path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.error(f"Skipping unreadable ingest job checkpoint {path}: {e}")
+            return None
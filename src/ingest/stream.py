@@ -0,0 +1,259 @@
+import re
+import json
+import uuid
+import codecs
+from typing import BinaryIO, Iterator, List, Dict, Any, Optional, NamedTuple
+import logging
+
+from src.data_processing.hire3x_models import CandidateProfile
+
+# Configure logging
+logger = logging.getLogger("hire3x.ingest")
+
+WHITESPACE = " \t\r\n"
+# Rest of a buffer made up only of characters of JSON literals and numbers, which may be cut off there
+TOKEN_TAIL = re.compile(r"[0-9+\-.eEtrufalsn]*\Z")
+
+# Parsing modes of JsonRecordReader
+MODE_NDJSON = "ndjson"
+MODE_ARRAY = "array"
+
+
+class StreamRecord(NamedTuple):
+    """One top-level record read from a stream."""
+    number: int  # 0-based position of the record in the stream
+    end_offset: int  # Byte offset just past the record, usable to resume reading
+    data: Optional[Any]  # Parsed JSON value (None if it could not be parsed)
+    error: Optional[str]  # Parse error message, if any
+
+
+class JsonRecordReader:
+    def __init__(
+        self,
+        stream: BinaryIO,
+        read_size: int = 1 << 20,
+        start_offset: int = 0,
+        start_number: int = 0,
+        mode: Optional[str] = None
+    ):
+        """
+        Initialize an incremental reader over NDJSON or a JSON array of records.
+
+        Only ``read_size`` bytes plus the record being parsed are held in
+        memory, so arbitrarily large exports can be read. The format is
+        detected from the first non-blank character unless ``mode`` is given,
+        which is required when resuming an array stream from an offset.
+
+        Args:
+            stream: Binary file-like object positioned at ``start_offset``
+            read_size: Number of bytes read per call
+            start_offset: Byte offset the stream is positioned at
+            start_number: Number of records before ``start_offset``
+            mode: "ndjson" or "array" (detected if omitted)
+        """
+        self.stream = stream
+        self.read_size = read_size
+        self.mode = mode
+        self.offset = start_offset
+        self.number = start_number
+        self._decoder = json.JSONDecoder()
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        # Text read so far and the position of the next unread character in it
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._finished = False
+
+    def __iter__(self) -> Iterator[StreamRecord]:
+        return self
+
+    def __next__(self) -> StreamRecord:
+        while not self._finished:
+            if not self._skip_separators():
+                continue  # Need more data, or the stream ended
+            pos = self._pos
+
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, pos)
+            except json.JSONDecodeError as e:
+                if self._needs_more(pos, e):
+                    self._fill()
+                    continue
+                return self._parse_error(pos, e)
+
+            # A value cut off at the end of the buffer may still be valid JSON (e.g. "-0" of "-0.25")
+            if not self._eof and TOKEN_TAIL.match(self._buffer, end):
+                self._fill()
+                continue
+
+            return self._emit(end, value, None)
+
+        raise StopIteration
+
+    def _skip_separators(self) -> bool:
+        """Move past whitespace (and array punctuation); True when positioned at the start of a record."""
+        buffer = self._buffer
+        pos = self._pos
+        while True:
+            while pos < len(buffer) and buffer[pos] in WHITESPACE:
+                pos += 1
+            if pos == len(buffer):
+                self._advance(pos)
+                if self._eof:
+                    self._finished = True
+                else:
+                    self._fill()
+                return False
+
+            char = buffer[pos]
+            if self.mode is None:
+                self.mode = MODE_ARRAY if char == "[" else MODE_NDJSON
+                if char == "[":
+                    pos += 1
+                    continue
+            if self.mode == MODE_ARRAY and char == ",":
+                pos += 1
+                continue
+            if self.mode == MODE_ARRAY and char == "]":
+                self._advance(pos + 1)
+                self._finished = True
+                return False
+
+            self._advance(pos)
+            return True
+
+    def _needs_more(self, pos: int, error: json.JSONDecodeError) -> bool:
+        """Whether a failed parse may just be a record that has not fully arrived."""
+        if self._eof:
+            return False
+        if self.mode == MODE_NDJSON:
+            # A complete NDJSON line that fails to parse is malformed, not truncated
+            return self._buffer.find("\n", pos) < 0
+        # In an array, a truncated element fails inside an unterminated string, in a
+        # \uXXXX escape or in a literal or number cut off at the end of the buffer;
+        # anything else is malformed
+        if error.msg.startswith("Unterminated string"):
+            return True
+        if error.msg.startswith("Invalid \\uXXXX escape"):
+            return len(self._buffer) - error.pos <= len("\\uXXXX")
+        return TOKEN_TAIL.match(self._buffer, error.pos) is not None
+
+    def _parse_error(self, pos: int, error: json.JSONDecodeError) -> StreamRecord:
+        """Report a malformed record and skip past it where the format allows."""
+        if self.mode == MODE_NDJSON:
+            newline = self._buffer.find("\n", pos)
+            end = len(self._buffer) if newline < 0 else newline + 1
+            return self._emit(end, None, f"Invalid JSON: {error.msg}")
+
+        # No reliable way to find the next array element; stop and skip the rest of the stream
+        skipped = len(self._buffer[pos:].encode("utf-8")) + self._skip_rest()
+        self._finished = True
+        return self._emit(
+            len(self._buffer),
+            None,
+            f"Invalid JSON: {error.msg}; stopped reading the array and skipped its remaining {skipped} bytes"
+        )
+
+    def _emit(self, end: int, value: Optional[Any], error: Optional[str]) -> StreamRecord:
+        self._advance(end)
+        record = StreamRecord(self.number, self.offset, value, error)
+        self.number += 1
+        return record
+
+    def _advance(self, end: int) -> None:
+        """Move the read position to ``end``, adding the bytes passed over to the byte offset."""
+        if end > self._pos:
+            self.offset += len(self._buffer[self._pos:end].encode("utf-8"))
+            self._pos = end
+
+    def _skip_rest(self) -> int:
+        """Read the stream to its end without parsing, returning the number of bytes skipped."""
+        skipped = 0
+        while True:
+            chunk = self.stream.read(self.read_size)
+            if not chunk:
+                break
+            skipped += len(chunk)
+        self.offset += skipped
+        self._eof = True
+        return skipped
+
+    def _fill(self) -> None:
+        """Read more of the stream, first dropping the part of the buffer already read."""
+        chunk = self.stream.read(self.read_size)
+        if not chunk:
+            text = self._utf8.decode(b"", final=True)
+            self._eof = True
+        else:
+            text = self._utf8.decode(chunk)
+        self._buffer = self._buffer[self._pos:] + text
+        self._pos = 0
+
+
+def read_chunks(reader: JsonRecordReader, chunk_size: int) -> Iterator[List[StreamRecord]]:
+    """
+    Group records from a reader into lists of at most ``chunk_size``.
+
+    Args:
+        reader: The record reader
+        chunk_size: Maximum number of records per chunk
+
+    Returns:
+        Iterator over record chunks
+    """
+    chunk: List[StreamRecord] = []
+    for record in reader:
+        chunk.append(record)
+        if len(chunk) >= chunk_size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def ingest_records(vector_db, records: List[StreamRecord]) -> Dict[str, Any]:
+    """
+    Validate a chunk of records and commit the valid ones to the vector database.
+
+    Records without an ID get a generated one. A failure to commit the chunk
+    marks all of its valid records as failed but does not raise.
+
+    Args:
+        vector_db: The VectorDatabase to add candidates to
+        records: Records read from a JsonRecordReader
+
+    Returns:
+        Progress for the chunk: counts, per-record errors and the resume offset
+    """
+    candidates = []
+    numbers = []
+    errors = []
+    for record in records:
+        if record.error:
+            errors.append({"record": record.number, "error": record.error})
+            continue
+        try:
+            data = record.data
+            if "id" not in data:
+                data["id"] = str(uuid.uuid4())
+            candidates.append(CandidateProfile(**data))
+            numbers.append(record.number)
+        except Exception as e:
+            errors.append({"record": record.number, "error": f"Invalid candidate: {e}"})
+
+    added = 0
+    if candidates:
+        try:
+            vector_db.add_candidates_batch(candidates)
+            added = len(candidates)
+        except Exception as e:
+            logger.error(f"Error committing chunk of {len(candidates)} candidates: {e}")
+            errors.extend({"record": number, "error": f"Failed to index: {e}"} for number in numbers)
+
+    return {
+        "records": len(records),
+        "added": added,
+        "failed": len(records) - added,
+        "errors": errors,
+        "end_offset": records[-1].end_offset if records else None
+    }
@@ -0,0 +1,218 @@
+import re
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Optional, Set
+import numpy as np
+
+from src.data_processing.hire3x_models import JobDescription
+from src.database.skill_index import normalize_skill
+
+# Common tech role keywords
+ROLE_KEYWORDS = {
+    "developer", "engineer", "architect", "scientist", "analyst", "designer",
+    "manager", "lead", "administrator", "specialist", "consultant",
+    "devops", "frontend", "backend", "fullstack", "full stack", "full-stack",
+    "mobile", "ios", "android", "web", "cloud", "security", "data",
+    "machine learning", "ml", "ai", "artificial intelligence", "ui", "ux",
+    "qa", "quality", "test", "automation", "database", "dba"
+}
+
+# Patterns like "5+ years", "3-5 years", etc., tried in order
+EXPERIENCE_PATTERNS = [
+    re.compile(r'(\d+)\+?\s*years?'),  # "5+ years", "5 years"
+    re.compile(r'(\d+)[-–]\d+\s*years?'),  # "3-5 years"
+    re.compile(r'at least (\d+)\s*years?'),  # "at least 3 years"
+    re.compile(r'minimum (\d+)\s*years?')  # "minimum 3 years"
+]
+
+# Fallback years of experience by experience level
+EXPERIENCE_LEVEL_YEARS = {
+    "entry level": 0.0,
+    "junior": 1.0,
+    "mid-level": 3.0,
+    "senior": 5.0,
+    "lead": 7.0,
+    "principal": 8.0,
+    "staff": 8.0,
+    "architect": 10.0,
+    "expert": 10.0
+}
+
+# Order of the weighted factors in the overall score
+WEIGHT_KEYS = [
+    "similarity",
+    "skill_match",
+    "role_match",
+    "experience",
+    "skill_proficiency",
+    "assessment",
+    "profile_completion",
+    "activity"
+]
+
+DEFAULT_WEIGHTS = {
+    "similarity": 0.15,
+    "skill_match": 0.20,
+    "role_match": 0.15,
+    "experience": 0.10,
+    "skill_proficiency": 0.10,
+    "assessment": 0.15,
+    "profile_completion": 0.05,
+    "activity": 0.10
+}
+
+# (title keywords, weights) checked in order; the first family that matches wins
+ROLE_FAMILY_WEIGHTS = [
+    # Data Science / ML / AI roles - prioritize skills and assessments
+    (["data scientist", "machine learning", "ml", "ai ", "artificial intelligence"], {
+        "similarity": 0.10,
+        "skill_match": 0.25,
+        "role_match": 0.10,
+        "experience": 0.10,
+        "skill_proficiency": 0.15,
+        "assessment": 0.20,
+        "profile_completion": 0.05,
+        "activity": 0.05
+    }),
+    # Engineering / Development roles - balanced approach
+    (["engineer", "developer", "programmer", "coder"], {
+        "similarity": 0.15,
+        "skill_match": 0.20,
+        "role_match": 0.15,
+        "experience": 0.10,
+        "skill_proficiency": 0.10,
+        "assessment": 0.15,
+        "profile_completion": 0.05,
+        "activity": 0.10
+    }),
+    # Leadership roles - prioritize experience and role match
+    (["lead", "manager", "director", "head", "chief", "architect"], {
+        "similarity": 0.10,
+        "skill_match": 0.15,
+        "role_match": 0.20,
+        "experience": 0.20,
+        "skill_proficiency": 0.10,
+        "assessment": 0.10,
+        "profile_completion": 0.05,
+        "activity": 0.10
+    }),
+    # Design roles - prioritize portfolio and skills
+    (["designer", "ui", "ux", "user interface", "user experience"], {
+        "similarity": 0.15,
+        "skill_match": 0.25,
+        "role_match": 0.10,
+        "experience": 0.10,
+        "skill_proficiency": 0.15,
+        "assessment": 0.10,
+        "profile_completion": 0.05,
+        "activity": 0.10
+    })
+]
+
+
+# Memoized plans keyed by job content hash
+PLAN_CACHE_SIZE = 256
+_plan_cache: "OrderedDict[str, JobQueryPlan]" = OrderedDict()
+_plan_lock = threading.Lock()
+
+
+def extract_role_keywords(job_title: str) -> Set[str]:
+    """Extract important role keywords from job title."""
+    job_title_lower = job_title.lower()
+    return {keyword for keyword in ROLE_KEYWORDS if keyword in job_title_lower}
+
+
+def extract_experience_requirement(job: JobDescription) -> float:
+    """Extract years of experience required from job description."""
+    for req in job.requirements:
+        req_lower = req.lower()
+        for pattern in EXPERIENCE_PATTERNS:
+            match = pattern.search(req_lower)
+            if match:
+                return float(match.group(1))
+
+    # If not found, infer from experience level
+    for level, years in EXPERIENCE_LEVEL_YEARS.items():
+        if level in job.experience_level.lower():
+            return years
+
+    # Default based on general experience level
+    if "senior" in job.title.lower():
+        return 5.0
+    elif "junior" in job.title.lower():
+        return 1.0
+    elif "lead" in job.title.lower() or "principal" in job.title.lower():
+        return 7.0
+
+    return 2.0  # Default moderate experience if nothing found
+
+
+def get_role_specific_weights(job_title: str) -> Dict[str, float]:
+    """Get role-specific weights for different factors in the overall score."""
+    job_title_lower = job_title.lower()
+
+    for keywords, weights in ROLE_FAMILY_WEIGHTS:
+        if any(kw in job_title_lower for kw in keywords):
+            return dict(weights)
+
+    return dict(DEFAULT_WEIGHTS)
+
+
+class JobQueryPlan:
+    def __init__(self, job: JobDescription, job_hash: Optional[str] = None):
+        """
+        Precompute everything about a job description that matching needs.
+
+        Build plans through ``JobQueryPlan.for_job`` so that repeated requests
+        for the same job reuse one plan.
+
+        Args:
+            job: The job description
+            job_hash: Content hash of the job (computed if omitted)
+        """
+        self.job = job
+        self.job_hash = job_hash or job.content_hash()
+        self.title_lower = job.title.lower()
+
+        self.required_skills = set(job.required_skills)
+        self.required_skills_lower = {skill.lower() for skill in self.required_skills}
+        self.required_skills_canonical: List[str] = list(dict.fromkeys(
+            normalize_skill(skill) for skill in job.required_skills
+        ))
+        self.required_assessments_lower = [a.lower() for a in (job.required_assessments or [])]
+
+        self.experience_patterns = EXPERIENCE_PATTERNS
+        self.role_keywords = extract_role_keywords(job.title)
+        self.required_years = extract_experience_requirement(job)
+        self.weights = get_role_specific_weights(job.title)
+        self.weight_vector = np.array([self.weights[key] for key in WEIGHT_KEYS], dtype=np.float64)
+
+        # Top requirement lines used when writing outreach emails
+        self.requirement_highlights: List[str] = [
+            job.requirements[i] if len(job.requirements) > i else '' for i in range(3)
+        ]
+
+    @classmethod
+    def for_job(cls, job: JobDescription) -> "JobQueryPlan":
+        """
+        Get the memoized plan for a job, building it on first use.
+
+        Args:
+            job: The job description
+
+        Returns:
+            The query plan for the job
+        """
+        job_hash = job.content_hash()
+        with _plan_lock:
+            plan = _plan_cache.get(job_hash)
+            if plan is not None:
+                _plan_cache.move_to_end(job_hash)
+                return plan
+
+        plan = cls(job, job_hash)
+        with _plan_lock:
+            _plan_cache[job_hash] = plan
+            while len(_plan_cache) > PLAN_CACHE_SIZE:
+                _plan_cache.popitem(last=False)
+        return plan
@@ -0,0 +1,91 @@
+import time
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Tuple
+import logging
+
+from src.data_processing.hire3x_models import CandidateMatch
+
+# Configure logging
+logger = logging.getLogger("hire3x.result_cache")
+
+
+class MatchResultCache:
+    def __init__(self, max_entries: int = 512, ttl_seconds: float = 300.0):
+        """
+        Initialize a cache of ranked match results.
+
+        Entries expire after ``ttl_seconds`` and the least recently used entry is
+        evicted once ``max_entries`` is reached. Each entry records the data
+        version of the vector database it was computed against, so any add,
+        update or delete of a candidate makes older entries stale.
+
+        Args:
+            max_entries: Maximum number of cached result lists
+            ttl_seconds: Time-to-live of a cached result list in seconds
+        """
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Tuple, Tuple[float, int, List[CandidateMatch]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Tuple, data_version: int) -> Optional[List[CandidateMatch]]:
+        """
+        Look up cached matches.
+
+        Args:
+            key: Cache key describing the job, result size, filters and weights
+            data_version: Current data version of the vector database
+
+        Returns:
+            The cached matches, or None if missing, expired or stale
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                stored_at, version, matches = entry
+                if version == data_version and time.monotonic() - stored_at < self.ttl_seconds:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return list(matches)
+                del self._entries[key]
+
+            self.misses += 1
+            return None
+
+    def put(self, key: Tuple, data_version: int, matches: List[CandidateMatch]) -> None:
+        """
+        Store matches for a key.
+
+        Args:
+            key: Cache key describing the job, result size, filters and weights
+            data_version: Data version of the vector database the matches were computed against
+            matches: The ranked matches
+        """
+        with self._lock:
+            self._entries[key] = (time.monotonic(), data_version, list(matches))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Get hit/miss counters and the number of cached entries.
+
+        Returns:
+            Dictionary of cache statistics
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": len(self._entries)
+            }
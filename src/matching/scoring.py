@@ -0,0 +1,361 @@
+from itertools import chain
+from typing import List, Dict, Any, Optional, Set, Tuple, Callable
+import logging
+import numpy as np
+
+from src.data_processing.hire3x_models import CandidateMatch
+from src.matching.query_plan import JobQueryPlan
+from src.database.skill_index import SkillIndex, normalize_skill
+
+# Configure logging
+logger = logging.getLogger("hire3x.scoring")
+
+
+def calculate_role_match(candidate_role: str, job_title: str, job_role_keywords: Set[str]) -> float:
+    """Calculate how well the candidate's role matches the job title."""
+    if not candidate_role or not job_title:
+        return 0.0
+
+    candidate_role_lower = candidate_role.lower()
+    job_title_lower = job_title.lower()
+
+    # Exact match
+    if candidate_role_lower == job_title_lower:
+        return 1.0
+
+    # Partial match based on keywords
+    candidate_keywords = set()
+    for keyword in job_role_keywords:
+        if keyword in candidate_role_lower:
+            candidate_keywords.add(keyword)
+
+    if not job_role_keywords:
+        return 0.5  # Default if no role keywords found
+
+    return len(candidate_keywords) / len(job_role_keywords)
+
+
+def _float_column(values: List[Any]) -> np.ndarray:
+    """Convert values to a float64 array; values that are not numbers become NaN."""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        column = np.empty(len(values), dtype=np.float64)
+        for i, value in enumerate(values):
+            try:
+                column[i] = float(value)
+            except (TypeError, ValueError):
+                column[i] = np.nan
+        return column
+
+
+def _match_tokens(
+    values: List[Optional[str]],
+    position_of: Callable[[str], int]
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split comma-joined metadata strings and look up each distinct token once.
+
+    Args:
+        values: Comma-joined strings, one per row (None or "" for none)
+        position_of: Index of a token among the wanted values, or -1
+
+    Returns:
+        Tuple of (row of each matching token, its wanted index, number of tokens per row)
+    """
+    lists = [value.split(",") if value else [] for value in values]
+    lengths = np.fromiter(map(len, lists), dtype=np.int64, count=len(lists))
+    tokens = list(chain.from_iterable(lists))
+    lookup = {token: position_of(token) for token in dict.fromkeys(tokens)}
+    positions = np.fromiter(map(lookup.__getitem__, tokens), dtype=np.int64, count=len(tokens))
+    owners = np.repeat(np.arange(len(lists)), lengths)
+    found = positions >= 0
+    return owners[found], positions[found], lengths
+
+
+def _count_distinct(owners: np.ndarray, positions: np.ndarray, n_rows: int, n_wanted: int) -> np.ndarray:
+    """Per row, the number of distinct wanted values among its matching tokens."""
+    pairs = np.unique(owners * n_wanted + positions)
+    return np.bincount(pairs // n_wanted, minlength=n_rows).astype(np.float64)
+
+
+class CandidateScoringEngine:
+    def __init__(self, plan: JobQueryPlan, skill_index: Optional[SkillIndex] = None):
+        """
+        Initialize a scoring engine for one job description.
+
+        The engine turns a list of raw search hits into columnar NumPy arrays,
+        one read of the metadata per field, and computes every ranking factor
+        and the weighted overall score as array operations. Required-skill
+        coverage comes from the skill index bitmaps for indexed candidates, and
+        role match is computed once per distinct role.
+
+        Args:
+            plan: The precomputed query plan of the job being matched
+            skill_index: Skill index of the vector database (optional)
+        """
+        self.plan = plan
+        self.job = plan.job
+        self.skill_index = skill_index
+        self.required_canonical = set(plan.required_skills_canonical)
+
+    def rank(self, hits: List[Dict[str, Any]], top_k: Optional[int] = None) -> List[CandidateMatch]:
+        """
+        Score and rank raw search hits.
+
+        Args:
+            hits: Formatted results from VectorDatabase.search_candidates
+            top_k: Number of top matches to return (all if None)
+
+        Returns:
+            Candidate matches sorted by overall score (descending)
+        """
+        usable = []
+        for hit in hits:
+            if isinstance(hit.get("metadata"), dict) and "id" in hit and "score" in hit:
+                usable.append(hit)
+            else:
+                print(f"Error processing candidate {hit.get('id', 'unknown')}: missing id, score or metadata")
+        if not usable:
+            return []
+
+        columns = self._extract_columns(usable)
+        valid = columns.pop("valid")
+        if not valid.all():
+            for i in np.flatnonzero(~valid).tolist():
+                print(f"Error processing candidate {usable[i]['id']}: numeric metadata field is not a number")
+            usable = [hit for hit, ok in zip(usable, valid.tolist()) if ok]
+            columns = {name: values[valid] for name, values in columns.items()}
+            if not usable:
+                return []
+
+        factors = self._compute_factors(columns)
+
+        # Stable sort keeps the search order among equal scores
+        order = np.argsort(-factors["overall"], kind="stable")
+        if top_k is not None:
+            order = order[:top_k]
+
+        factor_lists = {name: values.tolist() for name, values in factors.items()}
+        years = columns["years"].tolist()
+        skill_indexed = columns["skill_indexed"].tolist()
+        return [
+            self._build_match(
+                usable[i], years[i], skill_indexed[i], {name: values[i] for name, values in factor_lists.items()}
+            )
+            for i in order.tolist()
+        ]
+
+    def _extract_columns(self, hits: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """
+        Gather the metadata of all hits into one array per value the factors need.
+
+        Values are read out of the metadata dictionaries once per field; skill
+        coverage, skill proficiency and assessment relevance are then computed on
+        flat token arrays, and role match once per distinct role.
+
+        Returns:
+            Dictionary of columns, plus a "valid" mask of rows whose numeric fields are numbers
+        """
+        n = len(hits)
+        metadatas = [hit["metadata"] for hit in hits]
+
+        similarity = 1.0 - _float_column([hit["score"] if hit["score"] is not None else 0.0 for hit in hits])
+        years = _float_column([metadata.get("years_of_experience", 0) for metadata in metadatas])
+        profile_completion = _float_column([metadata.get("hire3x_profile_completion", 0) for metadata in metadatas]) / 100
+        activity_score = _float_column([metadata.get("hire3x_activity_score", 0) for metadata in metadatas]) / 100
+
+        # Assessment metrics count as 0 when missing or empty
+        raw_score = [metadata.get("avg_assessment_score", 0) for metadata in metadatas]
+        raw_rate = [metadata.get("avg_completion_rate", 0) for metadata in metadatas]
+        raw_accuracy = [metadata.get("avg_accuracy", 0) for metadata in metadatas]
+        avg_assessment_score = _float_column([value or 0 for value in raw_score])
+        avg_completion_rate = _float_column([value or 0 for value in raw_rate])
+        avg_accuracy = _float_column([value or 0 for value in raw_accuracy])
+
+        valid = ~(
+            np.isnan(similarity) | np.isnan(years) | np.isnan(profile_completion) | np.isnan(activity_score) |
+            np.isnan(avg_assessment_score) | np.isnan(avg_completion_rate) | np.isnan(avg_accuracy)
+        )
+
+        # Role match depends only on the role string
+        roles = [metadata.get("current_role", "") for metadata in metadatas]
+        role_scores = {
+            role: calculate_role_match(role, self.job.title, self.plan.role_keywords) for role in dict.fromkeys(roles)
+        }
+
+        return {
+            "valid": valid,
+            "similarity": similarity,
+            "years": years,
+            "role_match": np.array([role_scores[role] for role in roles], dtype=np.float64),
+            "avg_assessment_score": avg_assessment_score,
+            "has_assessment_score": np.fromiter(map(bool, raw_score), dtype=bool, count=n).astype(np.float64),
+            "avg_completion_rate": avg_completion_rate,
+            "has_completion_rate": np.fromiter(map(bool, raw_rate), dtype=bool, count=n).astype(np.float64),
+            "avg_accuracy": avg_accuracy,
+            "relevance": self._assessment_relevance(metadatas),
+            "profile_completion": profile_completion,
+            "activity_score": activity_score,
+            "skill_proficiency": self._skill_proficiency(metadatas),
+            **self._skill_coverage(hits)
+        }
+
+    def _skill_coverage(self, hits: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+        """Count the required skills each hit covers, from the skill bitmaps where the candidate is indexed."""
+        n = len(hits)
+        required = self.plan.required_skills_canonical
+        matching_count = np.zeros(n, dtype=np.float64)
+        skill_indexed = np.zeros(n, dtype=bool)
+        if not required:
+            return {"matching_count": matching_count, "skill_indexed": skill_indexed}
+
+        if self.skill_index is not None:
+            skill_indexed = np.fromiter((hit["id"] in self.skill_index for hit in hits), dtype=bool, count=n)
+            indexed = np.flatnonzero(skill_indexed)
+            if len(indexed):
+                matching_count[indexed] = self.skill_index.membership(
+                    required, [hits[i]["id"] for i in indexed.tolist()]
+                ).sum(axis=0)
+
+        # Candidates missing from the index: normalize each distinct skill name once
+        others = np.flatnonzero(~skill_indexed)
+        if len(others):
+            wanted = {skill: i for i, skill in enumerate(required)}
+            owners, positions, _ = _match_tokens(
+                [hits[i]["metadata"].get("skills", "") for i in others.tolist()],
+                lambda skill: wanted.get(normalize_skill(skill), -1)
+            )
+            matching_count[others] = _count_distinct(owners, positions, len(others), len(wanted))
+        return {"matching_count": matching_count, "skill_indexed": skill_indexed}
+
+    def _skill_proficiency(self, metadatas: List[Dict[str, Any]]) -> np.ndarray:
+        """Share of each candidate's top skills that are required skills (exact names)."""
+        n = len(metadatas)
+        proficiency = np.zeros(n, dtype=np.float64)
+        if not self.plan.required_skills:
+            return proficiency
+
+        wanted = {skill: i for i, skill in enumerate(self.plan.required_skills)}
+        owners, positions, top_counts = _match_tokens(
+            [metadata.get("top_skills", "") for metadata in metadatas],
+            lambda skill: wanted.get(skill, -1)
+        )
+        overlap = _count_distinct(owners, positions, n, len(wanted))
+        scored = overlap > 0
+        proficiency[scored] = overlap[scored] / top_counts[scored]
+        return proficiency
+
+    def _assessment_relevance(self, metadatas: List[Dict[str, Any]]) -> np.ndarray:
+        """1.0 for candidates with an assessment whose name contains a required assessment, else 0.0."""
+        n = len(metadatas)
+        relevance = np.zeros(n, dtype=bool)
+        # Names are split on commas, so a requirement containing one can never match
+        required = [name for name in self.plan.required_assessments_lower if "," not in name]
+        if not required:
+            return relevance.astype(np.float64)
+
+        names = [metadata.get("assessment_names") for metadata in metadatas]
+        has_names = np.fromiter((name is not None for name in names), dtype=bool, count=n)
+        if has_names.any():
+            # Searching the joined names finds the same matches as searching each name
+            joined = np.char.lower(np.array([name or "" for name in names], dtype=str))
+            for requirement in required:
+                relevance |= np.char.find(joined, requirement) >= 0
+            relevance &= has_names
+        return relevance.astype(np.float64)
+
+    def _matching_skills(self, hit: Dict[str, Any], skill_indexed: bool) -> List[str]:
+        """The candidate's own names for the skills that match the job."""
+        if skill_indexed:
+            return self.skill_index.matching_skills(hit["id"], self.required_canonical)
+        skills_str = hit["metadata"].get("skills", "")
+        skills = skills_str.split(",") if skills_str else []
+        return [skill for skill in skills if normalize_skill(skill) in self.required_canonical]
+
+    def _compute_factors(self, columns: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Compute the ranking factors and overall score for all rows at once."""
+        if self.plan.required_skills_canonical:
+            skill_match = columns["matching_count"] / len(self.plan.required_skills_canonical)
+        else:
+            skill_match = np.full_like(columns["matching_count"], 0.5)  # Default if no required skills specified
+
+        experience_match = np.minimum(columns["years"] / max(self.plan.required_years, 1), 1.5)  # Cap at 1.5
+
+        assessment_score = np.where(
+            columns["has_assessment_score"] > 0,
+            np.minimum(columns["avg_assessment_score"] / 100, 1.0),
+            0.0
+        )
+        # Lower completion rate is better, so invert: 1 - (rate capped at 1.0)
+        completion_efficiency = np.where(
+            columns["has_completion_rate"] > 0,
+            1.0 - np.minimum(columns["avg_completion_rate"], 1.0),
+            0.0
+        )
+        assessment_bonus = (
+            assessment_score * 0.4 +
+            completion_efficiency * 0.2 +
+            columns["avg_accuracy"] * 0.3 +
+            columns["relevance"] * 0.1
+        )
+
+        factors = {
+            "similarity": columns["similarity"],
+            "skill_match": skill_match,
+            "role_match": columns["role_match"],
+            "experience_match": experience_match,
+            "skill_proficiency": columns["skill_proficiency"],
+            "assessment_performance": assessment_bonus,
+            "profile_completion": columns["profile_completion"],
+            "activity_score": columns["activity_score"]
+        }
+
+        # Weighted sum in the same order as the factors are listed
+        overall = np.zeros_like(columns["similarity"])
+        for factor, weight in zip(factors.values(), self.plan.weight_vector):
+            overall = overall + factor * weight
+
+        # Normalize to 0-1 range
+        factors["overall"] = np.clip(overall, 0.0, 1.0)
+        return factors
+
+    def _build_match(
+        self,
+        hit: Dict[str, Any],
+        years: float,
+        skill_indexed: bool,
+        factors: Dict[str, float]
+    ) -> CandidateMatch:
+        """Create the CandidateMatch for one scored hit."""
+        metadata = hit["metadata"]
+        skills_str = metadata.get("skills", "")
+        skills = skills_str.split(",") if skills_str else []
+
+        return CandidateMatch(
+            candidate_id=hit["id"],
+            candidate_name=metadata.get("name", "Unknown"),
+            headline=metadata.get("headline", ""),
+            current_role=metadata.get("current_role", ""),
+            similarity_score=factors["similarity"],
+            profile_picture=None,  # Not stored in metadata
+            years_of_experience=years,
+            location=metadata.get("location", ""),
+            skills={skill: 0.8 for skill in skills},
+            matching_skills=self._matching_skills(hit, skill_indexed),
+            assessment_bonus=factors["assessment_performance"],
+            overall_score=factors["overall"],
+            ranking_factors={
+                "similarity": factors["similarity"],
+                "skill_match": factors["skill_match"],
+                "role_match": factors["role_match"],
+                "experience_match": factors["experience_match"],
+                "skill_proficiency": factors["skill_proficiency"],
+                "assessment_performance": factors["assessment_performance"],
+                "profile_completion": factors["profile_completion"],
+                "activity_score": factors["activity_score"]
+            },
+            github_url=metadata.get("github_url", None),
+            linkedin_url=metadata.get("linkedin_url", None),
+            portfolio_url=metadata.get("portfolio_url", None)
+        )
@@ -0,0 +1,541 @@
+import os
+import ssl
+import time
+import uuid
+import sqlite3
+import smtplib
+import threading
+from email.message import EmailMessage
+from typing import List, Dict, Any, Optional
+import logging
+
+from src.data_processing.hire3x_models import EmailTemplate
+
+# Configure logging
+logger = logging.getLogger("hire3x.outreach")
+
+# Message states
+QUEUED = "queued"
+SENDING = "sending"
+SENT = "sent"
+FAILED = "failed"
+
+# Retry delays grow from RETRY_BASE_DELAY seconds, doubling per attempt, up to RETRY_MAX_DELAY
+RETRY_BASE_DELAY = 2.0
+RETRY_MAX_DELAY = 300.0
+
+# Idle SMTP sessions are closed before servers time them out
+SESSION_IDLE_TIMEOUT = 60.0
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    """Read a boolean environment variable."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    return value.lower() in ("1", "true", "yes")
+
+
+class SmtpSettings:
+    def __init__(
+        self,
+        host: str = "smtp.gmail.com",
+        port: int = 587,
+        starttls: bool = True,
+        use_ssl: bool = False,
+        username: Optional[str] = None,
+        password: Optional[str] = None,
+        from_address: Optional[str] = None,
+        timeout: float = 30.0
+    ):
+        """
+        Initialize the connection settings of the outbound SMTP server.
+
+        Args:
+            host: SMTP server host
+            port: SMTP server port
+            starttls: Upgrade the connection with STARTTLS before logging in
+            use_ssl: Connect with implicit TLS (SMTPS) instead
+            username: Login user (no login if omitted)
+            password: Login password
+            from_address: Sender address (defaults to the username)
+            timeout: Socket timeout in seconds
+        """
+        self.host = host
+        self.port = port
+        self.starttls = starttls
+        self.use_ssl = use_ssl
+        self.username = username
+        self.password = password
+        self.from_address = from_address or username
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls) -> "SmtpSettings":
+        """
+        Read the settings from HIRE3X_SMTP_* environment variables.
+
+        HIRE3X_SMTP_HOST, HIRE3X_SMTP_PORT, HIRE3X_SMTP_STARTTLS, HIRE3X_SMTP_SSL,
+        HIRE3X_SMTP_USERNAME, HIRE3X_SMTP_PASSWORD, HIRE3X_SMTP_FROM and
+        HIRE3X_SMTP_TIMEOUT. For a local stand-in such as aiosmtpd, set the host
+        and port and HIRE3X_SMTP_STARTTLS=0.
+
+        Returns:
+            The settings
+        """
+        return cls(
+            host=os.environ.get("HIRE3X_SMTP_HOST", "smtp.gmail.com"),
+            port=int(os.environ.get("HIRE3X_SMTP_PORT", 587)),
+            starttls=_env_flag("HIRE3X_SMTP_STARTTLS", True),
+            use_ssl=_env_flag("HIRE3X_SMTP_SSL", False),
+            username=os.environ.get("HIRE3X_SMTP_USERNAME") or None,
+            password=os.environ.get("HIRE3X_SMTP_PASSWORD") or None,
+            from_address=os.environ.get("HIRE3X_SMTP_FROM") or None,
+            timeout=float(os.environ.get("HIRE3X_SMTP_TIMEOUT", 30))
+        )
+
+    def with_credentials(self, username: str, password: str) -> "SmtpSettings":
+        """
+        Copy the settings with another login, sending from that account.
+
+        Args:
+            username: Login user
+            password: Login password
+
+        Returns:
+            The new settings
+        """
+        return SmtpSettings(
+            host=self.host,
+            port=self.port,
+            starttls=self.starttls,
+            use_ssl=self.use_ssl,
+            username=username,
+            password=password,
+            from_address=username,
+            timeout=self.timeout
+        )
+
+
+def open_smtp_session(settings: SmtpSettings) -> smtplib.SMTP:
+    """
+    Connect to the SMTP server, upgrade to TLS and log in as configured.
+
+    Args:
+        settings: SMTP connection settings
+
+    Returns:
+        The connected session
+    """
+    if settings.use_ssl:
+        session = smtplib.SMTP_SSL(
+            settings.host, settings.port, timeout=settings.timeout, context=ssl.create_default_context()
+        )
+    else:
+        session = smtplib.SMTP(settings.host, settings.port, timeout=settings.timeout)
+    try:
+        session.ehlo()
+        if settings.starttls and not settings.use_ssl:
+            session.starttls(context=ssl.create_default_context())
+            session.ehlo()
+        if settings.username:
+            session.login(settings.username, settings.password or "")
+    except Exception:
+        session.close()
+        raise
+    return session
+
+
+def build_message(email: EmailTemplate, from_address: Optional[str]) -> EmailMessage:
+    """
+    Build the MIME message of an email template.
+
+    Args:
+        email: The email to send
+        from_address: Sender address
+
+    Returns:
+        The message
+    """
+    message = EmailMessage()
+    if from_address:
+        message["From"] = from_address
+    message["To"] = email.to_email
+    message["Subject"] = email.subject
+    message.set_content(email.body)
+    return message
+
+
+def is_permanent_failure(error: Exception) -> bool:
+    """
+    Whether a send error will not go away on retry (the server rejected the message).
+
+    Args:
+        error: The error raised while sending
+
+    Returns:
+        True for messages that cannot be built and for 5xx rejections other than authentication failures
+    """
+    if isinstance(error, ValueError):
+        return True
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPAuthenticationError):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return error.smtp_code >= 500
+    return False
+
+
+class RateLimiter:
+    def __init__(self, rate: float, burst: int = 1):
+        """
+        Initialize a token bucket shared by the sender threads.
+
+        Args:
+            rate: Messages per second (unlimited if 0)
+            burst: Messages that may be sent at once after an idle period
+        """
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until a message may be sent."""
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+
+class MailQueue:
+    def __init__(
+        self,
+        settings: SmtpSettings,
+        db_path: str = "./data/outreach.sqlite",
+        connections: int = 4,
+        rate: float = 20.0,
+        max_attempts: int = 5,
+        messages_per_connection: int = 100
+    ):
+        """
+        Initialize a durable outbound mail queue sent over pooled SMTP sessions.
+
+        Messages are stored in an SQLite table before they are accepted, so a
+        restart loses nothing: messages that were being sent are queued again
+        (delivery is at least once). ``connections`` sender threads each keep
+        one SMTP session open and reuse it for consecutive messages, so the
+        TCP, TLS and login handshakes are paid once per session rather than
+        once per message. A shared token bucket caps the overall send rate.
+        Transient failures are retried with exponential backoff; messages the
+        server rejects outright fail immediately.
+
+        Args:
+            settings: SMTP server and account
+            db_path: Path to the SQLite queue database
+            connections: Number of sender threads, each with its own SMTP session
+            rate: Messages per second across all sessions (unlimited if 0)
+            max_attempts: Attempts before a message is marked failed
+            messages_per_connection: Messages sent on a session before it is reopened
+        """
+        directory = os.path.dirname(db_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        self.settings = settings
+        self.db_path = db_path
+        self.connections = connections
+        self.max_attempts = max_attempts
+        self.messages_per_connection = messages_per_connection
+        self.rate_limiter = RateLimiter(rate, burst=connections)
+
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._stopping = False
+        self._threads: List[threading.Thread] = []
+
+        logger.info(f"Opening mail queue at {db_path}")
+        try:
+            self._conn = sqlite3.connect(db_path, check_same_thread=False, timeout=30)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS messages (
+                    id TEXT PRIMARY KEY,
+                    batch_id TEXT NOT NULL,
+                    to_email TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    next_attempt_at REAL NOT NULL,
+                    last_error TEXT,
+                    created_at REAL NOT NULL,
+                    sent_at REAL
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS messages_due ON messages (status, next_attempt_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS messages_batch ON messages (batch_id)")
+            self._conn.commit()
+        except Exception as e:
+            logger.error(f"Failed to open mail queue: {e}")
+            raise
+
+    def enqueue(self, emails: List[EmailTemplate]) -> Dict[str, Any]:
+        """
+        Durably queue a batch of emails.
+
+        Args:
+            emails: The emails to send
+
+        Returns:
+            Dictionary with the batch ID and the message IDs, in input order
+
+        Raises:
+            ValueError: If an email cannot be turned into a message, e.g. a header contains a line break
+        """
+        for index, email in enumerate(emails):
+            try:
+                build_message(email, self.settings.from_address)
+            except ValueError as e:
+                raise ValueError(f"Email {index} to {email.to_email!r} is invalid: {e}") from e
+
+        batch_id = uuid.uuid4().hex
+        now = time.time()
+        rows = [
+            (uuid.uuid4().hex, batch_id, email.to_email, email.subject, email.body, QUEUED, now, now)
+            for email in emails
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO messages (id, batch_id, to_email, subject, body, status, next_attempt_at, created_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows
+                )
+            self._wakeup.notify_all()
+        logger.info(f"Queued batch {batch_id} with {len(rows)} emails")
+        return {"batch_id": batch_id, "message_ids": [row[0] for row in rows]}
+
+    def start(self) -> None:
+        """
+        Start the sender threads, first requeueing messages interrupted by the last shutdown or crash.
+
+        Only one process should run the senders for a queue database.
+        """
+        with self._lock:
+            with self._conn:
+                cursor = self._conn.execute(
+                    "UPDATE messages SET status = ? WHERE status = ?", (QUEUED, SENDING)
+                )
+            if cursor.rowcount:
+                logger.info(f"Requeued {cursor.rowcount} interrupted emails")
+            self._stopping = False
+
+        for index in range(self.connections):
+            thread = threading.Thread(target=self._sender, name=f"hire3x-smtp-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def batch_status(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the delivery status of a batch.
+
+        Args:
+            batch_id: ID of the batch
+
+        Returns:
+            Dictionary with per-status counts and each message's state, or None if unknown
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, to_email, status, attempts, last_error, sent_at FROM messages "
+                "WHERE batch_id = ? ORDER BY rowid",
+                (batch_id,)
+            ).fetchall()
+        if not rows:
+            return None
+
+        counts = {QUEUED: 0, SENDING: 0, SENT: 0, FAILED: 0}
+        messages = []
+        for message_id, to_email, status, attempts, last_error, sent_at in rows:
+            counts[status] += 1
+            messages.append({
+                "id": message_id,
+                "to_email": to_email,
+                "status": status,
+                "attempts": attempts,
+                "last_error": last_error,
+                "sent_at": sent_at
+            })
+        return {
+            "batch_id": batch_id,
+            "total": len(rows),
+            "counts": counts,
+            "done": counts[QUEUED] == 0 and counts[SENDING] == 0,
+            "messages": messages
+        }
+
+    def message_status(self, message_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get the delivery status of one message.
+
+        Args:
+            message_id: ID of the message
+
+        Returns:
+            Dictionary with the message's state, or None if unknown
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT id, batch_id, to_email, status, attempts, last_error, created_at, sent_at "
+                "FROM messages WHERE id = ?",
+                (message_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        keys = ("id", "batch_id", "to_email", "status", "attempts", "last_error", "created_at", "sent_at")
+        return dict(zip(keys, row))
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get the number of messages in each state.
+
+        Returns:
+            Dictionary of counts per status
+        """
+        counts = {QUEUED: 0, SENDING: 0, SENT: 0, FAILED: 0}
+        with self._lock:
+            for status, count in self._conn.execute("SELECT status, COUNT(*) FROM messages GROUP BY status"):
+                counts[status] = count
+        return counts
+
+    def shutdown(self, timeout: float = 30.0) -> None:
+        """
+        Stop the sender threads after their current message and close the sessions.
+
+        Args:
+            timeout: Seconds to wait for each thread
+        """
+        with self._lock:
+            self._stopping = True
+            self._wakeup.notify_all()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _claim(self) -> Optional[tuple]:
+        """Mark the next due message as sending and return it, or None if none is due."""
+        with self._lock:
+            with self._conn:
+                row = self._conn.execute(
+                    "SELECT id, to_email, subject, body, attempts FROM messages "
+                    "WHERE status = ? AND next_attempt_at <= ? ORDER BY next_attempt_at LIMIT 1",
+                    (QUEUED, time.time())
+                ).fetchone()
+                if row is not None:
+                    self._conn.execute("UPDATE messages SET status = ? WHERE id = ?", (SENDING, row[0]))
+            return row
+
+    def _next_due_in(self) -> float:
+        """Seconds until the earliest retry is due (at most one second, to notice other writers)."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT MIN(next_attempt_at) FROM messages WHERE status = ?", (QUEUED,)
+            ).fetchone()
+        if row[0] is None:
+            return 1.0
+        return min(1.0, max(0.0, row[0] - time.time()))
+
+    def _record(self, message_id: str, attempts: int, error: Optional[Exception]) -> None:
+        """Store the outcome of a send attempt."""
+        now = time.time()
+        if error is None:
+            update = ("UPDATE messages SET status = ?, attempts = ?, last_error = NULL, sent_at = ? WHERE id = ?",
+                      (SENT, attempts, now, message_id))
+        elif attempts >= self.max_attempts or is_permanent_failure(error):
+            update = ("UPDATE messages SET status = ?, attempts = ?, last_error = ? WHERE id = ?",
+                      (FAILED, attempts, str(error), message_id))
+            logger.warning(f"Giving up on email {message_id} after {attempts} attempts: {error}")
+        else:
+            delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** (attempts - 1)))
+            update = ("UPDATE messages SET status = ?, attempts = ?, last_error = ?, next_attempt_at = ? WHERE id = ?",
+                      (QUEUED, attempts, str(error), now + delay, message_id))
+        with self._lock:
+            with self._conn:
+                self._conn.execute(*update)
+
+    def _sender(self) -> None:
+        """Body of a sender thread: send due messages over one reused SMTP session."""
+        session = None
+        sent_on_session = 0
+        last_used = 0.0
+        try:
+            while True:
+                with self._lock:
+                    if self._stopping:
+                        return
+
+                claimed = self._claim()
+                if claimed is None:
+                    if session is not None and time.monotonic() - last_used > SESSION_IDLE_TIMEOUT:
+                        session = self._close_session(session)
+                    timeout = self._next_due_in()
+                    with self._lock:
+                        if not self._stopping:
+                            self._wakeup.wait(timeout)
+                    continue
+
+                message_id, to_email, subject, body, attempts = claimed
+                error = None
+                try:
+                    message = build_message(
+                        EmailTemplate(to_email=to_email, subject=subject, body=body),
+                        self.settings.from_address
+                    )
+                    self.rate_limiter.acquire()
+                    if session is None or sent_on_session >= self.messages_per_connection:
+                        self._close_session(session)
+                        session = open_smtp_session(self.settings)
+                        sent_on_session = 0
+                    session.send_message(message)
+                    sent_on_session += 1
+                except ValueError as e:
+                    # The message itself is malformed; nothing was sent and the session is untouched
+                    error = e
+                except smtplib.SMTPResponseException as e:
+                    # The server refused this message; the session itself is still usable
+                    error = e
+                    try:
+                        session.rset()
+                    except Exception:
+                        session = self._close_session(session)
+                except Exception as e:
+                    # Connection errors leave the session unusable; open a fresh one next time
+                    error = e
+                    session = self._close_session(session)
+                last_used = time.monotonic()
+                self._record(message_id, attempts + 1, error)
+        finally:
+            self._close_session(session)
+
+    def _close_session(self, session: Optional[smtplib.SMTP]) -> None:
+        """Politely close an SMTP session, ignoring errors from a dead connection."""
+        if session is None:
+            return None
+        try:
+            session.quit()
+        except Exception:
+            session.close()
+        return None
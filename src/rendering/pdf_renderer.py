@@ -0,0 +1,408 @@
+import os
+import io
+import json
+import uuid
+import zipfile
+import hashlib
+import threading
+from html import escape
+from string import Template
+from typing import Dict, Any, Iterable, Optional
+import logging
+
+# Configure logging
+logger = logging.getLogger("hire3x.rendering")
+
+# Options passed to wkhtmltopdf for every render
+PDF_OPTIONS = {"encoding": "UTF-8", "quiet": ""}
+
+# Templates are compiled once at import; each renders one part of the candidate profile
+PAGE_TEMPLATE = Template("""<html>
+<head>
+    <meta charset="utf-8">
+    <style>
+        body { font-family: Arial, sans-serif; margin: 20px; }
+        h1 { color: #333366; }
+        h2 { color: #336699; border-bottom: 1px solid #ccc; padding-bottom: 5px; margin-top: 20px; }
+        .summary { background-color: #f5f5f5; padding: 10px; border-radius: 5px; margin: 10px 0; }
+        .skills { display: flex; flex-wrap: wrap; margin: 10px 0; }
+        .skill { background-color: #e1e1e1; padding: 5px 10px; margin: 5px; border-radius: 15px; }
+        .assessment { background-color: #e1f5fe; padding: 10px; margin: 10px 0; border-radius: 5px; }
+        .experience { margin-bottom: 15px; }
+        .contact { background-color: #f9f9f9; padding: 10px; border-radius: 5px; }
+    </style>
+</head>
+<body>
+    <h1>$name</h1>
+    <div class="contact">
+        <p><strong>Email:</strong> $email</p>
+        <p><strong>Phone:</strong> $phone</p>
+        <p><strong>Location:</strong> $location</p>
+        <p><strong>Current Role:</strong> $current_role</p>
+        <p><strong>Years of Experience:</strong> $years_of_experience</p>
+    </div>
+
+    <h2>Summary</h2>
+    <div class="summary">
+        <p>$summary</p>
+    </div>
+
+    <h2>Skills</h2>
+    <div class="skills">
+$skills
+    </div>
+
+    <h2>Experience</h2>
+$experience
+
+    <h2>Education</h2>
+$education
+
+    <h2>Hire3x Assessments</h2>
+$assessments
+</body>
+</html>
+""")
+
+SKILL_TEMPLATE = Template("""        <div class="skill">$skill ($proficiency%)</div>""")
+
+EXPERIENCE_TEMPLATE = Template("""    <div class="experience">
+        <h3>$role at $company</h3>
+        <p>$description</p>
+        <p><strong>Skills Used:</strong> $skills_used</p>
+        <p><strong>Achievements:</strong></p>
+        <ul>
+$achievements
+        </ul>
+    </div>""")
+
+ACHIEVEMENT_TEMPLATE = Template("""            <li>$achievement</li>""")
+
+EDUCATION_TEMPLATE = Template("""    <div class="education">
+        <p><strong>$degree</strong> in $field_of_study</p>
+        <p>$institution, $graduation_year</p>
+    </div>""")
+
+ASSESSMENT_TEMPLATE = Template("""    <div class="assessment">
+        <h3>$name</h3>
+        <p><strong>Score:</strong> $score/100 (${percentile}th percentile)</p>
+        <p><strong>Skills Evaluated:</strong> $skills_evaluated</p>
+        <p><strong>Completion Time:</strong> $completion_time minutes (of $allowed_time allowed)</p>
+        <p><strong>Accuracy:</strong> $accuracy%</p>
+    </div>""")
+
+# Changes whenever a template or the wkhtmltopdf options change, which
+# invalidates every cached PDF rendered with the previous version
+TEMPLATE_VERSION = hashlib.sha256(
+    json.dumps(
+        [
+            template.template for template in (
+                PAGE_TEMPLATE, SKILL_TEMPLATE, EXPERIENCE_TEMPLATE,
+                ACHIEVEMENT_TEMPLATE, EDUCATION_TEMPLATE, ASSESSMENT_TEMPLATE
+            )
+        ] + [PDF_OPTIONS]
+    ).encode()
+).hexdigest()[:12]
+
+
+def _text(value: Any) -> str:
+    """HTML-escape a profile value."""
+    return escape(str(value))
+
+
+def _join(values: Iterable[Any]) -> str:
+    """HTML-escape and comma-join a list of profile values."""
+    return escape(", ".join(str(value) for value in values))
+
+
+def render_profile_html(profile: Dict[str, Any]) -> str:
+    """
+    Render a candidate profile to HTML with the precompiled templates.
+
+    Args:
+        profile: Candidate profile dictionary
+
+    Returns:
+        The HTML document
+    """
+    skills = "\n".join(
+        SKILL_TEMPLATE.substitute(skill=_text(skill), proficiency=int(proficiency * 100))
+        for skill, proficiency in profile.get('skills', {}).items()
+    )
+
+    experience = "\n".join(
+        EXPERIENCE_TEMPLATE.substitute(
+            role=_text(exp.get('role', 'Role')),
+            company=_text(exp.get('company', 'Company')),
+            description=_text(exp.get('description', 'No description available.')),
+            skills_used=_join(exp.get('skills_used', [])),
+            achievements="\n".join(
+                ACHIEVEMENT_TEMPLATE.substitute(achievement=_text(achievement))
+                for achievement in exp.get('achievements', [])
+            )
+        )
+        for exp in profile.get('experience', [])
+    )
+
+    education = "\n".join(
+        EDUCATION_TEMPLATE.substitute(
+            degree=_text(edu.get('degree', 'Degree')),
+            field_of_study=_text(edu.get('field_of_study', 'Field')),
+            institution=_text(edu.get('institution', 'Institution')),
+            graduation_year=_text(edu.get('graduation_year', 'Year'))
+        )
+        for edu in profile.get('education', [])
+    )
+
+    assessments = "\n".join(
+        ASSESSMENT_TEMPLATE.substitute(
+            name=_text(assessment.get('name', 'Assessment')),
+            score=_text(assessment.get('score', 'N/A')),
+            percentile=_text(assessment.get('percentile', 'N/A')),
+            skills_evaluated=_join(assessment.get('skills_evaluated', [])),
+            completion_time=_text(assessment.get('completion_time', 'N/A')),
+            allowed_time=_text(assessment.get('allowed_time', 'N/A')),
+            accuracy=int(assessment.get('accuracy', 0) * 100)
+        )
+        for assessment in (profile.get('hire3x_data') or {}).get('assessments', [])
+    )
+
+    return PAGE_TEMPLATE.substitute(
+        name=_text(profile.get('name', 'Candidate Profile')),
+        email=_text(profile.get('email', 'N/A')),
+        phone=_text(profile.get('phone', 'N/A')),
+        location=_text(profile.get('location', 'N/A')),
+        current_role=_text(profile.get('current_role', 'N/A')),
+        years_of_experience=_text(profile.get('years_of_experience', 'N/A')),
+        summary=_text(profile.get('summary', 'No summary available.')),
+        skills=skills,
+        experience=experience,
+        education=education,
+        assessments=assessments
+    )
+
+
+def profile_cache_key(profile: Dict[str, Any]) -> str:
+    """
+    Content hash identifying the PDF of a profile under the current templates.
+
+    Args:
+        profile: Candidate profile dictionary
+
+    Returns:
+        Hex digest of the profile content and TEMPLATE_VERSION
+    """
+    content = json.dumps(profile, sort_keys=True, default=str)
+    return hashlib.sha256(f"{TEMPLATE_VERSION}\n{content}".encode()).hexdigest()[:32]
+
+
+class PdfRenderer:
+    def __init__(self, output_dir: str = "pdfs", wkhtmltopdf: Optional[str] = None):
+        """
+        Initialize a PDF renderer with a content-addressed output cache.
+
+        A candidate's PDF is stored as ``candidate_<id>/<key>.pdf`` where the
+        key hashes the profile content and TEMPLATE_VERSION, so an unchanged
+        profile is served from disk and an edited profile (or a template
+        change) renders a new file. Renders of the same key that arrive while
+        one is running wait for it instead of starting wkhtmltopdf again.
+        Concurrency is bounded by the caller (the API's pdf executor).
+
+        Args:
+            output_dir: Directory holding the rendered PDFs
+            wkhtmltopdf: Path of the wkhtmltopdf binary (defaults to HIRE3X_WKHTMLTOPDF or PATH)
+        """
+        self.output_dir = output_dir
+        os.makedirs(output_dir, exist_ok=True)
+        self._wkhtmltopdf = wkhtmltopdf or os.environ.get("HIRE3X_WKHTMLTOPDF")
+        self._configuration = None
+
+        self._lock = threading.Lock()
+        self._rendering: Dict[str, threading.Event] = {}
+        self.hits = 0
+        self.renders = 0
+
+    def pdf_path(self, candidate_id: str, key: str) -> str:
+        """
+        Path of a candidate's PDF for a cache key.
+
+        Args:
+            candidate_id: ID of the candidate
+            key: Cache key from profile_cache_key
+
+        Returns:
+            Path of the PDF file
+        """
+        return os.path.join(self._candidate_dir(candidate_id), f"{key}.pdf")
+
+    def cached(self, profile: Dict[str, Any], candidate_id: str) -> Optional[str]:
+        """
+        Get the already rendered PDF of a profile, without rendering.
+
+        Args:
+            profile: Candidate profile dictionary
+            candidate_id: ID of the candidate
+
+        Returns:
+            Path of the PDF, or None if the current profile has not been rendered
+        """
+        path = self.pdf_path(candidate_id, profile_cache_key(profile))
+        if os.path.exists(path):
+            self.hits += 1
+            return path
+        return None
+
+    def render(self, profile: Dict[str, Any], candidate_id: str) -> str:
+        """
+        Get the PDF of a profile, rendering it only if it is not cached. Blocks while rendering.
+
+        Args:
+            profile: Candidate profile dictionary
+            candidate_id: ID of the candidate
+
+        Returns:
+            Path of the PDF
+        """
+        key = profile_cache_key(profile)
+        path = self.pdf_path(candidate_id, key)
+
+        while True:
+            if os.path.exists(path):
+                self.hits += 1
+                return path
+            with self._lock:
+                pending = self._rendering.get(path)
+                if pending is None:
+                    done = self._rendering[path] = threading.Event()
+                    break
+            # Another thread is rendering the same content; use its result
+            pending.wait()
+
+        try:
+            os.makedirs(self._candidate_dir(candidate_id), exist_ok=True)
+            self._render_to(profile, path)
+            self.renders += 1
+            self._remove_stale(candidate_id, key)
+            return path
+        finally:
+            with self._lock:
+                del self._rendering[path]
+            done.set()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Dictionary with cache hits and wkhtmltopdf renders
+        """
+        return {"hits": self.hits, "renders": self.renders}
+
+    def _render_to(self, profile: Dict[str, Any], path: str) -> None:
+        """Run wkhtmltopdf into a temporary file and move it into place once complete."""
+        import pdfkit
+
+        if self._configuration is None:
+            self._configuration = pdfkit.configuration(wkhtmltopdf=self._wkhtmltopdf or "")
+        temp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        try:
+            pdfkit.from_string(
+                render_profile_html(profile),
+                temp_path,
+                options=PDF_OPTIONS,
+                configuration=self._configuration
+            )
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.error(f"Error rendering {path}: {e}")
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+    def _candidate_dir(self, candidate_id: str) -> str:
+        """Directory holding one candidate's PDFs, so finding stale ones lists only that candidate's files."""
+        return os.path.join(self.output_dir, f"candidate_{candidate_id}")
+
+    def _remove_stale(self, candidate_id: str, key: str) -> None:
+        """Delete the candidate's PDFs rendered from earlier profile content or templates."""
+        directory = self._candidate_dir(candidate_id)
+        current = f"{key}.pdf"
+        # Temporary files of renders still running end in .tmp and are left alone
+        for name in os.listdir(directory):
+            if name == current or not name.endswith(".pdf"):
+                continue
+            try:
+                os.remove(os.path.join(directory, name))
+            except FileNotFoundError:
+                pass
+
+
+class ZipStream:
+    def __init__(self):
+        """
+        Incrementally build a ZIP archive and hand out its bytes as they are written.
+
+        The archive is written to an in-memory buffer that is drained after
+        every file, so a streamed response never holds more than one member.
+        PDFs are already compressed, so members are stored uncompressed.
+        """
+        self._buffer = _DrainableBuffer()
+        self._zip = zipfile.ZipFile(self._buffer, "w", compression=zipfile.ZIP_STORED)
+
+    def add_file(self, path: str, arcname: str) -> bytes:
+        """
+        Add a file to the archive.
+
+        Args:
+            path: File to add
+            arcname: Name of the file inside the archive
+
+        Returns:
+            The archive bytes written since the last call
+        """
+        self._zip.write(path, arcname)
+        return self._buffer.drain()
+
+    def add_bytes(self, arcname: str, data: bytes) -> bytes:
+        """
+        Add in-memory content to the archive.
+
+        Args:
+            arcname: Name of the file inside the archive
+            data: File content
+
+        Returns:
+            The archive bytes written since the last call
+        """
+        self._zip.writestr(arcname, data)
+        return self._buffer.drain()
+
+    def close(self) -> bytes:
+        """
+        Finish the archive.
+
+        Returns:
+            The remaining archive bytes (the central directory)
+        """
+        self._zip.close()
+        return self._buffer.drain()
+
+
+class _DrainableBuffer(io.RawIOBase):
+    """Write-only, non-seekable stream whose contents are taken out with drain()."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks = []
+        return data
+
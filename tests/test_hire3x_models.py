@@ -0,0 +1,40 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from src.data_processing.hire3x_models import CandidateProfile
+
+SAMPLE_FILES = [
+    Path(__file__).resolve().parent.parent / "data" / "sample_candidates.json",
+    Path(__file__).resolve().parent.parent / "data" / "sample_candidate.json"
+]
+
+
+@pytest.mark.parametrize("path", SAMPLE_FILES, ids=lambda path: path.name)
+def test_sample_profiles_with_in_progress_courses_validate(path):
+    records = json.loads(path.read_text())
+    profiles = [CandidateProfile(**data) for data in records]
+
+    assert len(profiles) == len(records)
+    in_progress = [
+        course for profile in profiles for course in profile.hire3x_data.courses
+        if course.completion_status == "In Progress"
+    ]
+    assert in_progress
+    assert all(course.assignment_avg_score is None for course in in_progress)
+
+
+def test_in_progress_courses_show_their_status_instead_of_a_score():
+    data = json.loads(SAMPLE_FILES[0].read_text())
+    profile = next(
+        CandidateProfile(**record) for record in data
+        if any(course["assignment_avg_score"] is None for course in record["hire3x_data"]["courses"])
+    )
+    course = next(course for course in profile.hire3x_data.courses if course.assignment_avg_score is None)
+
+    text = profile.to_text()
+    sections = "\n".join(text for _, text in profile.to_sections())
+    for rendered in (text, sections):
+        assert f"{course.name} ({course.category}): {course.completion_status}" in rendered
+        assert "Score None/100" not in rendered
@@ -0,0 +1,174 @@
+import math
+import socket
+import sqlite3
+import threading
+import time
+
+import pytest
+from aiosmtpd.controller import Controller
+
+from src.data_processing.hire3x_models import EmailTemplate
+from src.outreach import mail_queue
+from src.outreach.mail_queue import MailQueue, SmtpSettings, QUEUED, SENDING, SENT, FAILED
+
+NUM_MESSAGES = 7
+MESSAGES_PER_CONNECTION = 3
+
+
+class RecordingHandler:
+    """aiosmtpd handler that remembers deliveries per connection and refuses chosen recipients."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        # Recipient -> number of 451 replies still to give
+        self.defer = {}
+        self.reject = set()
+        self.attempts = {}
+        self.delivered = []
+
+    async def handle_DATA(self, server, session, envelope):
+        recipient = envelope.rcpt_tos[0]
+        with self.lock:
+            self.attempts[recipient] = self.attempts.get(recipient, 0) + 1
+            if recipient in self.reject:
+                return "554 5.7.1 Message rejected"
+            if self.defer.get(recipient, 0) > 0:
+                self.defer[recipient] -= 1
+                return "451 4.3.0 Try again later"
+            self.delivered.append((session.peer, recipient))
+        return "250 OK"
+
+    def connections(self):
+        """Delivered recipients grouped by client connection, in delivery order."""
+        with self.lock:
+            grouped = {}
+            for peer, recipient in self.delivered:
+                grouped.setdefault(peer, []).append(recipient)
+            return list(grouped.values())
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        result = predicate()
+        if result:
+            return result
+        time.sleep(0.01)
+    raise AssertionError("Timed out waiting for the mail queue")
+
+
+@pytest.fixture
+def smtp_server():
+    handler = RecordingHandler()
+    controller = Controller(handler, hostname="127.0.0.1", port=free_port())
+    controller.start()
+    try:
+        yield handler, controller
+    finally:
+        controller.stop()
+
+
+@pytest.fixture
+def queue(smtp_server, tmp_path, monkeypatch):
+    # Keep the retry backoff short but long enough to observe the queued retry
+    monkeypatch.setattr(mail_queue, "RETRY_BASE_DELAY", 0.3)
+    _, controller = smtp_server
+    settings = SmtpSettings(
+        host=controller.hostname,
+        port=controller.port,
+        starttls=False,
+        from_address="recruiting@hire3x.com",
+        timeout=5.0
+    )
+    result = MailQueue(
+        settings,
+        db_path=str(tmp_path / "outreach.sqlite"),
+        connections=1,
+        rate=0,
+        max_attempts=3,
+        messages_per_connection=MESSAGES_PER_CONNECTION
+    )
+    yield result
+    result.shutdown(timeout=5.0)
+
+
+def emails(count, domain="example.com"):
+    return [
+        EmailTemplate(to_email=f"candidate{index}@{domain}", subject=f"Interview {index}", body="Hello")
+        for index in range(count)
+    ]
+
+
+def test_batch_is_delivered_over_reused_connections(smtp_server, queue):
+    handler, _ = smtp_server
+    batch = queue.enqueue(emails(NUM_MESSAGES))
+
+    status = queue.batch_status(batch["batch_id"])
+    assert status["counts"] == {QUEUED: NUM_MESSAGES, SENDING: 0, SENT: 0, FAILED: 0}
+    assert all(message["attempts"] == 0 for message in status["messages"])
+
+    queue.start()
+    status = wait_for(lambda: (s := queue.batch_status(batch["batch_id"]))["done"] and s)
+
+    assert status["counts"][SENT] == NUM_MESSAGES
+    assert all(message["attempts"] == 1 and message["sent_at"] for message in status["messages"])
+    assert sorted(recipient for _, recipient in handler.delivered) == sorted(e.to_email for e in emails(NUM_MESSAGES))
+    # One session per MESSAGES_PER_CONNECTION messages, then a reconnect
+    connections = handler.connections()
+    assert len(connections) == math.ceil(NUM_MESSAGES / MESSAGES_PER_CONNECTION)
+    assert [len(recipients) for recipients in connections] == [3, 3, 1]
+
+
+def test_temporary_failure_is_retried_and_rejection_fails(smtp_server, queue):
+    handler, _ = smtp_server
+    handler.defer["candidate1@example.com"] = 1
+    handler.reject.add("candidate2@example.com")
+    batch = queue.enqueue(emails(4))
+    deferred, rejected = batch["message_ids"][1], batch["message_ids"][2]
+
+    queue.start()
+    retrying = wait_for(lambda: (s := queue.message_status(deferred))["attempts"] == 1 and s)
+    assert retrying["status"] == QUEUED
+    assert retrying["last_error"].startswith("(451")
+
+    status = wait_for(lambda: (s := queue.batch_status(batch["batch_id"]))["done"] and s)
+    messages = {message["id"]: message for message in status["messages"]}
+    assert status["counts"] == {QUEUED: 0, SENDING: 0, SENT: 3, FAILED: 1}
+    assert messages[deferred]["status"] == SENT
+    assert messages[deferred]["attempts"] == 2
+    assert messages[deferred]["last_error"] is None
+    # 5xx replies are not retried
+    assert messages[rejected]["status"] == FAILED
+    assert messages[rejected]["attempts"] == 1
+    assert "554" in messages[rejected]["last_error"]
+    assert handler.attempts == {
+        "candidate0@example.com": 1,
+        "candidate1@example.com": 2,
+        "candidate2@example.com": 1,
+        "candidate3@example.com": 1
+    }
+    # Refused messages reset the session instead of dropping it
+    assert len(handler.connections()) == 1
+
+
+def test_messages_interrupted_while_sending_are_requeued_on_start(smtp_server, queue):
+    handler, _ = smtp_server
+    batch = queue.enqueue(emails(2))
+    interrupted = batch["message_ids"][0]
+    with sqlite3.connect(queue.db_path) as conn:
+        conn.execute("UPDATE messages SET status = ? WHERE id = ?", (SENDING, interrupted))
+    assert queue.message_status(interrupted)["status"] == SENDING
+
+    queue.start()
+    status = wait_for(lambda: (s := queue.batch_status(batch["batch_id"]))["done"] and s)
+
+    assert status["counts"][SENT] == 2
+    assert sorted(recipient for _, recipient in handler.delivered) == [
+        "candidate0@example.com", "candidate1@example.com"
+    ]
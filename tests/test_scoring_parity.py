@@ -0,0 +1,198 @@
+import json
+import random
+from pathlib import Path
+
+import pytest
+
+from src.data_processing.hire3x_models import CandidateProfile, JobDescription
+from src.database.skill_index import SkillIndex, normalize_skill
+from src.matching.query_plan import (
+    JobQueryPlan,
+    extract_role_keywords,
+    extract_experience_requirement,
+    get_role_specific_weights
+)
+from src.matching.scoring import CandidateScoringEngine, calculate_role_match
+
+SAMPLE_CANDIDATES = Path(__file__).resolve().parent.parent / "data" / "sample_candidates.json"
+
+NUM_HITS = 6000
+NUM_JOBS = 20
+
+JOB_TITLES = [
+    "Senior Backend Engineer", "Frontend Developer", "Data Scientist", "Machine Learning Engineer",
+    "DevOps Engineer", "Cloud Architect", "UI/UX Designer", "QA Automation Engineer",
+    "Engineering Manager", "Mobile Developer", "Database Administrator", "Junior Web Developer",
+    "Lead Data Engineer", "Security Analyst", "Product Designer"
+]
+EXPERIENCE_LEVELS = ["Entry Level", "Mid-Level", "Senior", "Expert", "Lead"]
+
+
+def baseline_rank(job, hits):
+    """
+    Rank hits with the per-hit scoring loop that CandidateScoringEngine replaced.
+
+    Returns:
+        (candidate ID, overall score, ranking factors, matching skills) tuples, best first
+    """
+    job_role_keywords = extract_role_keywords(job.title)
+    required_skills = set(job.required_skills)
+    required_years = extract_experience_requirement(job)
+    weights = get_role_specific_weights(job.title)
+
+    ranked = []
+    for match in hits:
+        metadata = match["metadata"]
+        skills_str = metadata.get("skills", "")
+        skills = skills_str.split(",") if skills_str else []
+        matching_skills = [skill for skill in skills if skill.lower() in [s.lower() for s in required_skills]]
+        skill_match_score = len(matching_skills) / len(required_skills) if required_skills else 0.5
+
+        role_match_score = calculate_role_match(metadata.get("current_role", ""), job.title, job_role_keywords)
+        experience_match_score = min(metadata.get("years_of_experience", 0) / max(required_years, 1), 1.5)
+
+        skill_proficiency_score = 0.0
+        if "top_skills" in metadata:
+            top_skills = metadata["top_skills"].split(",")
+            skill_overlap = set(top_skills).intersection(required_skills)
+            if skill_overlap:
+                skill_proficiency_score = len(skill_overlap) / len(top_skills)
+
+        avg_assessment_score = metadata.get("avg_assessment_score", 0)
+        assessment_score = min(float(avg_assessment_score) / 100, 1.0) if avg_assessment_score else 0.0
+        avg_completion_rate = metadata.get("avg_completion_rate", 0)
+        completion_efficiency = 1.0 - min(float(avg_completion_rate), 1.0) if avg_completion_rate else 0.0
+        avg_accuracy = metadata.get("avg_accuracy", 0)
+        accuracy = float(avg_accuracy) if avg_accuracy else 0.0
+
+        relevance = 0.0
+        if job.required_assessments and "assessment_names" in metadata:
+            assessment_names = metadata["assessment_names"].split(",")
+            for req_assessment in job.required_assessments:
+                if any(req_assessment.lower() in name.lower() for name in assessment_names):
+                    relevance = 1.0
+                    break
+
+        profile_completion = float(metadata.get("hire3x_profile_completion", 0)) / 100
+        activity_score = float(metadata.get("hire3x_activity_score", 0)) / 100
+        similarity_score = 1.0 - (match["score"] if match["score"] is not None else 0.0)
+        assessment_bonus = assessment_score * 0.4 + completion_efficiency * 0.2 + accuracy * 0.3 + relevance * 0.1
+
+        overall_score = (
+            similarity_score * weights["similarity"] +
+            skill_match_score * weights["skill_match"] +
+            role_match_score * weights["role_match"] +
+            experience_match_score * weights["experience"] +
+            skill_proficiency_score * weights["skill_proficiency"] +
+            assessment_bonus * weights["assessment"] +
+            profile_completion * weights["profile_completion"] +
+            activity_score * weights["activity"]
+        )
+        overall_score = min(max(overall_score, 0.0), 1.0)
+
+        ranked.append((match["id"], overall_score, {
+            "similarity": similarity_score,
+            "skill_match": skill_match_score,
+            "role_match": role_match_score,
+            "experience_match": experience_match_score,
+            "skill_proficiency": skill_proficiency_score,
+            "assessment_performance": assessment_bonus,
+            "profile_completion": profile_completion,
+            "activity_score": activity_score
+        }, matching_skills))
+
+    ranked.sort(key=lambda item: item[1], reverse=True)
+    return ranked
+
+
+@pytest.fixture(scope="module")
+def profiles():
+    return [CandidateProfile(**data) for data in json.loads(SAMPLE_CANDIDATES.read_text())]
+
+
+@pytest.fixture(scope="module")
+def hits(profiles):
+    """Search hits built from the sample profiles, with randomized distances and metrics."""
+    rng = random.Random(5)
+    metadatas = [profile.get_metadata() for profile in profiles]
+    result = []
+    for number in range(NUM_HITS):
+        metadata = dict(rng.choice(metadatas))
+        metadata["id"] = f"{metadata['id']}-{number}"
+        metadata["years_of_experience"] = round(rng.uniform(0, 20), 1)
+        metadata["hire3x_profile_completion"] = rng.randint(0, 100)
+        metadata["hire3x_activity_score"] = rng.randint(0, 100)
+        if rng.random() < 0.1:
+            # Candidates without assessments have none of the assessment fields
+            for key in ("avg_assessment_score", "avg_completion_rate", "avg_accuracy", "assessment_names"):
+                metadata.pop(key, None)
+        elif "avg_assessment_score" in metadata:
+            metadata["avg_assessment_score"] = round(rng.uniform(0, 100), 2)
+            metadata["avg_completion_rate"] = round(rng.uniform(0.2, 1.3), 3)
+            metadata["avg_accuracy"] = round(rng.uniform(0, 1), 3)
+        # Quantized distances produce ties, which must keep the search order
+        score = None if rng.random() < 0.01 else round(rng.uniform(0.1, 1.2), 2)
+        result.append({"id": metadata["id"], "score": score, "metadata": metadata, "document": ""})
+    return result
+
+
+@pytest.fixture(scope="module")
+def jobs(profiles):
+    """Job descriptions whose required skills have no synonyms, as in the baseline's exact matching."""
+    rng = random.Random(11)
+    skills = sorted({
+        skill for profile in profiles for skill in profile.skills
+        if normalize_skill(skill) == " ".join(skill.lower().split())
+    })
+    assessments = sorted({a.name for profile in profiles for a in profile.hire3x_data.assessments})
+    result = []
+    for index in range(NUM_JOBS):
+        result.append(JobDescription(
+            id=f"job-{index}",
+            title=rng.choice(JOB_TITLES),
+            company="Hire3x",
+            description="Parity check job",
+            requirements=[f"{rng.randint(1, 9)}+ years of experience"] if rng.random() < 0.5 else [],
+            responsibilities=[],
+            required_skills=rng.sample(skills, rng.randint(0, 6)),
+            required_assessments=[rng.choice(assessments).split(" Assessment")[0]] if rng.random() < 0.5 else None,
+            experience_level=rng.choice(EXPERIENCE_LEVELS),
+            employment_type="Full-time"
+        ))
+    return result
+
+
+def test_engine_matches_per_hit_baseline(hits, jobs):
+    for job in jobs:
+        expected = baseline_rank(job, hits)
+        matches = CandidateScoringEngine(JobQueryPlan(job)).rank(hits)
+
+        assert [match.candidate_id for match in matches] == [item[0] for item in expected], job.title
+        for match, (_, overall_score, ranking_factors, matching_skills) in zip(matches, expected):
+            assert match.overall_score == overall_score
+            assert match.ranking_factors == ranking_factors
+            assert match.matching_skills == matching_skills
+
+
+def test_skill_index_coverage_matches_per_hit_baseline(hits, jobs):
+    skill_index = SkillIndex()
+    # Leave every other candidate out of the index so both coverage paths are used
+    indexed = hits[::2]
+    skill_index.add([hit["id"] for hit in indexed], [hit["metadata"]["skills"].split(",") for hit in indexed])
+
+    for job in jobs:
+        expected = baseline_rank(job, hits)
+        matches = CandidateScoringEngine(JobQueryPlan(job), skill_index=skill_index).rank(hits)
+
+        assert [match.candidate_id for match in matches] == [item[0] for item in expected], job.title
+        for match, (_, overall_score, _, matching_skills) in zip(matches, expected):
+            assert match.overall_score == overall_score
+            assert match.matching_skills == matching_skills
+
+
+def test_hits_with_non_numeric_metadata_are_skipped(hits, jobs):
+    broken = [dict(hits[0], metadata=dict(hits[0]["metadata"], years_of_experience="n/a"))]
+    matches = CandidateScoringEngine(JobQueryPlan(jobs[0])).rank(broken + hits[1:50])
+
+    assert hits[0]["id"] not in [match.candidate_id for match in matches]
+    assert len(matches) == 49
@@ -0,0 +1,48 @@
+import json
+from pathlib import Path
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.api import enhanced_app
+from src.api.startup import ComponentLoader
+
+SAMPLE_CANDIDATES = Path(__file__).resolve().parent.parent / "data" / "sample_candidates.json"
+
+
+class RecordingVectorDatabase:
+    """Stands in for VectorDatabase and remembers which candidates were added."""
+
+    def __init__(self):
+        self.added = []
+
+    def add_candidates_batch(self, candidates):
+        self.added.extend(candidate.id for candidate in candidates)
+
+
+@pytest.fixture
+def client(monkeypatch):
+    loader = ComponentLoader()
+    loader.mark_ready()
+    monkeypatch.setattr(enhanced_app, "component_loader", loader)
+    monkeypatch.setattr(enhanced_app, "vector_db", RecordingVectorDatabase())
+    # No context manager, so the lifespan handler doesn't load the real components
+    return TestClient(enhanced_app.app)
+
+
+def test_streamed_upload_is_read_after_the_endpoint_returns(client):
+    candidates = json.loads(SAMPLE_CANDIDATES.read_text())[:5]
+    body = "".join(json.dumps(candidate) + "\n" for candidate in candidates)
+
+    response = client.post(
+        "/api/candidates/stream/",
+        params={"chunk_size": 2},
+        files={"file": ("candidates.ndjson", body, "application/x-ndjson")}
+    )
+
+    assert response.status_code == 200
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    assert not any("error" in line for line in lines), lines
+    assert [line["chunk"] for line in lines[:-1]] == [0, 1, 2]
+    assert lines[-1] == {"done": True, "chunks": 3, "records": 5, "added": 5, "failed": 0}
+    assert enhanced_app.vector_db.added == [candidate["id"] for candidate in candidates]